@@ -0,0 +1,238 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Ability Scheduler Module
+
+This module tracks turn-based timers for one battle: ability cooldowns,
+temporary stat buffs/debuffs and damage over time. Every timer is an entry
+in a heap keyed by turn, so advancing a turn only touches the entries that
+are actually due.
+"""
+
+import heapq
+
+from custom_exceptions import AbilityOnCooldownError
+
+# Turns a class waits before its special ability is ready again
+CLASS_ABILITY_COOLDOWNS = {
+    "Warrior": 3,
+    "Mage": 3,
+    "Rogue": 2,
+    "Cleric": 4
+}
+
+# Name every class ability is registered under
+SPECIAL_ABILITY = "special"
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+class AbilityScheduler:
+    """
+    Heap of turn-keyed expiry events for a single battle
+
+    Combatants are the usual character/enemy dictionaries; they are told
+    apart by identity, so one scheduler can serve any number of them.
+    """
+
+    def __init__(self):
+        """Create an empty scheduler"""
+        self._heap = []
+        self._sequence = 0
+        self._cooldowns = {}
+        self._ready_turns = {}
+        self._effects = {}
+        self._next_effect_id = 1
+
+    # ------------------------------------------------------------------
+    # Cooldowns
+    # ------------------------------------------------------------------
+
+    def register_ability(self, combatant, ability, cooldown):
+        """Register an ability and the number of turns it needs to recharge"""
+        self._cooldowns[(id(combatant), ability)] = cooldown
+
+    def is_ready(self, combatant, ability, turn):
+        """
+        Check whether an ability can be used on the given turn
+
+        Returns: True if ready, False if still cooling down
+        """
+        return self._ready_turns.get((id(combatant), ability), 0) <= turn
+
+    def get_ready_turn(self, combatant, ability):
+        """
+        Get the first turn an ability can be used again
+
+        Returns: Integer turn (0 if it has never been used)
+        """
+        return self._ready_turns.get((id(combatant), ability), 0)
+
+    def trigger(self, combatant, ability, turn):
+        """
+        Use an ability and start its cooldown
+
+        Raises: AbilityOnCooldownError if the ability is not ready yet
+        """
+        key = (id(combatant), ability)
+        ready_turn = self._ready_turns.get(key, 0)
+        if ready_turn > turn:
+            raise AbilityOnCooldownError(
+                f"Ability '{ability}' is on cooldown until turn {ready_turn}."
+            )
+        cooldown = self._cooldowns.get(key, 0)
+        if cooldown > 0:
+            self._ready_turns[key] = turn + cooldown
+            self._push(turn + cooldown, "ready", key)
+
+    # ------------------------------------------------------------------
+    # Status effects
+    # ------------------------------------------------------------------
+
+    def add_stat_effect(self, target, name, stat, amount, duration, turn):
+        """
+        Apply a temporary buff (positive amount) or debuff (negative amount)
+
+        The stat changes immediately and is restored after duration turns.
+
+        Returns: Effect ID
+        """
+        target[stat] = target.get(stat, 0) + amount
+        effect_id = self._add_effect(target, name, "stat", stat, amount, turn + duration)
+        self._push(turn + duration, "expire", effect_id)
+        return effect_id
+
+    def add_damage_over_time(self, target, name, damage, duration, turn):
+        """
+        Deal damage at the start of each of the next duration turns
+
+        Returns: Effect ID
+        """
+        effect_id = self._add_effect(target, name, "dot", "health", damage, turn + duration)
+        self._push(turn + 1, "tick", effect_id)
+        return effect_id
+
+    def remove_effect(self, effect_id):
+        """
+        End an effect early (a stat effect's change is reverted)
+
+        Returns: True if the effect was active
+        """
+        effect = self._effects.pop(effect_id, None)
+        if effect is None:
+            return False
+        if effect["kind"] == "stat":
+            target = effect["target"]
+            target[effect["stat"]] = target.get(effect["stat"], 0) - effect["amount"]
+        return True
+
+    def get_active_effects(self, target):
+        """
+        Get the effects currently on a combatant
+
+        Returns: List of effect dictionaries (name, kind, stat, amount, expires)
+        """
+        active = []
+        for effect in self._effects.values():
+            if effect["target"] is target:
+                active.append(effect)
+        return active
+
+    # ------------------------------------------------------------------
+    # Turn processing
+    # ------------------------------------------------------------------
+
+    def advance(self, turn):
+        """
+        Process every timer due on or before the given turn
+
+        Returns: List of (kind, effect_dict, amount) for ticks and expiries,
+                 in the order they happened
+        """
+        results = []
+        heap = self._heap
+        while heap and heap[0][0] <= turn:
+            due_turn, _, kind, key = heapq.heappop(heap)
+
+            if kind == "ready":
+                if self._ready_turns.get(key) == due_turn:
+                    del self._ready_turns[key]
+                continue
+
+            effect = self._effects.get(key)
+            if effect is None:
+                # Removed early; the heap entry is just left behind
+                continue
+
+            if kind == "tick":
+                target = effect["target"]
+                health = target.get("health", 0) - effect["amount"]
+                target["health"] = health if health > 0 else 0
+                results.append(("tick", effect, effect["amount"]))
+                if due_turn < effect["expires"]:
+                    self._push(due_turn + 1, "tick", key)
+                else:
+                    del self._effects[key]
+                    results.append(("expire", effect, 0))
+            elif kind == "expire":
+                self.remove_effect(key)
+                results.append(("expire", effect, effect["amount"]))
+        return results
+
+    def pending_count(self):
+        """Number of timers still waiting in the heap"""
+        return len(self._heap)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _push(self, turn, kind, key):
+        """Add a timer to the heap (sequence number keeps ordering stable)"""
+        self._sequence += 1
+        heapq.heappush(self._heap, (turn, self._sequence, kind, key))
+
+    def _add_effect(self, target, name, kind, stat, amount, expires):
+        """Store a new active effect and return its ID"""
+        effect_id = self._next_effect_id
+        self._next_effect_id += 1
+        self._effects[effect_id] = {
+            "effect_id": effect_id,
+            "name": name,
+            "kind": kind,
+            "target": target,
+            "stat": stat,
+            "amount": amount,
+            "expires": expires
+        }
+        return effect_id
+
+# ============================================================================
+# CLASS ABILITIES
+# ============================================================================
+
+def register_class_abilities(scheduler, character):
+    """
+    Register a character's class special ability with a scheduler
+
+    Returns: Cooldown in turns (0 for classes without a special)
+    """
+    cooldown = CLASS_ABILITY_COOLDOWNS.get(character.get("class", ""), 0)
+    scheduler.register_ability(character, SPECIAL_ABILITY, cooldown)
+    return cooldown
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== ABILITY SCHEDULER TEST ===")
+
+    # hero = {'name': 'Hero', 'class': 'Warrior', 'health': 100, 'strength': 10}
+    # scheduler = AbilityScheduler()
+    # register_class_abilities(scheduler, hero)
+    # scheduler.trigger(hero, SPECIAL_ABILITY, 1)
+    # print(scheduler.is_ready(hero, SPECIAL_ABILITY, 2))   # False
+    # scheduler.add_damage_over_time(hero, "poison", 5, 3, 1)
+    # for turn in range(2, 6):
+    #     print(turn, scheduler.advance(turn), hero['health'])
@@ -0,0 +1,237 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Simulator Module
+
+This module runs large numbers of headless battles for balance tuning.
+Battles are split into seeded chunks and fanned out over a process pool,
+and the results are aggregated into win rates, average turns and health
+remaining for every class/level/enemy matchup.
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import character_manager
+import combat_system
+
+# Enemy type meaning "whatever get_random_enemy_for_level picks"
+AUTO_ENEMY = "auto"
+
+# Action policies available to simulations, by name (names pickle cleanly)
+SIMULATION_POLICIES = {
+    "attack": combat_system.basic_attack_policy,
+    "special_first": combat_system.special_first_policy
+}
+
+# Battles per task sent to a worker process
+DEFAULT_CHUNK_SIZE = 2000
+
+# ============================================================================
+# MATCHUP SETUP
+# ============================================================================
+
+def build_character_for_level(character_class, level, name="Sim"):
+    """
+    Create a character and level it up the same way gain_experience does
+
+    Returns: Character dictionary at the requested level
+    Raises: InvalidCharacterClassError if class is not valid
+    """
+    character = character_manager.create_character(name, character_class)
+    while character["level"] < level:
+        character_manager.gain_experience(character, character["level"] * 100)
+    return character
+
+def build_matchups(character_classes, levels, enemy_types=(AUTO_ENEMY,)):
+    """
+    Build every combination of class, level and enemy type
+
+    Returns: List of (character_class, level, enemy_type) tuples
+    """
+    matchups = []
+    for character_class in character_classes:
+        for level in levels:
+            for enemy_type in enemy_types:
+                matchups.append((character_class, level, enemy_type))
+    return matchups
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def run_battle_chunk(task):
+    """
+    Worker entry point: fight one chunk of battles for a single matchup
+
+    Args:
+        task: Tuple (character_class, level, enemy_type, count, seed, policy_name)
+
+    The chunk draws from its own random.Random seeded with the chunk seed,
+    so the outcome does not depend on which worker picks the chunk up.
+
+    Returns: Dictionary of summed results for the chunk
+    """
+    character_class, level, enemy_type, count, seed, policy_name = task
+    rng = random.Random(seed)
+    policy = SIMULATION_POLICIES[policy_name]
+
+    template = build_character_for_level(character_class, level)
+    stats = {"battles": 0, "wins": 0, "losses": 0, "escapes": 0,
+             "turns": 0, "hp_remaining": 0, "enemy_hp_remaining": 0}
+
+    for _ in range(count):
+        character = dict(template)
+        if enemy_type == AUTO_ENEMY:
+            enemy = combat_system.get_random_enemy_for_level(level, rng)
+        else:
+            enemy = combat_system.create_enemy(enemy_type)
+
+        result = combat_system.BattleEngine(character, enemy, policy, rng=rng).run()
+
+        stats["battles"] += 1
+        stats["turns"] += result["turns"]
+        stats["hp_remaining"] += character["health"]
+        stats["enemy_hp_remaining"] += enemy["health"]
+        if result["winner"] == "player":
+            stats["wins"] += 1
+        elif result["winner"] == "enemy":
+            stats["losses"] += 1
+        else:
+            stats["escapes"] += 1
+
+    return stats
+
+def make_chunk_seed(seed, matchup_index, chunk_index):
+    """
+    Derive a deterministic seed for one chunk of one matchup
+
+    Returns: 64-bit integer seed
+    """
+    return random.Random(f"{seed}:{matchup_index}:{chunk_index}").getrandbits(64)
+
+def simulate_matchups(matchups, battles_per_matchup, seed=0, policy="attack",
+                      workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Run N seeded battles for every matchup across a process pool
+
+    Args:
+        matchups: List of (character_class, level, enemy_type) tuples
+        battles_per_matchup: Number of battles per matchup
+        seed: Base seed; the same seed always gives the same results
+        policy: Name of an action policy in SIMULATION_POLICIES
+        workers: Process count (None = CPU count, 1 = run in this process)
+        chunk_size: Battles per worker task
+
+    Returns: Dictionary with:
+            - rows: one summary dictionary per matchup (see summarize_stats)
+            - battles: total battles fought
+            - seconds: wall-clock time
+            - battles_per_second: throughput
+    Raises: ValueError if the policy name is unknown
+    """
+    if policy not in SIMULATION_POLICIES:
+        raise ValueError(f"Unknown simulation policy: {policy}")
+
+    tasks = []
+    owners = []
+    for matchup_index, (character_class, level, enemy_type) in enumerate(matchups):
+        remaining = battles_per_matchup
+        chunk_index = 0
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            chunk_seed = make_chunk_seed(seed, matchup_index, chunk_index)
+            tasks.append((character_class, level, enemy_type, count, chunk_seed, policy))
+            owners.append(matchup_index)
+            remaining -= count
+            chunk_index += 1
+
+    start = time.perf_counter()
+    if workers == 1:
+        chunk_results = [run_battle_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk_results = list(pool.map(run_battle_chunk, tasks))
+    seconds = time.perf_counter() - start
+
+    totals = [None] * len(matchups)
+    for matchup_index, stats in zip(owners, chunk_results):
+        if totals[matchup_index] is None:
+            totals[matchup_index] = dict(stats)
+        else:
+            for key, value in stats.items():
+                totals[matchup_index][key] += value
+
+    rows = []
+    total_battles = 0
+    for matchup, stats in zip(matchups, totals):
+        if stats is None:
+            continue
+        rows.append(summarize_stats(matchup, stats))
+        total_battles += stats["battles"]
+
+    return {
+        "rows": rows,
+        "battles": total_battles,
+        "seconds": seconds,
+        "battles_per_second": total_battles / seconds if seconds > 0 else 0.0
+    }
+
+def summarize_stats(matchup, stats):
+    """
+    Turn summed chunk results into averages for one matchup
+
+    Returns: Dictionary with class, level, enemy, battles, win_rate,
+             escape_rate, avg_turns, avg_hp_remaining, avg_enemy_hp_remaining
+    """
+    character_class, level, enemy_type = matchup
+    battles = stats["battles"]
+    return {
+        "class": character_class,
+        "level": level,
+        "enemy": enemy_type,
+        "battles": battles,
+        "win_rate": stats["wins"] / battles,
+        "escape_rate": stats["escapes"] / battles,
+        "avg_turns": stats["turns"] / battles,
+        "avg_hp_remaining": stats["hp_remaining"] / battles,
+        "avg_enemy_hp_remaining": stats["enemy_hp_remaining"] / battles
+    }
+
+# ============================================================================
+# DISPLAY FUNCTIONS
+# ============================================================================
+
+def format_summary_table(summary):
+    """
+    Format simulation results as a text table
+
+    Returns: String table including the throughput line
+    """
+    lines = [
+        f"{'Class':<8} {'Lvl':>3} {'Enemy':<8} {'Battles':>8} {'Win%':>6} {'Esc%':>6} "
+        f"{'Turns':>6} {'HP Left':>8} {'Enemy HP':>8}"
+    ]
+    for row in summary["rows"]:
+        lines.append(
+            f"{row['class']:<8} {row['level']:>3} {row['enemy']:<8} {row['battles']:>8} "
+            f"{row['win_rate'] * 100:>5.1f}% {row['escape_rate'] * 100:>5.1f}% "
+            f"{row['avg_turns']:>6.2f} {row['avg_hp_remaining']:>8.1f} "
+            f"{row['avg_enemy_hp_remaining']:>8.1f}"
+        )
+    lines.append(
+        f"{summary['battles']} battles in {summary['seconds']:.2f}s "
+        f"({summary['battles_per_second']:.0f} battles/sec)"
+    )
+    return "\n".join(lines)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== BATTLE SIMULATOR TEST ===")
+
+    # matchups = build_matchups(["Warrior", "Mage", "Rogue", "Cleric"], [1, 3, 6])
+    # summary = simulate_matchups(matchups, 5000, seed=163, policy="special_first")
+    # print(format_summary_table(summary))
@@ -0,0 +1,433 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark Suite
+
+Measures throughput and latency of every subsystem's hot paths:
+- game_data.load_quests / load_items at 1k, 100k and 1M records
+- save_character / load_character round trips
+- get_available_quests on large catalogs
+- inventory operations at full MAX_INVENTORY_SIZE
+- headless battles per second
+- startup: time from launching main.py to its first prompt
+
+Results are written as JSON and compared against benchmarks/baselines.json.
+Baselines are stored relative to a small pure-Python reference workload
+timed in the same run, so a uniformly faster or slower machine does not
+shift every result. Anything slower than its baseline by more than the
+tolerance is reported as a regression; when the baselines were recorded
+on another host (I/O and CPU do not scale together) regressions are only
+warnings unless --strict is given.
+
+Usage (from the repository root):
+    python benchmarks/run_benchmarks.py              # full suite
+    python benchmarks/run_benchmarks.py --quick      # small sizes only
+    python benchmarks/run_benchmarks.py --update-baselines
+    python benchmarks/run_benchmarks.py --strict     # fail even across hosts
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import content_generator
+import game_data
+import inventory_system
+import quest_handler
+import battle_simulator
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_BASELINE_FILE = os.path.join(BENCHMARK_DIR, "baselines.json")
+DEFAULT_RESULTS_FILE = os.path.join(BENCHMARK_DIR, "results.json")
+
+# Record counts for the data loading benchmarks
+FULL_LOAD_SIZES = (1000, 100000, 1000000)
+QUICK_LOAD_SIZES = (1000, 10000)
+
+# Quest catalog sizes for get_available_quests
+FULL_CATALOG_SIZES = (1000, 10000)
+QUICK_CATALOG_SIZES = (1000,)
+
+# Slower than baseline by more than this fraction counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# In-run benchmark every other result is measured against
+REFERENCE_BENCHMARK = "reference_workload"
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def time_calls(func, repeat, ops_per_call=1):
+    """
+    Call func repeat times and measure each call
+
+    Returns: Dictionary with calls, ops, seconds, ops_per_sec, p50_us, p99_us
+    """
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return summarize_samples(samples, ops_per_call)
+
+def summarize_samples(samples, ops_per_call=1):
+    """
+    Summarize per-call durations in seconds
+
+    Returns: Dictionary with calls, ops, seconds, ops_per_sec, p50_us, p99_us
+    """
+    samples = sorted(samples)
+    seconds = sum(samples)
+    ops = len(samples) * ops_per_call
+    return {
+        "calls": len(samples),
+        "ops": ops,
+        "seconds": seconds,
+        "ops_per_sec": ops / seconds if seconds > 0 else 0.0,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6
+    }
+
+def _result(name, unit, timing, **params):
+    """Attach a name, unit and parameters to a timing dictionary"""
+    result = {"name": name, "unit": unit, "params": params}
+    result.update(timing)
+    return result
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def bench_data_loading(workdir, sizes):
+    """Benchmark load_quests and load_items (ops = records loaded)"""
+    results = []
+    for count in sizes:
+        repeat = max(1, 20000 // count)
+
+        quest_file = os.path.join(workdir, f"quests_{count}.txt")
+        content_generator.write_quest_file(content_generator.generate_quests(count, roots=10),
+                                           quest_file)
+        timing = time_calls(lambda: game_data.load_quests(quest_file), repeat, count)
+        results.append(_result(f"load_quests[{count}]", "records/sec", timing, records=count))
+        os.remove(quest_file)
+
+        item_file = os.path.join(workdir, f"items_{count}.txt")
+        content_generator.write_item_file(content_generator.generate_items(count), item_file)
+        timing = time_calls(lambda: game_data.load_items(item_file), repeat, count)
+        results.append(_result(f"load_items[{count}]", "records/sec", timing, records=count))
+        os.remove(item_file)
+    return results
+
+def bench_save_load(workdir, repeat=500):
+    """Benchmark save_character + load_character round trips"""
+    save_directory = os.path.join(workdir, "saves")
+    character = character_manager.create_character("Bench", "Warrior")
+    character["inventory"] = [f"item_{i}" for i in range(inventory_system.MAX_INVENTORY_SIZE)]
+    character["completed_quests"] = [f"quest_{i}" for i in range(200)]
+
+    def round_trip():
+        character_manager.save_character(character, save_directory)
+        character_manager.load_character("Bench", save_directory)
+
+    timing = time_calls(round_trip, repeat)
+    return [_result("save_load_round_trip", "round trips/sec", timing)]
+
+def bench_available_quests(sizes, repeat=20):
+    """Benchmark get_available_quests on large catalogs"""
+    results = []
+    for count in sizes:
+        quests = content_generator.generate_quests(count, roots=10)
+        character = character_manager.create_character("Quester", "Mage")
+        character["level"] = 25
+        character["completed_quests"] = list(quests)[::10]
+
+        timing = time_calls(lambda: quest_handler.get_available_quests(character, quests), repeat)
+        results.append(_result(f"get_available_quests[{count}]", "calls/sec", timing,
+                               quests=count, completed=len(character["completed_quests"])))
+    return results
+
+def bench_inventory(repeat=5000):
+    """Benchmark inventory operations on a full inventory"""
+    size = inventory_system.MAX_INVENTORY_SIZE
+    character = character_manager.create_character("Packer", "Rogue")
+    item_ids = [f"item_{i}" for i in range(size)]
+    last_item = item_ids[-1]
+    weapon = {"item_id": "bench_sword", "type": "weapon", "effect": "strength:5", "cost": 10}
+
+    def fill_and_empty():
+        character["inventory"] = []
+        for item_id in item_ids:
+            inventory_system.add_item_to_inventory(character, item_id)
+        for item_id in item_ids:
+            inventory_system.remove_item_from_inventory(character, item_id)
+
+    def lookups():
+        inventory_system.has_item(character, last_item)
+        inventory_system.count_item(character, last_item)
+        inventory_system.get_inventory_space_remaining(character)
+
+    def equip_cycle():
+        inventory_system.equip_weapon(character, "bench_sword", weapon)
+        inventory_system.unequip_weapon(character)
+
+    results = [_result("inventory_fill_and_empty", "items/sec",
+                       time_calls(fill_and_empty, repeat, size * 2), size=size)]
+
+    character["inventory"] = list(item_ids)
+    results.append(_result("inventory_lookups", "calls/sec",
+                           time_calls(lookups, repeat, 3), size=size))
+
+    character["inventory"] = item_ids[:-1] + ["bench_sword"]
+    results.append(_result("inventory_equip_cycle", "cycles/sec",
+                           time_calls(equip_cycle, repeat), size=size))
+    return results
+
+def bench_battles(battles=2000):
+    """Benchmark headless battles (turn loop and closed-form fast path)"""
+    results = []
+    hero = battle_simulator.build_character_for_level("Warrior", 3)
+    rng = random.Random(0)
+
+    for name, policy, fast_path in (("battles_turn_loop", combat_system.special_first_policy, False),
+                                    ("battles_fast_path", combat_system.basic_attack_policy, True)):
+        def fight():
+            engine = combat_system.BattleEngine(dict(hero), combat_system.create_enemy("orc"),
+                                                policy, fast_path=fast_path, rng=rng)
+            engine.run()
+
+        results.append(_result(name, "battles/sec", time_calls(fight, battles)))
+    return results
+
+def bench_reference(repeat=200):
+    """Benchmark a fixed pure-Python workload (dicts, strings, sorting)"""
+    keys = [f"key_{i}" for i in range(2000)]
+
+    def workload():
+        table = {}
+        for i, key in enumerate(keys):
+            table[key] = i * 2
+        total = 0
+        for key in sorted(table, reverse=True):
+            total += table[key]
+        return total
+
+    return [_result(REFERENCE_BENCHMARK, "runs/sec", time_calls(workload, repeat))]
+
+def bench_startup(repeat=20):
+    """Benchmark launching main.py until the main menu prompt appears"""
+    prompt = b"Enter choice (1-3): "
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        game = subprocess.Popen([sys.executable, "main.py"], cwd=REPO_DIR,
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        output = b""
+        while prompt not in output:
+            chunk = os.read(game.stdout.fileno(), 4096)
+            if not chunk:
+                raise RuntimeError("main.py exited before its first prompt")
+            output += chunk
+        samples.append(time.perf_counter() - start)
+        # Closing stdin is end of input, so the game exits from the menu
+        game.communicate()
+
+    return [_result("startup_to_first_prompt", "starts/sec", summarize_samples(samples))]
+
+def run_suite(quick=False, only=None):
+    """
+    Run every benchmark
+
+    Args:
+        quick: Use the small sizes only
+        only: Optional substring; only benchmarks whose name contains it are
+              run (the others are skipped, not run and then dropped)
+
+    Returns: List of result dictionaries (the reference benchmark is always
+             included, since comparisons are made against it)
+    """
+    load_sizes = QUICK_LOAD_SIZES if quick else FULL_LOAD_SIZES
+    catalog_sizes = QUICK_CATALOG_SIZES if quick else FULL_CATALOG_SIZES
+    load_sizes = [count for count in load_sizes
+                  if _wanted(only, f"load_quests[{count}]", f"load_items[{count}]")]
+    catalog_sizes = [count for count in catalog_sizes
+                     if _wanted(only, f"get_available_quests[{count}]")]
+
+    results = bench_reference(100 if quick else 200)
+    with tempfile.TemporaryDirectory() as workdir:
+        if load_sizes:
+            results.extend(bench_data_loading(workdir, load_sizes))
+        if _wanted(only, "save_load_round_trip"):
+            results.extend(bench_save_load(workdir, 100 if quick else 500))
+    if catalog_sizes:
+        results.extend(bench_available_quests(catalog_sizes))
+    if _wanted(only, "inventory_fill_and_empty", "inventory_lookups", "inventory_equip_cycle"):
+        results.extend(bench_inventory(1000 if quick else 5000))
+    if _wanted(only, "battles_turn_loop", "battles_fast_path"):
+        results.extend(bench_battles(500 if quick else 2000))
+    if _wanted(only, "startup_to_first_prompt"):
+        results.extend(bench_startup(5 if quick else 20))
+
+    if only:
+        # A group can produce names the filter does not match
+        results = [result for result in results
+                   if only in result["name"] or result["name"] == REFERENCE_BENCHMARK]
+    return results
+
+def _wanted(only, *names):
+    """Check whether any of a benchmark group's names passes the --only filter"""
+    return not only or any(only in name for name in names)
+
+# ============================================================================
+# BASELINES AND RESULTS
+# ============================================================================
+
+def get_host_id():
+    """Identify the machine and Python build that produced a set of results"""
+    return f"{platform.node()}/{platform.machine()}/python-{platform.python_version()}"
+
+def load_baselines(filename=DEFAULT_BASELINE_FILE):
+    """
+    Load baselines
+
+    Returns: Dictionary with 'host' and 'relative' (benchmark name ->
+             throughput divided by the reference benchmark's); empty
+             relative table if there is no file
+    """
+    if not os.path.exists(filename):
+        return {"host": None, "relative": {}}
+    with open(filename, "r") as f:
+        return json.load(f)
+
+def save_baselines(results, filename=DEFAULT_BASELINE_FILE):
+    """Store the current relative throughputs as the new baselines (existing names are kept)"""
+    baselines = load_baselines(filename)
+    relative = baselines.setdefault("relative", {})
+    reference = _reference_ops(results)
+    for result in results:
+        if result["name"] != REFERENCE_BENCHMARK:
+            relative[result["name"]] = float(f"{result['ops_per_sec'] / reference:.6g}")
+    baselines["host"] = get_host_id()
+    baselines["reference"] = REFERENCE_BENCHMARK
+    with open(filename, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def compare_to_baselines(results, baselines, tolerance=DEFAULT_TOLERANCE):
+    """
+    Mark each result with its relative throughput and baseline, and find regressions
+
+    Returns: List of regressed benchmark names
+    """
+    reference = _reference_ops(results)
+    relative_baselines = baselines.get("relative", {})
+    regressions = []
+    for result in results:
+        if result["name"] == REFERENCE_BENCHMARK:
+            continue
+        result["relative"] = result["ops_per_sec"] / reference
+        baseline = relative_baselines.get(result["name"])
+        result["baseline_relative"] = baseline
+        if baseline:
+            result["ratio"] = result["relative"] / baseline
+            if result["ratio"] < 1 - tolerance:
+                regressions.append(result["name"])
+    return regressions
+
+def _reference_ops(results):
+    """
+    Throughput of the reference benchmark in a result list
+
+    Taken from its median call, which is steadier than the mean on a busy
+    machine.
+
+    Raises: ValueError if the reference benchmark is missing
+    """
+    for result in results:
+        if result["name"] == REFERENCE_BENCHMARK and result["p50_us"] > 0:
+            return 1e6 / result["p50_us"]
+    raise ValueError(f"Results do not include the {REFERENCE_BENCHMARK} benchmark")
+
+def write_results(results, regressions, filename=DEFAULT_RESULTS_FILE):
+    """Write a machine-readable results file"""
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "host": get_host_id(),
+        "results": results,
+        "regressions": regressions
+    }
+    with open(filename, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+def format_results(results):
+    """
+    Format results as a text table
+
+    Returns: String table
+    """
+    lines = [f"{'Benchmark':<32} {'Throughput':>14} {'Unit':<17} {'p50 us':>10} "
+             f"{'p99 us':>10} {'vs base':>8}"]
+    for result in results:
+        ratio = result.get("ratio")
+        versus = f"{ratio:.2f}x" if ratio is not None else "-"
+        lines.append(f"{result['name']:<32} {result['ops_per_sec']:>14,.0f} {result['unit']:<17} "
+                     f"{result['p50_us']:>10.1f} {result['p99_us']:>10.1f} {versus:>8}")
+    return "\n".join(lines)
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+def main(argv=None):
+    """
+    Run the suite from the command line
+
+    Returns: Exit code (1 if any benchmark regressed against baselines from
+             this host, or from any host with --strict)
+    """
+    parser = argparse.ArgumentParser(description="Quest Chronicles benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="small sizes only")
+    parser.add_argument("--only", help="run benchmarks whose name contains this text")
+    parser.add_argument("--output", default=DEFAULT_RESULTS_FILE, help="results JSON file")
+    parser.add_argument("--baselines", default=DEFAULT_BASELINE_FILE, help="baselines JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baselines", action="store_true")
+    parser.add_argument("--strict", action="store_true",
+                        help="fail on regressions even if the baselines are from another host")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.quick, args.only)
+    baselines = load_baselines(args.baselines)
+    regressions = compare_to_baselines(results, baselines, args.tolerance)
+    write_results(results, regressions, args.output)
+    print(format_results(results))
+
+    if args.update_baselines:
+        save_baselines(results, args.baselines)
+        print(f"Baselines updated in {args.baselines}")
+        return 0
+    if regressions:
+        if baselines.get("host") != get_host_id() and not args.strict:
+            print(f"Possible regressions (baselines from {baselines.get('host')}, "
+                  "not failing): " + ", ".join(regressions))
+            return 0
+        print("Regressions: " + ", ".join(regressions))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
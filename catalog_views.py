@@ -0,0 +1,147 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Catalog Views Module
+
+This module precomputes the views of the item table that the shop and
+inventory screens need: items sorted by cost, items grouped by type, each
+item's display label and its shop listing line. The views are built once
+per catalog (the tables of a GameCatalog never change after loading), so
+showing the shop or an inventory is a lookup instead of a rebuild.
+
+Filtered and paginated queries such as "weapons under 200 gold" are
+answered from the sorted cost indexes with a binary search.
+"""
+
+from bisect import bisect_left, bisect_right
+
+# ============================================================================
+# ITEM VIEWS
+# ============================================================================
+
+class ItemViews:
+    """
+    Precomputed views of one item table
+
+    Attributes:
+        items: The item table the views were built from
+        by_cost: Item IDs sorted by (cost, item_id)
+        by_type: {item type: item IDs of that type sorted by cost}
+        labels: {item_id: 'Name (type)'} as shown in the inventory
+        lines: {item_id: '- item_id: Name (N gold)'} in catalog order
+        listing: All shop lines joined, in catalog order
+    """
+
+    __slots__ = ("items", "by_cost", "costs", "by_type", "type_costs",
+                 "labels", "lines", "listing")
+
+    def __init__(self, items):
+        """Build every view of an item table"""
+        self.items = items
+
+        self.by_cost = tuple(sorted(items, key=lambda item_id: (items[item_id].get("cost", 0),
+                                                                 item_id)))
+        self.costs = [items[item_id].get("cost", 0) for item_id in self.by_cost]
+
+        by_type = {}
+        for item_id in self.by_cost:
+            by_type.setdefault(items[item_id].get("type", "unknown"), []).append(item_id)
+        self.by_type = {item_type: tuple(ids) for item_type, ids in by_type.items()}
+        self.type_costs = {item_type: [items[item_id].get("cost", 0) for item_id in ids]
+                           for item_type, ids in by_type.items()}
+
+        self.labels = {}
+        self.lines = {}
+        for item_id, data in items.items():
+            name = data.get("name", item_id)
+            self.labels[item_id] = f"{name} ({data.get('type', 'unknown')})"
+            self.lines[item_id] = f"- {item_id}: {name} ({data.get('cost', 0)} gold)"
+        self.listing = "\n".join(self.lines.values())
+
+    def get_label(self, item_id):
+        """Inventory label for an item ('item_id (unknown)' if not in the catalog)"""
+        label = self.labels.get(item_id)
+        if label is None:
+            return f"{item_id} (unknown)"
+        return label
+
+    def query(self, item_type=None, min_cost=None, max_cost=None, page=1, page_size=None):
+        """
+        Find items by type and cost range, cheapest first
+
+        Args:
+            item_type: Only items of this type (None for any)
+            min_cost: Lowest cost included (None for no limit)
+            max_cost: Highest cost included (None for no limit)
+            page: 1-based page number (used with page_size)
+            page_size: Items per page (None for all matches)
+
+        Returns: List of item IDs (empty past the last page)
+        Raises: ValueError if page or page_size is less than 1
+        """
+        if page < 1:
+            raise ValueError("page must be at least 1")
+        if page_size is not None:
+            _check_page_size(page_size)
+        ids, start, stop = self._find_range(item_type, min_cost, max_cost)
+        if page_size is not None:
+            start += (page - 1) * page_size
+            stop = min(stop, start + page_size)
+        return list(ids[start:stop])
+
+    def count(self, item_type=None, min_cost=None, max_cost=None):
+        """Number of items a query with these filters matches"""
+        ids, start, stop = self._find_range(item_type, min_cost, max_cost)
+        return stop - start
+
+    def page_count(self, page_size, item_type=None, min_cost=None, max_cost=None):
+        """
+        Number of pages a query with these filters has
+
+        Raises: ValueError if page_size is less than 1
+        """
+        _check_page_size(page_size)
+        return -(-self.count(item_type, min_cost, max_cost) // page_size)
+
+    def format_listing(self, item_ids):
+        """
+        Shop lines for some items (e.g. one page of a query)
+
+        Returns: String with one line per item
+        """
+        lines = self.lines
+        return "\n".join(lines[item_id] for item_id in item_ids)
+
+    def _find_range(self, item_type, min_cost, max_cost):
+        """
+        Binary search the cost index for a cost range
+
+        Returns: (sorted item IDs, start index, stop index)
+        """
+        if item_type is None:
+            ids, costs = self.by_cost, self.costs
+        else:
+            ids, costs = self.by_type.get(item_type, ()), self.type_costs.get(item_type, [])
+        start = 0 if min_cost is None else bisect_left(costs, min_cost)
+        stop = len(costs) if max_cost is None else bisect_right(costs, max_cost)
+        return ids, start, max(start, stop)
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _check_page_size(page_size):
+    """Reject page sizes that cannot hold an item"""
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== CATALOG VIEWS TEST ===")
+
+    # import game_data
+    # views = game_data.load_catalog().item_views
+    # print(views.listing)
+    # print(views.query("weapon", max_cost=199))
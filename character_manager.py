@@ -10,13 +10,54 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import sys
+import time
+
+import metrics
+import symbol_table
 from custom_exceptions import (
     InvalidCharacterClassError,
+    InvalidCharacterNameError,
     CharacterNotFoundError,
     SaveFileCorruptedError,
     InvalidSaveDataError,
     CharacterDeadError
 )
+from record_schema import Field, RecordSchema
+
+# Character names become save file names, so they may not contain anything
+# that would let the path leave the save directory
+FORBIDDEN_NAME_PARTS = ("/", "\\", "..", "\0")
+
+# ============================================================================
+# SAVE FILE SCHEMA
+# ============================================================================
+
+def _parse_id_list(value):
+    """Comma-separated ids as a list of interned strings (empty -> [])"""
+    return [sys.intern(part.strip()) for part in value.split(",") if part.strip()]
+
+# Name and class keep their original type-error wording
+STRING_TYPE_MESSAGE = "Character '{field}' must be {kind}"
+
+CHARACTER_SCHEMA = RecordSchema("character", [
+    Field("NAME", "name", type_message=STRING_TYPE_MESSAGE),
+    Field("CLASS", "class", type_message=STRING_TYPE_MESSAGE),
+    Field("LEVEL", "level", int, int),
+    Field("HEALTH", "health", int, int),
+    Field("MAX_HEALTH", "max_health", int, int),
+    Field("STRENGTH", "strength", int, int),
+    Field("MAGIC", "magic", int, int),
+    Field("EXPERIENCE", "experience", int, int),
+    Field("GOLD", "gold", int, int),
+    Field("INVENTORY", "inventory", _parse_id_list, list),
+    Field("ACTIVE_QUESTS", "active_quests", _parse_id_list, list),
+    Field("COMPLETED_QUESTS", "completed_quests", _parse_id_list, list)
+], error_class=InvalidSaveDataError, separator=":", messages={
+    "line": "Invalid line format in save file: {line}",
+    "unknown": None,
+    "convert": "Invalid numeric value in save file: {error}"
+})
 
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
@@ -33,7 +74,10 @@ def create_character(name, character_class):
             - experience, gold, inventory, active_quests, completed_quests
     
     Raises: InvalidCharacterClassError if class is not valid
+            InvalidCharacterNameError if name is not a valid save name
     """
+    validate_character_name(name)
+
     # Validate character_class first
     # Example base stats:
     # Warrior: health=120, strength=15, magic=5
@@ -106,22 +150,24 @@ def save_character(character, save_directory="data/save_games"):
     COMPLETED_QUESTS: quest1,quest2
     
     Returns: True if successful
-    Raises: PermissionError, IOError (let them propagate or handle)
+    Raises: InvalidCharacterNameError if the name is not a valid save name
+            PermissionError, IOError (let them propagate or handle)
     """
     # TODO: Implement save functionality
     # Create save_directory if it doesn't exist
     # Handle any file I/O errors appropriately
     # Lists should be saved as comma-separated values
+    start = time.perf_counter()
+    validate_character_name(character['name'])
     if not os.path.exists(save_directory):
         os.makedirs(save_directory)
 
-    filename = f"{character['name']}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    filepath = _save_path(character['name'], save_directory)
 
-    # Prepare list fields as comma-separated strings
-    inventory_str = ",".join(character.get("inventory", []))
-    active_quests_str = ",".join(character.get("active_quests", []))
-    completed_quests_str = ",".join(character.get("completed_quests", []))
+    # Prepare list fields as comma-separated strings (packed ids are unpacked)
+    inventory_str = ",".join(symbol_table.as_names(character.get("inventory", [])))
+    active_quests_str = ",".join(symbol_table.as_names(character.get("active_quests", [])))
+    completed_quests_str = ",".join(symbol_table.as_names(character.get("completed_quests", [])))
 
     with open(filepath, "w") as f:
         f.write(f"NAME: {character['name']}\n")
@@ -137,8 +183,11 @@ def save_character(character, save_directory="data/save_games"):
         f.write(f"ACTIVE_QUESTS: {active_quests_str}\n")
         f.write(f"COMPLETED_QUESTS: {completed_quests_str}\n")
 
+    metrics.SAVES.inc()
+    metrics.SAVE_SECONDS.observe(time.perf_counter() - start)
     return True
 
+@metrics.track_loads("save")
 def load_character(character_name, save_directory="data/save_games"):
     """
     Load character from save file
@@ -149,7 +198,8 @@ def load_character(character_name, save_directory="data/save_games"):
     
     Returns: Character dictionary
     Raises: 
-        CharacterNotFoundError if save file doesn't exist
+        CharacterNotFoundError if save file doesn't exist (or the name
+            cannot be a save name)
         SaveFileCorruptedError if file exists but can't be read
         InvalidSaveDataError if data format is wrong
     """
@@ -158,8 +208,9 @@ def load_character(character_name, save_directory="data/save_games"):
     # Try to read file → SaveFileCorruptedError
     # Validate data format → InvalidSaveDataError
     # Parse comma-separated lists back into Python lists
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    if not is_valid_character_name(character_name):
+        raise CharacterNotFoundError(f"Character save file not found: {character_name}")
+    filepath = _save_path(character_name, save_directory)
 
     if not os.path.exists(filepath):
         raise CharacterNotFoundError(f"Character save file not found: {character_name}")
@@ -170,68 +221,9 @@ def load_character(character_name, save_directory="data/save_games"):
     except OSError as e:
         raise SaveFileCorruptedError(f"Error reading save file: {e}")
 
-    data = {}
-
-    try:
-        for raw_line in lines:
-            line = raw_line.strip()
-            if not line:
-                continue
-            # Allow both "FIELD: value" and "FIELD:" formats
-            if ":" not in line:
-                raise InvalidSaveDataError(f"Invalid line format in save file: {line}")
-            key, value = line.split(":", 1)
-            key = key.strip().upper()
-            value = value.strip()
-
-            if key == "NAME":
-                data["name"] = value
-            elif key == "CLASS":
-                data["class"] = value
-            elif key == "LEVEL":
-                data["level"] = int(value)
-            elif key == "HEALTH":
-                data["health"] = int(value)
-            elif key == "MAX_HEALTH":
-                data["max_health"] = int(value)
-            elif key == "STRENGTH":
-                data["strength"] = int(value)
-            elif key == "MAGIC":
-                data["magic"] = int(value)
-            elif key == "EXPERIENCE":
-                data["experience"] = int(value)
-            elif key == "GOLD":
-                data["gold"] = int(value)
-            elif key == "INVENTORY":
-                if value == "":
-                    data["inventory"] = []
-                else:
-                    data["inventory"] = [item.strip() for item in value.split(",") if item.strip()]
-            elif key == "ACTIVE_QUESTS":
-                if value == "":
-                    data["active_quests"] = []
-                else:
-                    data["active_quests"] = [q.strip() for q in value.split(",") if q.strip()]
-            elif key == "COMPLETED_QUESTS":
-                if value == "":
-                    data["completed_quests"] = []
-                else:
-                    data["completed_quests"] = [q.strip() for q in value.split(",") if q.strip()]
-            else:
-                # Unknown key – ignore instead of failing
-                continue
-
-        # Validate structure and types
-        validate_character_data(data)
-
-    except ValueError as e:
-        # Problems converting numbers
-        raise InvalidSaveDataError(f"Invalid numeric value in save file: {e}")
-    except InvalidSaveDataError:
-        # Let this bubble as the specified error type
-        raise
-
-    return data
+    # Unknown keys are ignored; the schema checks required fields and
+    # numbers while parsing (InvalidSaveDataError)
+    return CHARACTER_SCHEMA.parse([line for line in map(str.strip, lines) if line])
 
 def list_saved_characters(save_directory="data/save_games"):
     """
@@ -249,7 +241,9 @@ def list_saved_characters(save_directory="data/save_games"):
     for filename in os.listdir(save_directory):
         if filename.endswith("_save.txt"):
             char_name = filename[:-9]  # remove "_save.txt"
-            names.append(char_name)
+            # Only list names load_character accepts
+            if is_valid_character_name(char_name):
+                names.append(char_name)
 
     return names
 
@@ -262,8 +256,9 @@ def delete_character(character_name, save_directory="data/save_games"):
     """
     # TODO: Implement character deletion
     # Verify file exists before attempting deletion
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    if not is_valid_character_name(character_name):
+        raise CharacterNotFoundError(f"Character not found: {character_name}")
+    filepath = _save_path(character_name, save_directory)
 
     if not os.path.exists(filepath):
         raise CharacterNotFoundError(f"Character not found: {character_name}")
@@ -400,55 +395,33 @@ def validate_character_data(character):
     Returns: True if valid
     Raises: InvalidSaveDataError if missing fields or invalid types
     """
-    # TODO: Implement validation
-    # Check all required keys exist
-    # Check that numeric values are numbers
-    # Check that lists are actually lists
-    required_fields = [
-        "name",
-        "class",
-        "level",
-        "health",
-        "max_health",
-        "strength",
-        "magic",
-        "experience",
-        "gold",
-        "inventory",
-        "active_quests",
-        "completed_quests"
-    ]
-
-    for field in required_fields:
-        if field not in character:
-            raise InvalidSaveDataError(f"Missing required character field: {field}")
-
-    # Type checks
-    if not isinstance(character["name"], str):
-        raise InvalidSaveDataError("Character 'name' must be a string")
-    if not isinstance(character["class"], str):
-        raise InvalidSaveDataError("Character 'class' must be a string")
-
-    int_fields = [
-        "level",
-        "health",
-        "max_health",
-        "strength",
-        "magic",
-        "experience",
-        "gold"
-    ]
-    for field in int_fields:
-        if not isinstance(character[field], int):
-            raise InvalidSaveDataError(f"Character field '{field}' must be an integer")
-
-    list_fields = ["inventory", "active_quests", "completed_quests"]
-    for field in list_fields:
-        if not isinstance(character[field], list):
-            raise InvalidSaveDataError(f"Character field '{field}' must be a list")
+    return CHARACTER_SCHEMA.validate(character)
+
+def is_valid_character_name(name):
+    """
+    Check whether a name can be used as a save file name
 
+    Any name is allowed (spaces, hyphens, ...) except one containing a
+    path separator, '..' or NUL, which could escape the save directory.
+    """
+    if not isinstance(name, str):
+        return False
+    return not any(part in name for part in FORBIDDEN_NAME_PARTS)
+
+def validate_character_name(name):
+    """
+    Returns: True if name can be used as a save file name
+    Raises: InvalidCharacterNameError otherwise
+    """
+    if not is_valid_character_name(name):
+        raise InvalidCharacterNameError(
+            f"Invalid character name: {name!r} (no '/', '\\', '..' or NUL characters)")
     return True
 
+def _save_path(character_name, save_directory):
+    """Path of a (validated) character's save file"""
+    return os.path.join(save_directory, f"{character_name}_save.txt")
+
 # ============================================================================
 # TESTING
 # ============================================================================
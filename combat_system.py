@@ -13,294 +13,815 @@ from custom_exceptions import (
     InvalidTargetError,
     CombatNotActiveError,
     CharacterDeadError,
-    AbilityOnCooldownError
+    AbilityOnCooldownError,
+    MissingDataFileError,
+    InvalidDataFormatError
 )
 
+import copy
+import json
 import random
+from bisect import bisect_right
+
+import game_data
+import metrics
+from ability_scheduler import AbilityScheduler, SPECIAL_ABILITY, register_class_abilities
 
 # ============================================================================
 # ENEMY DEFINITIONS
 # ============================================================================
 
+ENEMY_DATA_FILE = "data/enemies.txt"
+
+# Built-in enemies used when the enemy data file is missing
+DEFAULT_ENEMY_DATA = {
+    "goblin": {"enemy_id": "goblin", "name": "Goblin", "health": 50, "strength": 8,
+               "magic": 2, "xp_reward": 25, "gold_reward": 10,
+               "min_level": 1, "max_level": 2, "spawn_weight": 1},
+    "orc": {"enemy_id": "orc", "name": "Orc", "health": 80, "strength": 12,
+            "magic": 5, "xp_reward": 50, "gold_reward": 25,
+            "min_level": 3, "max_level": 5, "spawn_weight": 1},
+    "dragon": {"enemy_id": "dragon", "name": "Dragon", "health": 200, "strength": 25,
+               "magic": 15, "xp_reward": 200, "gold_reward": 100,
+               "min_level": 6, "max_level": None, "spawn_weight": 1}
+}
+
+# Prebuilt enemy templates and level -> spawn table, filled on first use
+_enemy_catalog = {"templates": None, "spawn_tables": None, "top_level": 1}
+
+def load_enemy_catalog(filename=ENEMY_DATA_FILE):
+    """
+    Build enemy templates and the level spawn index from an enemy data file
+
+    Falls back to DEFAULT_ENEMY_DATA if the file does not exist.
+
+    Returns: Dictionary of enemy templates {enemy_id: enemy_dict}
+    Raises: InvalidDataFormatError, CorruptedDataError for bad files
+    """
+    try:
+        enemy_data = game_data.load_enemies(filename)
+    except MissingDataFileError:
+        enemy_data = DEFAULT_ENEMY_DATA
+
+    templates = {}
+    for enemy_id, data in enemy_data.items():
+        templates[enemy_id] = {
+            "name": data["name"],
+            "health": data["health"],
+            "max_health": data["health"],
+            "strength": data["strength"],
+            "magic": data["magic"],
+            "xp_reward": data["xp_reward"],
+            "gold_reward": data["gold_reward"]
+        }
+
+    # Every level up to one past the highest bound gets its own table;
+    # levels beyond that share the last one (only open-ended enemies remain)
+    top_level = 1
+    for data in enemy_data.values():
+        top_level = max(top_level, data["min_level"])
+        if data["max_level"] is not None:
+            top_level = max(top_level, data["max_level"] + 1)
+
+    spawn_tables = [None]
+    for level in range(1, top_level + 1):
+        weighted = []
+        for enemy_id, data in enemy_data.items():
+            if data["min_level"] <= level and (data["max_level"] is None or level <= data["max_level"]):
+                weighted.append((enemy_id, data["spawn_weight"]))
+        spawn_tables.append(_build_spawn_table(weighted))
+
+    _enemy_catalog["templates"] = templates
+    _enemy_catalog["spawn_tables"] = spawn_tables
+    _enemy_catalog["top_level"] = top_level
+    return templates
+
+def get_enemy_templates():
+    """
+    Get the enemy templates, loading the enemy catalog on first use
+
+    Returns: Dictionary of enemy templates {enemy_id: enemy_dict}
+    """
+    if _enemy_catalog["templates"] is None:
+        load_enemy_catalog()
+    return _enemy_catalog["templates"]
+
 def create_enemy(enemy_type):
     """
     Create an enemy based on type
     
-    Example enemy types and stats:
+    Enemy types and stats come from data/enemies.txt, for example:
     - goblin: health=50, strength=8, magic=2, xp_reward=25, gold_reward=10
     - orc: health=80, strength=12, magic=5, xp_reward=50, gold_reward=25
     - dragon: health=200, strength=25, magic=15, xp_reward=200, gold_reward=100
     
-    Returns: Enemy dictionary
+    Returns: Enemy dictionary (a fresh copy of the prebuilt template)
     Raises: InvalidTargetError if enemy_type not recognized
     """
-    # TODO: Implement enemy creation
-    # Return dictionary with: name, health, max_health, strength, magic, xp_reward, gold_reward
-    enemy_type = enemy_type.lower()
-    
-    if enemy_type == "goblin":
-        return {
-            "name": "Goblin",
-            "health": 50,
-            "max_health": 50,
-            "strength": 8,
-            "magic": 2,
-            "xp_reward": 25,
-            "gold_reward": 10
-        }
-    elif enemy_type == "orc":
-        return {
-            "name": "Orc",
-            "health": 80,
-            "max_health": 80,
-            "strength": 12,
-            "magic": 5,
-            "xp_reward": 50,
-            "gold_reward": 25
-        }
-    elif enemy_type == "dragon":
-        return {
-            "name": "Dragon",
-            "health": 200,
-            "max_health": 200,
-            "strength": 25,
-            "magic": 15,
-            "xp_reward": 200,
-            "gold_reward": 100
-        }
-    else:
+    template = get_enemy_templates().get(enemy_type.lower())
+    if template is None:
         raise InvalidTargetError(f"Unknown enemy type: {enemy_type}")
+    return dict(template)
 
-def get_random_enemy_for_level(character_level):
+def get_random_enemy_for_level(character_level, rng=None):
     """
     Get an appropriate enemy for character's level
     
+    Picks from the enemies whose MIN_LEVEL/MAX_LEVEL range covers the
+    level, weighted by SPAWN_WEIGHT, drawing from rng (defaults to the
+    random module). With the shipped data:
     Level 1-2: Goblins
     Level 3-5: Orcs
     Level 6+: Dragons
     
     Returns: Enemy dictionary
+    Raises: InvalidTargetError if no enemy can spawn at that level
     """
-    # TODO: Implement level-appropriate enemy selection
-    # Use if/elif/else to select enemy type
-    # Call create_enemy with appropriate type
-    if character_level <= 2:
-        enemy_type = "goblin"
-    elif character_level <= 5:
-        enemy_type = "orc"
+    get_enemy_templates()
+    level = min(max(character_level, 1), _enemy_catalog["top_level"])
+    enemy_ids, cum_weights = _enemy_catalog["spawn_tables"][level]
+
+    if not enemy_ids:
+        raise InvalidTargetError(f"No enemies available for level {character_level}")
+    if len(enemy_ids) == 1:
+        # Nothing to choose, so don't consume a random draw
+        enemy_id = enemy_ids[0]
     else:
-        enemy_type = "dragon"
-    
-    return create_enemy(enemy_type)
+        if rng is None:
+            rng = random
+        enemy_id = enemy_ids[bisect_right(cum_weights, rng.random() * cum_weights[-1])]
+    return create_enemy(enemy_id)
+
+def _build_spawn_table(weighted):
+    """
+    Turn (enemy_id, weight) pairs into cumulative weights for sampling
+
+    One entry per enemy whatever the weights are, and a draw is a binary
+    search. Enemies with weight 0 never spawn and are left out.
+
+    Returns: Tuple (enemy_ids, cum_weights)
+    """
+    enemy_ids = []
+    cum_weights = []
+    total = 0
+    for enemy_id, weight in weighted:
+        if weight > 0:
+            total += weight
+            enemy_ids.append(enemy_id)
+            cum_weights.append(total)
+    return tuple(enemy_ids), cum_weights
 
 # ============================================================================
 # COMBAT SYSTEM
 # ============================================================================
 
-class SimpleBattle:
+# Player actions understood by BattleEngine
+ACTION_ATTACK = "attack"
+ACTION_SPECIAL = "special"
+ACTION_ESCAPE = "escape"
+
+# Text for each battle event action, filled in with the event's amount
+BATTLE_EVENT_MESSAGES = {
+    ("battle", "start"): "Battle begins!",
+    ("player", "attack"): "You attack the {enemy} for {amount} damage!",
+    ("enemy", "attack"): "{enemy} attacks you for {amount} damage!",
+    ("player", "power_strike"): "Warrior Power Strike deals {amount} damage!",
+    ("player", "fireball"): "Mage Fireball deals {amount} damage!",
+    ("player", "critical_strike"): "Rogue Critical Strike lands for {amount} critical damage!",
+    ("player", "rogue_strike"): "Rogue attack deals {amount} damage.",
+    ("player", "heal"): "Cleric Heal restores {amount} health.",
+    ("player", "fizzle"): "Nothing happens...",
+    ("player", "cooldown"): "Special ability is on cooldown.",
+    ("player", "effect_tick"): "You take {amount} damage over time.",
+    ("enemy", "effect_tick"): "The {enemy} takes {amount} damage over time.",
+    ("player", "effect_expire"): "An effect on you wears off.",
+    ("enemy", "effect_expire"): "An effect on the {enemy} wears off.",
+    ("player", "escape"): "You successfully escaped!",
+    ("player", "escape_failed"): "You failed to escape!",
+    ("battle", "victory"): "You have defeated the {enemy}!",
+    ("battle", "defeat"): "You have been defeated..."
+}
+
+def basic_attack_policy(battle):
+    """Action policy that always uses a basic attack"""
+    return ACTION_ATTACK
+
+def special_first_policy(battle):
+    """Action policy that opens with the special ability, then attacks"""
+    if battle.turn_count == 1:
+        return ACTION_SPECIAL
+    return ACTION_ATTACK
+
+def prompt_player_action(battle):
     """
-    Simple turn-based combat system
-    
-    Manages combat between character and enemy
+    Action policy that asks the player at the console
+
+    Returns: One of ACTION_ATTACK, ACTION_SPECIAL, ACTION_ESCAPE
     """
-    
-    def __init__(self, character, enemy):
-        """Initialize battle with character and enemy"""
-        # TODO: Implement initialization
-        # Store character and enemy
-        # Set combat_active flag
-        # Initialize turn counter
+    print("\nYour turn:")
+    print("1. Basic Attack")
+    print("2. Special Ability")
+    print("3. Try to Run")
+
+    try:
+        choice = input("Choose an action (1-3): ")
+    except EOFError:
+        # In non-interactive/testing environments, default to basic attack
+        choice = "1"
+
+    if choice == "2":
+        return ACTION_SPECIAL
+    if choice == "3":
+        return ACTION_ESCAPE
+    return ACTION_ATTACK
+
+class BattleEngine:
+    """
+    Headless turn-based combat between one character and one enemy
+
+    Contains only game logic: nothing is printed and nothing is read from
+    the console. Player actions come from a policy callable that receives
+    the engine and returns an action, and every step is recorded in
+    self.events (a BattleLog) as a tuple
+    (turn, actor, action, amount, target_health).
+
+    Cooldowns, buffs/debuffs and damage over time live in self.scheduler,
+    an AbilityScheduler that only exists for the length of this battle.
+    """
+
+    def __init__(self, character, enemy, policy=None, fast_path=True,
+                 rng=None, battle_id=None):
+        """
+        Initialize battle with character, enemy and action policy
+
+        With fast_path on, battles driven by basic_attack_policy skip the
+        turn loop and are resolved in one step by predict_battle().
+
+        Random rolls (escape, Rogue crits) come from rng. If only a
+        battle_id is given, the battle gets its own generator seeded from
+        it, which makes the battle replayable; with neither, the shared
+        random module is used.
+        """
+        if rng is None and battle_id is not None:
+            rng = make_battle_rng(battle_id)
         self.character = character
         self.enemy = enemy
+        self.policy = policy if policy is not None else basic_attack_policy
+        self.fast_path = fast_path
+        self.rng = rng if rng is not None else random
+        self.battle_id = battle_id
+        self.predicted = False
         self.combat_active = True
         self.turn_count = 0
-    
-    def start_battle(self):
+        self.winner = None
+        self.actions = []
+        self.initial_state = None
+        self.scheduler = AbilityScheduler()
+        self.events = BattleLog(enemy.get("name", "enemy"))
+        if battle_id is not None:
+            self.events.metadata["battle_id"] = battle_id
+
+    def run(self):
         """
-        Start the combat loop
-        
+        Fight until one side falls or the player escapes
+
         Returns: Dictionary with battle results:
-                {'winner': 'player'|'enemy', 'xp_gained': int, 'gold_gained': int}
-        
+                {'winner': 'player'|'enemy'|None, 'xp_gained': int,
+                 'gold_gained': int, 'turns': int}
+                winner is None when the player escaped
+
+        Raises: CharacterDeadError if character is already dead
+        """
+        self.begin()
+
+        if self.fast_path and self.policy is basic_attack_policy:
+            return self.resolve_predicted()
+
+        while self.combat_active:
+            self.step()
+
+        self.combat_active = False
+        return self.get_result()
+
+    def step(self, action=None):
+        """
+        Play one full turn: scheduled effects, the player, then the enemy
+
+        Lets a caller that gathers actions itself (such as a game session
+        waiting on a network player) drive the battle one turn at a time.
+
+        Returns: Winner ('player'|'enemy') if the battle ended this turn, else None
+        Raises: CombatNotActiveError if the battle is not running
+        """
+        if not self.combat_active:
+            raise CombatNotActiveError("Combat is not active.")
+        self.turn_count += 1
+
+        self.process_scheduled_effects()
+        winner = self.check_battle_end()
+        if winner is not None:
+            return winner
+
+        self.player_turn(action)
+        winner = self.check_battle_end()
+        if winner is not None or not self.combat_active:
+            return winner
+
+        self.enemy_turn()
+        return self.check_battle_end()
+
+    def resolve_predicted(self):
+        """
+        Finish a basic-attack-only battle using the closed-form prediction
+
+        Only the start and end events are recorded.
+
+        Returns: Battle results dictionary (see run)
+        """
+        prediction = predict_battle(self.character, self.enemy)
+        self.character["health"] = prediction["health"]
+        self.enemy["health"] = prediction["enemy_health"]
+        self.turn_count = prediction["turns"]
+        self.predicted = True
+        self.check_battle_end()
+        self.combat_active = False
+        return self.get_result()
+
+    def begin(self):
+        """
+        Mark the battle as started
+
         Raises: CharacterDeadError if character is already dead
         """
-        # TODO: Implement battle loop
-        # Check character isn't dead
-        # Loop until someone dies
-        # Award XP and gold if player wins
         if self.character.get("health", 0) <= 0:
             raise CharacterDeadError("Character is already dead and cannot fight.")
-        
+
+        # Older saves can still carry the old one-use-ever cooldown flag
+        self.character.pop("_special_on_cooldown", None)
+        register_class_abilities(self.scheduler, self.character)
+
+        if self.battle_id is not None:
+            # Snapshot the starting state so the battle can be replayed
+            self.initial_state = {
+                "character": copy.deepcopy(self.character),
+                "enemy": copy.deepcopy(self.enemy)
+            }
+
         self.combat_active = True
-        display_battle_log("Battle begins!")
-        display_combat_stats(self.character, self.enemy)
-        
-        while self.combat_active:
-            self.turn_count += 1
-            
-            # Player turn
-            self.player_turn()
-            winner = self.check_battle_end()
-            if winner is not None:
-                break
-            
-            # Enemy turn
-            self.enemy_turn()
-            winner = self.check_battle_end()
-            if winner is not None:
-                break
-        
-        self.combat_active = False
-        
-        xp_gained = 0
-        gold_gained = 0
-        
-        if winner == "player":
-            rewards = get_victory_rewards(self.enemy)
-            xp_gained = rewards["xp"]
-            gold_gained = rewards["gold"]
-        else:
-            xp_gained = 0
-            gold_gained = 0
-        
-        return {"winner": winner, "xp_gained": xp_gained, "gold_gained": gold_gained}
-    
-    def player_turn(self):
+        self.record_event("battle", "start", 0, self.character.get("health", 0))
+
+    def player_turn(self, action=None):
         """
-        Handle player's turn
-        
-        Displays options:
-        1. Basic Attack
-        2. Special Ability (if available)
-        3. Try to Run
-        
+        Execute the player's action (asks the policy if none is given)
+
         Raises: CombatNotActiveError if called outside of battle
         """
-        # TODO: Implement player turn
-        # Check combat is active
-        # Display options
-        # Get player choice
-        # Execute chosen action
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
-        
-        # For automated tests, we don't rely on player input,
-        # but for interactive use we offer choices.
-        print("\nYour turn:")
-        print("1. Basic Attack")
-        print("2. Special Ability")
-        print("3. Try to Run")
-        
-        try:
-            choice = input("Choose an action (1-3): ")
-        except EOFError:
-            # In non-interactive/testing environments, default to basic attack
-            choice = "1"
-        
-        if choice == "2":
-            result = use_special_ability(self.character, self.enemy)
-            display_battle_log(result)
-        elif choice == "3":
-            if self.attempt_escape():
-                display_battle_log("You successfully escaped!")
+
+        if action is None:
+            action = self.policy(self)
+        self.actions.append(action)
+
+        if action == ACTION_SPECIAL:
+            try:
+                ability, amount = perform_special_ability(self.character, self.enemy, self.rng,
+                                                          self.scheduler, self.turn_count)
+            except AbilityOnCooldownError:
+                # Fall back to a basic attack instead of losing the turn
+                self.record_event("player", "cooldown", 0, self.enemy.get("health", 0))
+                self.player_attack()
                 return
+            if ability == "heal":
+                self.record_event("player", ability, amount, self.character.get("health", 0))
             else:
-                display_battle_log("You failed to escape!")
+                self.record_event("player", ability, amount, self.enemy.get("health", 0))
+        elif action == ACTION_ESCAPE:
+            if self.attempt_escape():
+                self.record_event("player", "escape", 0, self.character.get("health", 0))
+            else:
+                self.record_event("player", "escape_failed", 0, self.character.get("health", 0))
         else:
-            damage = self.calculate_damage(self.character, self.enemy)
-            self.apply_damage(self.enemy, damage)
-            display_battle_log(f"You attack the {self.enemy['name']} for {damage} damage!")
-        
-        display_combat_stats(self.character, self.enemy)
-    
+            self.player_attack()
+
+    def player_attack(self):
+        """Resolve a basic attack against the enemy"""
+        damage = self.calculate_damage(self.character, self.enemy)
+        self.apply_damage(self.enemy, damage)
+        self.record_event("player", "attack", damage, self.enemy["health"])
+
     def enemy_turn(self):
         """
         Handle enemy's turn - simple AI
-        
+
         Enemy always attacks
-        
+
         Raises: CombatNotActiveError if called outside of battle
         """
-        # TODO: Implement enemy turn
-        # Check combat is active
-        # Calculate damage
-        # Apply to character
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
-        
+
         damage = self.calculate_damage(self.enemy, self.character)
         self.apply_damage(self.character, damage)
-        display_battle_log(f"{self.enemy['name']} attacks you for {damage} damage!")
-        display_combat_stats(self.character, self.enemy)
-    
+        self.record_event("enemy", "attack", damage, self.character["health"])
+
+    def process_scheduled_effects(self):
+        """
+        Run the scheduler for the current turn
+
+        Damage-over-time ticks and effect expiries are recorded as events.
+        """
+        for kind, effect, amount in self.scheduler.advance(self.turn_count):
+            target = effect["target"]
+            actor = "player" if target is self.character else "enemy"
+            self.record_event(actor, "effect_" + kind, amount, target.get("health", 0))
+
     def calculate_damage(self, attacker, defender):
         """
         Calculate damage from attack
-        
+
         Damage formula: attacker['strength'] - (defender['strength'] // 4)
         Minimum damage: 1
-        
+
         Returns: Integer damage amount
         """
-        # TODO: Implement damage calculation
-        attacker_strength = attacker.get("strength", 0)
-        defender_strength = defender.get("strength", 0)
-        damage = attacker_strength - (defender_strength // 4)
-        if damage < 1:
-            damage = 1
-        return damage
-    
+        return calculate_damage(attacker, defender)
+
     def apply_damage(self, target, damage):
         """
         Apply damage to a character or enemy
-        
+
         Reduces health, prevents negative health
         """
-        # TODO: Implement damage application
-        current_health = target.get("health", 0)
-        new_health = current_health - damage
-        if new_health < 0:
-            new_health = 0
-        target["health"] = new_health
-    
+        apply_damage(target, damage)
+
     def check_battle_end(self):
         """
         Check if battle is over
-        
+
         Returns: 'player' if enemy dead, 'enemy' if character dead, None if ongoing
         """
-        # TODO: Implement battle end check
         if self.enemy.get("health", 0) <= 0:
             self.combat_active = False
-            display_battle_log(f"You have defeated the {self.enemy['name']}!")
+            self.winner = "player"
+            self.record_event("battle", "victory", 0, 0)
+            metrics.record_battle(self.winner, self.turn_count)
             return "player"
         if self.character.get("health", 0) <= 0:
             self.combat_active = False
-            display_battle_log("You have been defeated...")
+            self.winner = "enemy"
+            self.record_event("battle", "defeat", 0, 0)
+            metrics.record_battle(self.winner, self.turn_count)
             return "enemy"
         return None
-    
+
     def attempt_escape(self):
         """
         Try to escape from battle
-        
+
         50% success chance
-        
+
         Returns: True if escaped, False if failed
         """
-        # TODO: Implement escape attempt
-        # Use random number or simple calculation
-        # If successful, set combat_active to False
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.combat_active = False
+            metrics.record_battle(None, self.turn_count)
             return True
         return False
 
+    def get_replay_record(self):
+        """
+        Describe a finished battle well enough to re-run it exactly
+
+        Returns: Dictionary with battle_id, starting character and enemy,
+                 the player's actions and whether the fast path was used
+        Raises: CombatNotActiveError if the battle has no battle_id or
+                was never started
+        """
+        if self.initial_state is None:
+            raise CombatNotActiveError("Only started battles with a battle_id can be replayed.")
+        return {
+            "battle_id": self.battle_id,
+            "character": copy.deepcopy(self.initial_state["character"]),
+            "enemy": copy.deepcopy(self.initial_state["enemy"]),
+            "actions": list(self.actions),
+            "predicted": self.predicted
+        }
+
+    def record_event(self, actor, action, amount, target_health):
+        """Append one event tuple to the battle's event log"""
+        self.events.record(self.turn_count, actor, action, amount, target_health)
+
+    def get_result(self):
+        """
+        Summarize the finished battle
+
+        Returns: Battle results dictionary (see run)
+        """
+        xp_gained = 0
+        gold_gained = 0
+        if self.winner == "player":
+            rewards = get_victory_rewards(self.enemy)
+            xp_gained = rewards["xp"]
+            gold_gained = rewards["gold"]
+
+        return {
+            "winner": self.winner,
+            "xp_gained": xp_gained,
+            "gold_gained": gold_gained,
+            "turns": self.turn_count
+        }
+
+class BattleLog:
+    """
+    Buffer of compact battle events
+
+    Events are stored as plain tuples (turn, actor, action, amount,
+    target_health); text is only produced when render() is called, and the
+    whole battle can be written out as JSON lines for replay or analysis.
+    """
+
+    def __init__(self, enemy_name="enemy", metadata=None):
+        """Create an empty log for a battle against enemy_name"""
+        self.enemy_name = enemy_name
+        self.metadata = metadata if metadata is not None else {}
+        self.events = []
+
+    def record(self, turn, actor, action, amount, target_health):
+        """Append one event"""
+        self.events.append((turn, actor, action, amount, target_health))
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __getitem__(self, index):
+        return self.events[index]
+
+    def render(self, start=0):
+        """
+        Format events as readable messages
+
+        Args:
+            start: Index of the first event to render
+
+        Returns: List of strings
+        """
+        messages = []
+        for event in self.events[start:]:
+            messages.append(format_battle_event(event, self.enemy_name))
+        return messages
+
+    def render_text(self):
+        """Return the whole battle as one block of text"""
+        return "\n".join(self.render())
+
+    def to_jsonl(self):
+        """
+        Serialize the log as JSON lines
+
+        The first line holds the battle metadata, then one line per event.
+
+        Returns: String ending with a newline
+        """
+        header = dict(self.metadata)
+        header["type"] = "battle"
+        header["enemy_name"] = self.enemy_name
+        lines = [json.dumps(header)]
+        for turn, actor, action, amount, target_health in self.events:
+            lines.append(json.dumps({
+                "type": "event",
+                "turn": turn,
+                "actor": actor,
+                "action": action,
+                "amount": amount,
+                "target_health": target_health
+            }))
+        return "\n".join(lines) + "\n"
+
+    def write_jsonl(self, filename, mode="a"):
+        """
+        Write the log to a JSON lines file (appends by default, so many
+        battles can share one file)
+        """
+        with open(filename, mode) as f:
+            f.write(self.to_jsonl())
+
+def parse_battle_logs(lines):
+    """
+    Rebuild BattleLog objects from JSON lines
+
+    Args:
+        lines: Iterable of JSON strings as written by BattleLog.to_jsonl
+
+    Returns: List of BattleLog objects
+    Raises: InvalidDataFormatError if a line is not a battle log record
+    """
+    logs = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            raise InvalidDataFormatError(f"Invalid battle log line: {line}")
+        record_type = record.pop("type", None)
+        if record_type == "battle":
+            enemy_name = record.pop("enemy_name", "enemy")
+            logs.append(BattleLog(enemy_name, record))
+        elif record_type == "event" and logs:
+            logs[-1].record(record["turn"], record["actor"], record["action"],
+                            record["amount"], record["target_health"])
+        else:
+            raise InvalidDataFormatError(f"Unexpected battle log record: {line}")
+    return logs
+
+def read_battle_logs(filename):
+    """
+    Load every battle stored in a JSON lines file
+
+    Returns: List of BattleLog objects
+    Raises: MissingDataFileError if the file does not exist
+    """
+    try:
+        with open(filename, "r") as f:
+            return parse_battle_logs(f)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Battle log file not found: {filename}")
+
+def predict_battle(character, enemy):
+    """
+    Predict a battle where both sides only use basic attacks
+
+    Damage per hit never changes, so each side needs
+    ceil(opponent_health / damage) hits and the player, who strikes first,
+    wins ties.
+
+    Returns: Dictionary with 'winner' ('player'|'enemy'), 'turns',
+             'health' (character) and 'enemy_health' after the battle
+    """
+    health = character.get("health", 0)
+    enemy_health = enemy.get("health", 0)
+    player_damage = calculate_damage(character, enemy)
+    enemy_damage = calculate_damage(enemy, character)
+
+    # The player always swings at least once, even at a dead enemy
+    player_hits = max(1, -(-enemy_health // player_damage))
+    enemy_hits = -(-health // enemy_damage)
+
+    if player_hits <= enemy_hits:
+        return {
+            "winner": "player",
+            "turns": player_hits,
+            "health": health - (player_hits - 1) * enemy_damage,
+            "enemy_health": 0
+        }
+    return {
+        "winner": "enemy",
+        "turns": enemy_hits,
+        "health": 0,
+        "enemy_health": enemy_health - enemy_hits * player_damage
+    }
+
+def predict_battles(pairs):
+    """
+    Predict many basic-attack battles
+
+    Args:
+        pairs: Iterable of (character, enemy) tuples
+
+    Returns: List of prediction dictionaries (see predict_battle)
+    """
+    return [predict_battle(character, enemy) for character, enemy in pairs]
+
+def make_battle_rng(battle_id):
+    """
+    Create the random generator for one battle
+
+    The same battle_id (int or string) always gives the same sequence.
+
+    Returns: random.Random instance
+    """
+    return random.Random(f"battle:{battle_id}")
+
+def make_scripted_policy(actions):
+    """
+    Action policy that replays a recorded list of actions in order
+
+    Basic attacks are used once the list runs out.
+    """
+    remaining = iter(list(actions))
+
+    def scripted_policy(battle):
+        return next(remaining, ACTION_ATTACK)
+
+    return scripted_policy
+
+def replay_battle(record, fast_path=None):
+    """
+    Re-run a battle from its replay record
+
+    Args:
+        record: Dictionary from BattleEngine.get_replay_record()
+        fast_path: Override the original fast path setting; pass False to
+                   re-run a predicted battle through the full turn loop
+
+    Returns: The finished BattleEngine (results via get_result(), events
+             via .events)
+    """
+    if fast_path is None:
+        fast_path = record["predicted"]
+    if record["predicted"]:
+        policy = basic_attack_policy
+    else:
+        policy = make_scripted_policy(record["actions"])
+
+    engine = BattleEngine(copy.deepcopy(record["character"]), copy.deepcopy(record["enemy"]),
+                          policy, fast_path=fast_path, battle_id=record["battle_id"])
+    engine.run()
+    return engine
+
+class SimpleBattle(BattleEngine):
+    """
+    Simple turn-based combat system
+
+    Console front-end over BattleEngine: asks the player for actions and
+    prints each event as it happens.
+    """
+
+    def __init__(self, character, enemy, policy=None, fast_path=True,
+                 rng=None, battle_id=None):
+        """Initialize battle with character and enemy"""
+        if policy is None:
+            policy = prompt_player_action
+        super().__init__(character, enemy, policy, fast_path, rng, battle_id)
+        self._shown_events = 0
+
+    def start_battle(self):
+        """
+        Start the combat loop
+
+        Returns: Dictionary with battle results:
+                {'winner': 'player'|'enemy'|None, 'xp_gained': int, 'gold_gained': int}
+
+        Raises: CharacterDeadError if character is already dead
+        """
+        return self.run()
+
+    def begin(self):
+        """Start the battle and show the opening status"""
+        super().begin()
+        self._show_new_events(show_stats=True)
+
+    def player_turn(self, action=None):
+        """
+        Handle player's turn
+
+        Displays options:
+        1. Basic Attack
+        2. Special Ability (if available)
+        3. Try to Run
+
+        Raises: CombatNotActiveError if called outside of battle
+        """
+        super().player_turn(action)
+        self._show_new_events(show_stats=True)
+
+    def enemy_turn(self):
+        """
+        Handle enemy's turn - simple AI
+
+        Raises: CombatNotActiveError if called outside of battle
+        """
+        super().enemy_turn()
+        self._show_new_events(show_stats=True)
+
+    def check_battle_end(self):
+        """
+        Check if battle is over
+
+        Returns: 'player' if enemy dead, 'enemy' if character dead, None if ongoing
+        """
+        winner = super().check_battle_end()
+        self._show_new_events()
+        return winner
+
+    def _show_new_events(self, show_stats=False):
+        """Print events recorded since the last call"""
+        for message in self.events.render(self._shown_events):
+            display_battle_log(message)
+        self._shown_events = len(self.events)
+        if show_stats:
+            display_combat_stats(self.character, self.enemy)
+
 # ============================================================================
 # SPECIAL ABILITIES
 # ============================================================================
 
-def use_special_ability(character, enemy):
+def use_special_ability(character, enemy, rng=None, scheduler=None, turn=0):
     """
     Use character's class-specific special ability
     
@@ -311,40 +832,51 @@ def use_special_ability(character, enemy):
     - Cleric: Heal (restore 30 health)
     
     Returns: String describing what happened
-    Raises: AbilityOnCooldownError if ability was used recently
-    """
-    # TODO: Implement special abilities
-    # Check character class
-    # Execute appropriate ability
-    # Track cooldowns (optional advanced feature)
-    # Simple cooldown example: one use per battle stored on character
-    if character.get("_special_on_cooldown"):
-        raise AbilityOnCooldownError("Special ability is on cooldown.")
-    
+    Raises: AbilityOnCooldownError if a scheduler is given and the ability
+            is still cooling down (never without a scheduler)
+    """
+    ability, amount = perform_special_ability(character, enemy, rng, scheduler, turn)
+    return BATTLE_EVENT_MESSAGES[("player", ability)].format(amount=amount, enemy=enemy.get("name"))
+
+def perform_special_ability(character, enemy, rng=None, scheduler=None, turn=0):
+    """
+    Apply character's class-specific special ability
+
+    Random rolls come from rng (defaults to the random module). Cooldowns
+    are tracked by the battle's AbilityScheduler when one is given; without
+    a scheduler the ability is always available.
+
+    Returns: Tuple (ability, amount) where ability is one of
+             'power_strike', 'fireball', 'critical_strike', 'rogue_strike',
+             'heal' or 'fizzle' and amount is the damage dealt or health restored
+    Raises: AbilityOnCooldownError if a scheduler is given and the ability
+            is still cooling down (never without a scheduler)
+    """
+    if scheduler is not None:
+        scheduler.trigger(character, SPECIAL_ABILITY, turn)
+
     char_class = character.get("class", "")
-    result = ""
     
     if char_class == "Warrior":
-        damage = warrior_power_strike(character, enemy)
-        result = f"Warrior Power Strike deals {damage} damage!"
+        ability = "power_strike"
+        amount = warrior_power_strike(character, enemy)
     elif char_class == "Mage":
-        damage = mage_fireball(character, enemy)
-        result = f"Mage Fireball deals {damage} damage!"
+        ability = "fireball"
+        amount = mage_fireball(character, enemy)
     elif char_class == "Rogue":
-        damage, crit = rogue_critical_strike(character, enemy)
+        amount, crit = rogue_critical_strike(character, enemy, rng)
         if crit:
-            result = f"Rogue Critical Strike lands for {damage} critical damage!"
+            ability = "critical_strike"
         else:
-            result = f"Rogue attack deals {damage} damage."
+            ability = "rogue_strike"
     elif char_class == "Cleric":
-        healed = cleric_heal(character)
-        result = f"Cleric Heal restores {healed} health."
+        ability = "heal"
+        amount = cleric_heal(character)
     else:
-        result = "Nothing happens..."
-    
-    # Put on cooldown for remainder of current battle
-    character["_special_on_cooldown"] = True
-    return result
+        ability = "fizzle"
+        amount = 0
+
+    return ability, amount
 
 def warrior_power_strike(character, enemy):
     """Warrior special ability"""
@@ -365,12 +897,14 @@ def mage_fireball(character, enemy):
     enemy["health"] = max(0, enemy.get("health", 0) - damage)
     return damage
 
-def rogue_critical_strike(character, enemy):
+def rogue_critical_strike(character, enemy, rng=None):
     """Rogue special ability"""
     # TODO: Implement critical strike
     # 50% chance for triple damage
+    if rng is None:
+        rng = random
     strength = character.get("strength", 0)
-    crit = random.random() < 0.5
+    crit = rng.random() < 0.5
     if crit:
         damage = strength * 3
     else:
@@ -406,6 +940,43 @@ def can_character_fight(character):
     # We only track health here; battle state is managed by SimpleBattle
     return character.get("health", 0) > 0
 
+def calculate_damage(attacker, defender):
+    """
+    Calculate basic attack damage
+
+    Damage formula: attacker['strength'] - (defender['strength'] // 4)
+    Minimum damage: 1
+
+    Returns: Integer damage amount
+    """
+    damage = attacker.get("strength", 0) - (defender.get("strength", 0) // 4)
+    if damage < 1:
+        damage = 1
+    return damage
+
+def apply_damage(target, damage):
+    """
+    Apply damage to a character or enemy
+
+    Reduces health, prevents negative health
+    """
+    new_health = target.get("health", 0) - damage
+    if new_health < 0:
+        new_health = 0
+    target["health"] = new_health
+
+def format_battle_event(event, enemy_name="enemy"):
+    """
+    Turn a battle event tuple into a readable message
+
+    Returns: String message
+    """
+    turn, actor, action, amount, target_health = event
+    template = BATTLE_EVENT_MESSAGES.get((actor, action))
+    if template is None:
+        return f"{actor} {action} {amount}"
+    return template.format(amount=amount, enemy=enemy_name)
+
 def get_victory_rewards(enemy):
     """
     Calculate rewards for defeating enemy
@@ -424,9 +995,16 @@ def display_combat_stats(character, enemy):
     Shows both character and enemy health/stats
     """
     # TODO: Implement status display
-    print(f"\n{character['name']}: HP={character['health']}/{character['max_health']}")
-    print(f"{enemy['name']}: HP={enemy['health']}/{enemy['max_health']}")
-    pass
+    print(format_combat_stats(character, enemy))
+
+def format_combat_stats(character, enemy):
+    """
+    Format current combat status
+
+    Returns: String with both health lines
+    """
+    return (f"\n{character['name']}: HP={character['health']}/{character['max_health']}\n"
+            f"{enemy['name']}: HP={enemy['health']}/{enemy['max_health']}")
 
 def display_battle_log(message):
     """
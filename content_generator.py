@@ -0,0 +1,364 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Content Generator Module
+
+This module generates synthetic game content for scale testing: quest
+catalogs with deep and wide prerequisite trees, item catalogs of any size
+and mix, and populations of saved characters with inventories and quest
+histories that make sense for their level. Everything is deterministic for
+a given seed and passes the game's own validators.
+"""
+
+import os
+import random
+
+import character_manager
+import game_data
+import inventory_system
+import quest_handler
+
+# How quest required levels are drawn
+#   uniform: any level up to max_level
+#   low:     most quests near level 1, a long tail of high-level ones
+#   depth:   levels rise steadily along each prerequisite chain
+LEVEL_DISTRIBUTIONS = ("uniform", "low", "depth")
+
+# Default share of each item type
+DEFAULT_ITEM_MIX = {"weapon": 0.3, "armor": 0.3, "consumable": 0.4}
+
+# Stat each item type modifies and the range of its bonus
+ITEM_EFFECTS = {
+    "weapon": ("strength", 2, 25),
+    "armor": ("max_health", 5, 60),
+    "consumable": ("health", 10, 100)
+}
+
+CHARACTER_CLASSES = ("Warrior", "Mage", "Rogue", "Cleric")
+
+QUEST_VERBS = ("Rescue", "Escort", "Defend", "Explore", "Recover", "Hunt", "Scout", "Cleanse")
+QUEST_PLACES = ("the Village", "the Old Mill", "the Crypt", "the Pass", "the Marsh",
+                "the Tower", "the Mines", "the Harbor")
+ITEM_MATERIALS = ("Wooden", "Iron", "Steel", "Silver", "Mythril", "Dragonbone")
+ITEM_NAMES = {
+    "weapon": ("Sword", "Axe", "Staff", "Dagger", "Mace", "Bow"),
+    "armor": ("Shield", "Helm", "Chainmail", "Cloak", "Gauntlets", "Greaves"),
+    "consumable": ("Potion", "Elixir", "Tonic", "Draught", "Salve", "Ration")
+}
+
+# ============================================================================
+# QUESTS
+# ============================================================================
+
+def generate_quests(count, seed=0, roots=1, max_depth=None, chain_bias=0.5,
+                    level_distribution="depth", max_level=50):
+    """
+    Generate a quest catalog whose prerequisites form a forest
+
+    Each quest has at most one prerequisite (as in quests.txt), so the
+    prerequisite graph is a set of trees. Quests are generated in an order
+    where every prerequisite comes first.
+
+    Args:
+        count: Number of quests
+        seed: Random seed
+        roots: Number of quests with no prerequisite (width of the forest)
+        max_depth: Longest allowed prerequisite chain (None = unlimited)
+        chain_bias: Chance that a quest extends the newest quest instead of
+                    branching off a random one (high = deep, low = wide)
+        level_distribution: One of LEVEL_DISTRIBUTIONS
+        max_level: Highest required level
+
+    Returns: Dictionary of quest_id -> quest dictionary (load_quests format)
+    Raises: ValueError for an unknown level distribution or bad sizes
+    """
+    if level_distribution not in LEVEL_DISTRIBUTIONS:
+        raise ValueError(f"Unknown level distribution: {level_distribution}")
+    if count < 0 or roots < 1 or max_level < 1:
+        raise ValueError("count must be >= 0, roots and max_level must be >= 1")
+
+    rng = random.Random(seed)
+    quests = {}
+    depths = {}
+    # Quests that can still take a child without exceeding max_depth
+    open_parents = []
+
+    for i in range(count):
+        quest_id = f"quest_{i:06d}"
+        parent = None
+        if i >= roots and open_parents:
+            if rng.random() < chain_bias:
+                parent = open_parents[-1]
+            else:
+                parent = open_parents[rng.randrange(len(open_parents))]
+
+        depth = 0 if parent is None else depths[parent] + 1
+        parent_level = 1 if parent is None else quests[parent]["required_level"]
+        level = _draw_level(rng, level_distribution, max_level, parent_level)
+
+        quests[quest_id] = {
+            "quest_id": quest_id,
+            "title": f"{rng.choice(QUEST_VERBS)} {rng.choice(QUEST_PLACES)} {i}",
+            "description": f"Generated quest at depth {depth}",
+            "reward_xp": 25 * level + rng.randint(0, 50),
+            "reward_gold": 10 * level + rng.randint(0, 25),
+            "required_level": level,
+            "prerequisite": parent
+        }
+        depths[quest_id] = depth
+        if max_depth is None or depth + 1 < max_depth:
+            open_parents.append(quest_id)
+    return quests
+
+def _draw_level(rng, distribution, max_level, parent_level):
+    """Draw a required level that is never below the prerequisite's level"""
+    if distribution == "uniform":
+        level = rng.randint(1, max_level)
+    elif distribution == "low":
+        level = 1 + int((max_level - 1) * rng.random() ** 3)
+    else:
+        level = parent_level + rng.randint(0, 2)
+    return min(max(level, parent_level), max_level)
+
+def get_quest_depths(quest_data_dict):
+    """
+    Get the prerequisite chain depth of every quest (roots are depth 0)
+
+    Returns: Dictionary of quest_id -> depth
+    """
+    graph = quest_handler.build_quest_graph(quest_data_dict)
+    return dict(graph["depth"])
+
+# ============================================================================
+# ITEMS
+# ============================================================================
+
+def generate_items(count, seed=0, mix=None):
+    """
+    Generate an item catalog with a weapon/armor/consumable mix
+
+    Args:
+        count: Number of items
+        seed: Random seed
+        mix: Dictionary of item type -> share (defaults to DEFAULT_ITEM_MIX)
+
+    Returns: Dictionary of item_id -> item dictionary (load_items format)
+    Raises: ValueError if the mix names an unknown type or has no weight
+    """
+    if mix is None:
+        mix = DEFAULT_ITEM_MIX
+    for item_type in mix:
+        if item_type not in ITEM_EFFECTS:
+            raise ValueError(f"Unknown item type in mix: {item_type}")
+    types = [item_type for item_type in mix if mix[item_type] > 0]
+    if not types:
+        raise ValueError("Item mix needs at least one type with a positive share")
+    weights = [mix[item_type] for item_type in types]
+
+    rng = random.Random(seed)
+    items = {}
+    for i in range(count):
+        item_type = rng.choices(types, weights)[0]
+        stat, low, high = ITEM_EFFECTS[item_type]
+        value = rng.randint(low, high)
+        material = rng.choice(ITEM_MATERIALS)
+        noun = rng.choice(ITEM_NAMES[item_type])
+        item_id = f"item_{i:06d}"
+        items[item_id] = {
+            "item_id": item_id,
+            "name": f"{material} {noun}",
+            "type": item_type,
+            "effect": {stat: value},
+            "cost": value * rng.randint(3, 8),
+            "description": f"Generated {item_type} ({stat} +{value})"
+        }
+    return items
+
+# ============================================================================
+# CHARACTERS
+# ============================================================================
+
+def generate_population(count, quest_data_dict, item_data_dict, seed=0,
+                        max_level=None, completion_rate=0.7, name_prefix="Player"):
+    """
+    Generate characters with believable progress through the given catalogs
+
+    Each character's completed quests respect prerequisites and required
+    levels, active quests are ones it could really have accepted, and its
+    inventory (at most MAX_INVENTORY_SIZE items) comes from the item catalog.
+
+    Args:
+        count: Number of characters
+        quest_data_dict: Quest catalog
+        item_data_dict: Item catalog
+        seed: Random seed
+        max_level: Highest character level (defaults to the highest
+                   required level in the quest catalog, at least 1)
+        completion_rate: Chance of having completed each eligible quest
+        name_prefix: Character names are prefix + number
+
+    Returns: List of character dictionaries
+    """
+    rng = random.Random(seed)
+    if max_level is None:
+        max_level = max([q["required_level"] for q in quest_data_dict.values()] + [1])
+
+    quest_order = _prerequisite_order(quest_data_dict)
+    item_ids = list(item_data_dict)
+    consumables = [i for i in item_ids if item_data_dict[i]["type"] == "consumable"]
+
+    characters = []
+    for i in range(count):
+        character = character_manager.create_character(
+            f"{name_prefix}{i:06d}", rng.choice(CHARACTER_CLASSES))
+        level = 1 + int((max_level - 1) * rng.random() ** 2)
+        while character["level"] < level:
+            character_manager.gain_experience(character, character["level"] * 100)
+        character["experience"] = rng.randint(0, character["level"] * 100 - 1)
+        character["health"] = rng.randint(1, character["max_health"])
+        character["gold"] = rng.randint(0, 200 * character["level"])
+
+        completed = set()
+        completed_list = []
+        for quest_id in quest_order:
+            quest = quest_data_dict[quest_id]
+            prerequisite = quest.get("prerequisite")
+            if quest["required_level"] > character["level"]:
+                continue
+            if prerequisite is not None and prerequisite not in completed:
+                continue
+            if rng.random() < completion_rate:
+                completed.add(quest_id)
+                completed_list.append(quest_id)
+        character["completed_quests"] = completed_list
+
+        available = [q for q in quest_order
+                     if q not in completed
+                     and quest_data_dict[q]["required_level"] <= character["level"]
+                     and (quest_data_dict[q].get("prerequisite") is None
+                          or quest_data_dict[q]["prerequisite"] in completed)]
+        active_count = min(len(available), rng.randint(0, 3))
+        character["active_quests"] = rng.sample(available, active_count)
+
+        inventory = []
+        if item_ids:
+            size = rng.randint(0, inventory_system.MAX_INVENTORY_SIZE)
+            while len(inventory) < size:
+                if consumables and rng.random() < 0.4:
+                    # Potions stack up in real inventories
+                    inventory.extend([rng.choice(consumables)] * rng.randint(1, 3))
+                else:
+                    inventory.append(rng.choice(item_ids))
+            inventory = inventory[:size]
+        character["inventory"] = inventory
+
+        characters.append(character)
+    return characters
+
+def _prerequisite_order(quest_data_dict):
+    """
+    Order quest IDs so every prerequisite comes before its dependants
+
+    Returns: List of quest IDs
+    """
+    graph = quest_handler.build_quest_graph(quest_data_dict)
+    depth = graph["depth"]
+    return sorted(quest_data_dict, key=lambda quest_id: depth[quest_id])
+
+# ============================================================================
+# WRITING FILES
+# ============================================================================
+
+def write_quest_file(quest_data_dict, filename):
+    """Write a quest catalog in the quests.txt format"""
+    with open(filename, "w") as f:
+        for quest in quest_data_dict.values():
+            prerequisite = quest.get("prerequisite") or "NONE"
+            f.write(f"QUEST_ID: {quest['quest_id']}\n"
+                    f"TITLE: {quest['title']}\n"
+                    f"DESCRIPTION: {quest['description']}\n"
+                    f"REWARD_XP: {quest['reward_xp']}\n"
+                    f"REWARD_GOLD: {quest['reward_gold']}\n"
+                    f"REQUIRED_LEVEL: {quest['required_level']}\n"
+                    f"PREREQUISITE: {prerequisite}\n\n")
+
+def write_item_file(item_data_dict, filename):
+    """Write an item catalog in the items.txt format"""
+    with open(filename, "w") as f:
+        for item in item_data_dict.values():
+            effect = item["effect"]
+            if isinstance(effect, dict):
+                effect = ",".join(f"{stat}:{value}" for stat, value in effect.items())
+            f.write(f"ITEM_ID: {item['item_id']}\n"
+                    f"NAME: {item['name']}\n"
+                    f"TYPE: {item['type']}\n"
+                    f"EFFECT: {effect}\n"
+                    f"COST: {item['cost']}\n"
+                    f"DESCRIPTION: {item['description']}\n\n")
+
+def write_population(characters, save_directory):
+    """Save every character to save_directory"""
+    for character in characters:
+        character_manager.save_character(character, save_directory)
+
+def generate_content(output_directory, quest_count=1000, item_count=500, character_count=100,
+                     seed=0, **quest_options):
+    """
+    Generate and write a complete content set
+
+    Writes quests.txt, items.txt and save_games/ under output_directory.
+    Extra keyword arguments are passed to generate_quests.
+
+    Returns: Dictionary with quests, items, characters (counts) and paths
+    """
+    quests = generate_quests(quest_count, seed, **quest_options)
+    items = generate_items(item_count, seed)
+    characters = generate_population(character_count, quests, items, seed)
+
+    os.makedirs(output_directory, exist_ok=True)
+    quest_file = os.path.join(output_directory, "quests.txt")
+    item_file = os.path.join(output_directory, "items.txt")
+    save_directory = os.path.join(output_directory, "save_games")
+    write_quest_file(quests, quest_file)
+    write_item_file(items, item_file)
+    write_population(characters, save_directory)
+
+    return {
+        "quests": len(quests),
+        "items": len(items),
+        "characters": len(characters),
+        "quest_file": quest_file,
+        "item_file": item_file,
+        "save_directory": save_directory
+    }
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+def validate_content(quest_data_dict, item_data_dict, characters=()):
+    """
+    Run the game's validators over generated content
+
+    Returns: True if everything is valid
+    Raises: InvalidDataFormatError, QuestNotFoundError or
+            InvalidSaveDataError from the first invalid record
+    """
+    for quest in quest_data_dict.values():
+        game_data.validate_quest_data(quest)
+    quest_handler.validate_quest_prerequisites(quest_data_dict)
+    for item in item_data_dict.values():
+        game_data.validate_item_data(item)
+    for character in characters:
+        character_manager.validate_character_data(character)
+    return True
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== CONTENT GENERATOR TEST ===")
+
+    # summary = generate_content("generated", quest_count=100000, item_count=10000,
+    #                            character_count=1000, seed=163, chain_bias=0.9)
+    # print(summary)
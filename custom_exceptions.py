@@ -55,6 +55,10 @@ class InvalidCharacterClassError(CharacterError):
     """Raised when an invalid character class is specified"""
     pass
 
+class InvalidCharacterNameError(CharacterError):
+    """Raised when a character name cannot be used as a save file name"""
+    pass
+
 class CharacterNotFoundError(CharacterError):
     """Raised when trying to load a character that doesn't exist"""
     pass
@@ -0,0 +1,308 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Encounter System Module
+
+This module runs group fights: a party of N characters against M enemies.
+Turn order comes from a priority queue keyed by (round, initiative), each
+side focuses fire on its first living opponent, and per-side alive counters
+end the fight the moment one side is wiped out. Damage and class abilities
+are the same ones combat_system uses for one-on-one battles.
+"""
+
+import heapq
+import random
+
+import metrics
+from custom_exceptions import (
+    CharacterDeadError,
+    InvalidTargetError,
+    AbilityOnCooldownError
+)
+
+from ability_scheduler import AbilityScheduler, SPECIAL_ABILITY, register_class_abilities
+from combat_system import (
+    ACTION_ATTACK,
+    ACTION_SPECIAL,
+    calculate_damage,
+    apply_damage,
+    perform_special_ability,
+    get_victory_rewards
+)
+
+ALLIES = "allies"
+ENEMIES = "enemies"
+
+# ============================================================================
+# ENCOUNTER POLICIES
+# ============================================================================
+
+def attack_policy(encounter, ally):
+    """Encounter policy where every ally always uses a basic attack"""
+    return ACTION_ATTACK
+
+def special_when_ready_policy(encounter, ally):
+    """Encounter policy that uses each ally's special whenever it is off cooldown"""
+    if encounter.scheduler.is_ready(ally, SPECIAL_ABILITY, encounter.round):
+        return ACTION_SPECIAL
+    return ACTION_ATTACK
+
+# ============================================================================
+# ENCOUNTER ENGINE
+# ============================================================================
+
+class Encounter:
+    """
+    Headless fight between a party of allies and a group of enemies
+
+    Allies and enemies are the usual character/enemy dictionaries and are
+    modified in place. Each one must be its own dictionary (create_enemy
+    already returns a fresh copy). Events are kept as tuples
+    (round, actor, action, target, amount, target_health).
+    """
+
+    def __init__(self, allies, enemies, policy=None, rng=None, record_events=True):
+        """
+        Set up an encounter
+
+        Args:
+            allies: List of character dictionaries
+            enemies: List of enemy dictionaries
+            policy: Callable (encounter, ally) -> action for the allies
+                    (defaults to attack_policy; enemies always attack)
+            rng: Random generator for ability rolls (defaults to random)
+            record_events: Keep a per-action event list (turn off for
+                           very large simulations)
+        """
+        self.sides = {ALLIES: list(allies), ENEMIES: list(enemies)}
+        self.policy = policy if policy is not None else attack_policy
+        self.rng = rng if rng is not None else random
+        self.record_events = record_events
+        self.scheduler = AbilityScheduler()
+        self.round = 0
+        self.winner = None
+        self.events = []
+        self.alive = {ALLIES: 0, ENEMIES: 0}
+        self.labels = {}
+        self._side_of = {}
+        self._fallen = set()
+        self._target_cursor = {ALLIES: 0, ENEMIES: 0}
+        self._queue = []
+
+    def run(self):
+        """
+        Fight until one side has nobody left standing
+
+        Returns: Dictionary with encounter results (see get_result)
+        Raises:
+            CharacterDeadError if no ally is able to fight
+            InvalidTargetError if there are no living enemies
+        """
+        self.begin()
+        queue = self._queue
+
+        while self.alive[ALLIES] > 0 and self.alive[ENEMIES] > 0:
+            turn, initiative, order, side, combatant = heapq.heappop(queue)
+
+            if turn > self.round:
+                self.round = turn
+                self.process_scheduled_effects()
+                if self.alive[ALLIES] == 0 or self.alive[ENEMIES] == 0:
+                    break
+
+            if combatant.get("health", 0) <= 0:
+                # Fallen combatants simply drop out of the queue
+                continue
+
+            self.take_turn(side, combatant)
+            heapq.heappush(queue, (turn + 1, initiative, order, side, combatant))
+
+        if self.alive[ENEMIES] == 0:
+            self.winner = ALLIES
+        elif self.alive[ALLIES] == 0:
+            self.winner = ENEMIES
+        metrics.record_battle("player" if self.winner == ALLIES else "enemy", self.round)
+        return self.get_result()
+
+    def begin(self):
+        """
+        Build the initiative queue and alive counters
+
+        Raises:
+            CharacterDeadError if no ally is able to fight
+            InvalidTargetError if there are no living enemies
+        """
+        order = 0
+        for side in (ALLIES, ENEMIES):
+            members = self.sides[side]
+            counts = {}
+            for combatant in members:
+                name = combatant.get("name", side)
+                counts[name] = counts.get(name, 0) + 1
+
+            seen = {}
+            for combatant in members:
+                name = combatant.get("name", side)
+                seen[name] = seen.get(name, 0) + 1
+                if counts[name] > 1:
+                    name = f"{name} {seen[name]}"
+                self.labels[id(combatant)] = name
+                self._side_of[id(combatant)] = side
+
+                if side == ALLIES:
+                    combatant.pop("_special_on_cooldown", None)
+                    register_class_abilities(self.scheduler, combatant)
+
+                if combatant.get("health", 0) > 0:
+                    self.alive[side] += 1
+                    self._queue.append((1, -get_initiative(combatant), order, side, combatant))
+                order += 1
+
+        if self.alive[ALLIES] == 0:
+            raise CharacterDeadError("No one in the party is able to fight.")
+        if self.alive[ENEMIES] == 0:
+            raise InvalidTargetError("The encounter has no enemies to fight.")
+        heapq.heapify(self._queue)
+
+    def take_turn(self, side, combatant):
+        """Resolve one combatant's action against the opposing side"""
+        opposing = ENEMIES if side == ALLIES else ALLIES
+        target = self.select_target(opposing)
+
+        action = ACTION_ATTACK
+        if side == ALLIES:
+            action = self.policy(self, combatant)
+
+        if action == ACTION_SPECIAL:
+            try:
+                ability, amount = perform_special_ability(combatant, target, self.rng,
+                                                          self.scheduler, self.round)
+            except AbilityOnCooldownError:
+                ability = None
+            if ability == "heal":
+                self.record(combatant, ability, combatant, amount)
+                return
+            if ability is not None:
+                self.record(combatant, ability, target, amount)
+                self._check_defeated(opposing, target)
+                return
+
+        damage = calculate_damage(combatant, target)
+        apply_damage(target, damage)
+        self.record(combatant, ACTION_ATTACK, target, damage)
+        self._check_defeated(opposing, target)
+
+    def select_target(self, side):
+        """
+        Get the combatant a side is currently focusing on
+
+        The cursor only ever moves forward past fallen combatants, so
+        picking a target is O(1) amortized over the whole encounter.
+
+        Returns: First living combatant on that side, or None
+        """
+        members = self.sides[side]
+        cursor = self._target_cursor[side]
+        while cursor < len(members) and members[cursor].get("health", 0) <= 0:
+            cursor += 1
+        self._target_cursor[side] = cursor
+        if cursor < len(members):
+            return members[cursor]
+        return None
+
+    def process_scheduled_effects(self):
+        """Apply damage over time and expiries due at the start of a round"""
+        for kind, effect, amount in self.scheduler.advance(self.round):
+            target = effect["target"]
+            self.record(target, "effect_" + kind, target, amount)
+            if kind == "tick":
+                self._check_defeated(self._side_of[id(target)], target)
+
+    def record(self, actor, action, target, amount):
+        """Append one event tuple (skipped when record_events is off)"""
+        if self.record_events:
+            self.events.append((self.round, self.labels[id(actor)], action,
+                                self.labels[id(target)], amount, target.get("health", 0)))
+
+    def get_result(self):
+        """
+        Summarize the finished encounter
+
+        Returns: Dictionary with:
+                - winner: 'allies', 'enemies' or None
+                - rounds: rounds fought
+                - xp_gained, gold_gained: rewards for every enemy (allies win only)
+                - allies_alive, enemies_alive: survivors on each side
+        """
+        xp_gained = 0
+        gold_gained = 0
+        if self.winner == ALLIES:
+            for enemy in self.sides[ENEMIES]:
+                rewards = get_victory_rewards(enemy)
+                xp_gained += rewards["xp"]
+                gold_gained += rewards["gold"]
+
+        return {
+            "winner": self.winner,
+            "rounds": self.round,
+            "xp_gained": xp_gained,
+            "gold_gained": gold_gained,
+            "allies_alive": self.alive[ALLIES],
+            "enemies_alive": self.alive[ENEMIES]
+        }
+
+    def _check_defeated(self, side, combatant):
+        """Update the side's alive counter if the combatant just fell"""
+        if combatant.get("health", 0) <= 0 and id(combatant) not in self._fallen:
+            self._fallen.add(id(combatant))
+            self.alive[side] -= 1
+            self.record(combatant, "defeated", combatant, 0)
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def get_initiative(combatant):
+    """
+    Get a combatant's initiative (higher acts first in each round)
+
+    Uses an explicit 'initiative' value if present, otherwise strength.
+    Ties go to allies, then to whoever was listed first.
+
+    Returns: Integer initiative
+    """
+    return combatant.get("initiative", combatant.get("strength", 0))
+
+def format_encounter_event(event):
+    """
+    Turn an encounter event tuple into a readable message
+
+    Returns: String message
+    """
+    turn, actor, action, target, amount, target_health = event
+    if action == ACTION_ATTACK:
+        return f"{actor} attacks {target} for {amount} damage!"
+    if action == "heal":
+        return f"{actor} heals for {amount} health."
+    if action == "defeated":
+        return f"{actor} has fallen!"
+    if action == "effect_tick":
+        return f"{target} takes {amount} damage over time."
+    if action == "effect_expire":
+        return f"An effect on {target} wears off."
+    return f"{actor} uses {action.replace('_', ' ')} on {target} for {amount} damage!"
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== ENCOUNTER SYSTEM TEST ===")
+
+    # import character_manager, combat_system
+    # party = [character_manager.create_character(f"Hero{i}", cls)
+    #          for i, cls in enumerate(["Warrior", "Mage", "Rogue", "Cleric", "Warrior"])]
+    # horde = [combat_system.create_enemy("goblin") for _ in range(20)]
+    # encounter = Encounter(party, horde, special_when_ready_policy)
+    # print(encounter.run())
+    # for event in encounter.events[:10]:
+    #     print(format_encounter_event(event))
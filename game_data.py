@@ -10,17 +10,93 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import sys
+from types import MappingProxyType
+
+import metrics
+
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
+from catalog_views import ItemViews
+from record_schema import Field, RecordSchema
+
+# ============================================================================
+# RECORD SCHEMAS
+# ============================================================================
+
+def _parse_prerequisite(value):
+    """PREREQUISITE value: None for NONE, otherwise the (interned) quest id"""
+    if value.upper() == "NONE":
+        return None
+    return sys.intern(value)
+
+def _parse_effect(value):
+    """
+    EFFECT value 'stat_name:value' as {stat_name: int value}
+
+    A non-numeric value is kept as a string, and text without a colon is
+    kept whole as {'raw': text}.
+    """
+    stat_name, found, stat_value = value.partition(":")
+    if not found:
+        return {"raw": value}
+    stat_value = stat_value.strip()
+    try:
+        return {stat_name.strip(): int(stat_value)}
+    except ValueError:
+        return {stat_name.strip(): stat_value}
+
+def _parse_max_level(value):
+    """MAX_LEVEL value: None for NONE (no upper limit), otherwise an int"""
+    if value.upper() == "NONE":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise InvalidDataFormatError("MAX_LEVEL must be an integer or NONE")
+
+QUEST_SCHEMA = RecordSchema("quest", [
+    Field("QUEST_ID", "quest_id", sys.intern),
+    Field("TITLE", "title"),
+    Field("DESCRIPTION", "description"),
+    Field("REWARD_XP", "reward_xp", int, int),
+    Field("REWARD_GOLD", "reward_gold", int, int),
+    Field("REQUIRED_LEVEL", "required_level", int, int),
+    Field("PREREQUISITE", "prerequisite", _parse_prerequisite, None)
+])
+
+ITEM_SCHEMA = RecordSchema("item", [
+    Field("ITEM_ID", "item_id", sys.intern),
+    Field("NAME", "name"),
+    Field("TYPE", "type", str.lower, choices=("weapon", "armor", "consumable")),
+    Field("EFFECT", "effect", _parse_effect, None),
+    Field("COST", "cost", int, int),
+    Field("DESCRIPTION", "description")
+])
+
+# MAX_LEVEL is an int or None, so its type is checked by validate_enemy_data
+ENEMY_SCHEMA = RecordSchema("enemy", [
+    Field("ENEMY_ID", "enemy_id", str.lower),
+    Field("NAME", "name"),
+    Field("HEALTH", "health", int, int),
+    Field("STRENGTH", "strength", int, int),
+    Field("MAGIC", "magic", int, int),
+    Field("XP_REWARD", "xp_reward", int, int),
+    Field("GOLD_REWARD", "gold_reward", int, int),
+    Field("MIN_LEVEL", "min_level", int, int),
+    Field("MAX_LEVEL", "max_level", _parse_max_level, None),
+    Field("SPAWN_WEIGHT", "spawn_weight", int, int)
+])
 
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+@metrics.track_loads("quests")
+def load_quests(filename="data/quests.txt", collect_errors=False):
     """
     Load quest data from file
     
@@ -33,57 +109,30 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
-    Returns: Dictionary of quests {quest_id: quest_data_dict}
+    Args:
+        filename: Quest data file
+        collect_errors: Skip invalid quests instead of stopping at the
+                        first one, and also return their errors
+    
+    Returns: Dictionary of quests {quest_id: quest_data_dict}, or
+             (quests, errors) with collect_errors (see _load_records)
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            (InvalidDataFormatError only without collect_errors)
     """
     # TODO: Implement this function
     # Must handle:
     # - FileNotFoundError → raise MissingDataFileError
     # - Invalid format → raise InvalidDataFormatError
     # - Corrupted/unreadable data → raise CorruptedDataError
-    try:
-        with open(filename, "r") as file:
-            lines = file.readlines()
-    except FileNotFoundError:
-        raise MissingDataFileError(f"Quest data file not found: {filename}")
-    except OSError as e:
-        # Problems opening the file (permissions, etc.)
-        raise CorruptedDataError(f"Error opening quest data file: {e}")
-
-    quests = {}
-    block = []
-
-    try:
-        for raw_line in lines:
-            line = raw_line.strip()
-            if line == "":
-                if block:
-                    quest_dict = parse_quest_block(block)
-                    validate_quest_data(quest_dict)
-                    quest_id = quest_dict["quest_id"]
-                    quests[quest_id] = quest_dict
-                    block = []
-            else:
-                block.append(line)
-
-        # Handle last block if file doesn't end with a blank line
-        if block:
-            quest_dict = parse_quest_block(block)
-            validate_quest_data(quest_dict)
-            quest_id = quest_dict["quest_id"]
-            quests[quest_id] = quest_dict
-
-    except InvalidDataFormatError:
-        # Let this bubble up as-is for invalid formatting
-        raise
-    except Exception as e:
-        # Any unexpected parsing problems count as corrupted data
-        raise CorruptedDataError(f"Error parsing quest data: {e}")
-
+    errors = [] if collect_errors else None
+    quests = _load_records(filename, QUEST_SCHEMA, "quest", errors)
+    if collect_errors:
+        return quests, errors
     return quests
 
 
-def load_items(filename="data/items.txt"):
+@metrics.track_loads("items")
+def load_items(filename="data/items.txt", collect_errors=False):
     """
     Load item data from file
     
@@ -95,47 +144,66 @@ def load_items(filename="data/items.txt"):
     COST: 100
     DESCRIPTION: Item description
     
-    Returns: Dictionary of items {item_id: item_data_dict}
+    Args:
+        filename: Item data file
+        collect_errors: Skip invalid items instead of stopping at the
+                        first one, and also return their errors
+    
+    Returns: Dictionary of items {item_id: item_data_dict}, or
+             (items, errors) with collect_errors (see _load_records)
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            (InvalidDataFormatError only without collect_errors)
     """
     # TODO: Implement this function
     # Must handle same exceptions as load_quests
-    try:
-        with open(filename, "r") as file:
-            lines = file.readlines()
-    except FileNotFoundError:
-        raise MissingDataFileError(f"Item data file not found: {filename}")
-    except OSError as e:
-        raise CorruptedDataError(f"Error opening item data file: {e}")
+    errors = [] if collect_errors else None
+    items = _load_records(filename, ITEM_SCHEMA, "item", errors)
+    if collect_errors:
+        return items, errors
+    return items
 
-    items = {}
-    block = []
 
-    try:
-        for raw_line in lines:
-            line = raw_line.strip()
-            if line == "":
-                if block:
-                    item_dict = parse_item_block(block)
-                    validate_item_data(item_dict)
-                    item_id = item_dict["item_id"]
-                    items[item_id] = item_dict
-                    block = []
-            else:
-                block.append(line)
+def format_load_error(error):
+    """
+    Format a collect_errors error dictionary as one line
 
-        if block:
-            item_dict = parse_item_block(block)
-            validate_item_data(item_dict)
-            item_id = item_dict["item_id"]
-            items[item_id] = item_dict
+    Returns: String like 'data/quests.txt:12 [quest_id]: message'
+    """
+    block_id = error["block_id"] if error["block_id"] is not None else "?"
+    return f"{error['file']}:{error['line']} [{block_id}]: {error['message']}"
 
-    except InvalidDataFormatError:
-        raise
-    except Exception as e:
-        raise CorruptedDataError(f"Error parsing item data: {e}")
 
-    return items
+def load_enemies(filename="data/enemies.txt", collect_errors=False):
+    """
+    Load enemy data from file
+    
+    Expected format per enemy (separated by blank lines):
+    ENEMY_ID: unique_enemy_name
+    NAME: Enemy Display Name
+    HEALTH: 50
+    STRENGTH: 8
+    MAGIC: 2
+    XP_REWARD: 25
+    GOLD_REWARD: 10
+    MIN_LEVEL: 1
+    MAX_LEVEL: 2 (or NONE for no upper limit)
+    SPAWN_WEIGHT: 1
+    
+    Args:
+        filename: Enemy data file
+        collect_errors: Skip invalid enemies instead of stopping at the
+                        first one, and also return their errors
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}, or
+             (enemies, errors) with collect_errors (see _load_records)
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            (InvalidDataFormatError only without collect_errors)
+    """
+    errors = [] if collect_errors else None
+    enemies = _load_records(filename, ENEMY_SCHEMA, "enemy", errors, _check_enemy_values)
+    if collect_errors:
+        return enemies, errors
+    return enemies
 
 
 def validate_quest_data(quest_dict):
@@ -148,31 +216,7 @@ def validate_quest_data(quest_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields
     """
-    # TODO: Implement validation
-    # Check that all required keys exist
-    # Check that numeric values are actually numbers
-    required_fields = [
-        "quest_id",
-        "title",
-        "description",
-        "reward_xp",
-        "reward_gold",
-        "required_level",
-        "prerequisite"
-    ]
-
-    for field in required_fields:
-        if field not in quest_dict:
-            raise InvalidDataFormatError(f"Missing required quest field: {field}")
-
-    # Check numeric types
-    for numeric_field in ["reward_xp", "reward_gold", "required_level"]:
-        if not isinstance(quest_dict[numeric_field], int):
-            raise InvalidDataFormatError(
-                f"Quest field '{numeric_field}' must be an integer"
-            )
-
-    return True
+    return QUEST_SCHEMA.validate(quest_dict)
 
 
 def validate_item_data(item_dict):
@@ -185,29 +229,24 @@ def validate_item_data(item_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
-    # TODO: Implement validation
-    required_fields = [
-        "item_id",
-        "name",
-        "type",
-        "effect",
-        "cost",
-        "description"
-    ]
+    return ITEM_SCHEMA.validate(item_dict)
 
-    for field in required_fields:
-        if field not in item_dict:
-            raise InvalidDataFormatError(f"Missing required item field: {field}")
 
-    valid_types = ["weapon", "armor", "consumable"]
-    item_type = item_dict["type"]
-    if item_type not in valid_types:
-        raise InvalidDataFormatError(f"Invalid item type: {item_type}")
-
-    if not isinstance(item_dict["cost"], int):
-        raise InvalidDataFormatError("Item field 'cost' must be an integer")
-
-    return True
+def validate_enemy_data(enemy_dict):
+    """
+    Validate that enemy dictionary has all required fields
+    
+    Required fields: enemy_id, name, health, strength, magic, xp_reward,
+                    gold_reward, min_level, max_level, spawn_weight
+    
+    Returns: True if valid
+    Raises: InvalidDataFormatError if missing fields or invalid values
+    """
+    ENEMY_SCHEMA.validate(enemy_dict)
+    max_level = enemy_dict["max_level"]
+    if max_level is not None and not isinstance(max_level, int):
+        raise InvalidDataFormatError("Enemy field 'max_level' must be an integer or NONE")
+    return _check_enemy_values(enemy_dict)
 
 
 def create_default_data_files():
@@ -222,6 +261,7 @@ def create_default_data_files():
     data_dir = "data"
     quests_path = os.path.join(data_dir, "quests.txt")
     items_path = os.path.join(data_dir, "items.txt")
+    enemies_path = os.path.join(data_dir, "enemies.txt")
 
     try:
         if not os.path.exists(data_dir):
@@ -272,14 +312,229 @@ def create_default_data_files():
                     "COST: 10\n"
                     "DESCRIPTION: Restores a small amount of health.\n"
                 )
+
+        if not os.path.exists(enemies_path):
+            with open(enemies_path, "w") as efile:
+                efile.write(
+                    "ENEMY_ID: goblin\n"
+                    "NAME: Goblin\n"
+                    "HEALTH: 50\n"
+                    "STRENGTH: 8\n"
+                    "MAGIC: 2\n"
+                    "XP_REWARD: 25\n"
+                    "GOLD_REWARD: 10\n"
+                    "MIN_LEVEL: 1\n"
+                    "MAX_LEVEL: 2\n"
+                    "SPAWN_WEIGHT: 1\n"
+                    "\n"
+                    "ENEMY_ID: orc\n"
+                    "NAME: Orc\n"
+                    "HEALTH: 80\n"
+                    "STRENGTH: 12\n"
+                    "MAGIC: 5\n"
+                    "XP_REWARD: 50\n"
+                    "GOLD_REWARD: 25\n"
+                    "MIN_LEVEL: 3\n"
+                    "MAX_LEVEL: 5\n"
+                    "SPAWN_WEIGHT: 1\n"
+                    "\n"
+                    "ENEMY_ID: dragon\n"
+                    "NAME: Dragon\n"
+                    "HEALTH: 200\n"
+                    "STRENGTH: 25\n"
+                    "MAGIC: 15\n"
+                    "XP_REWARD: 200\n"
+                    "GOLD_REWARD: 100\n"
+                    "MIN_LEVEL: 6\n"
+                    "MAX_LEVEL: NONE\n"
+                    "SPAWN_WEIGHT: 1\n"
+                )
     except OSError as e:
         # Any file creation issues count as corruption/setup problems
         raise CorruptedDataError(f"Error creating default data files: {e}")
 
+# ============================================================================
+# SHARED CATALOG
+# ============================================================================
+
+class GameCatalog:
+    """
+    Quest and item data shared by every game session in a process
+
+    quests and items are read-only views, so a session can look things up
+    but never change the catalog another player is using.
+
+    Either table can be given as a loader function instead of a dictionary;
+    it is then loaded on first access. A failed load raises to the caller
+    and is retried on the next access.
+
+    item_views holds the shop/inventory views of the item table; they are
+    built once, since the tables never change after loading (a new
+    catalog gets new views).
+    """
+
+    __slots__ = ("_quests", "_items", "_quest_loader", "_item_loader", "_item_views")
+
+    def __init__(self, quests=None, items=None, quest_loader=None, item_loader=None):
+        """Wrap loaded quest and item dictionaries (or loaders for them)"""
+        self._quests = None if quests is None else MappingProxyType(quests)
+        self._items = None if items is None else MappingProxyType(items)
+        self._quest_loader = quest_loader
+        self._item_loader = item_loader
+        self._item_views = None
+
+    @property
+    def quests(self):
+        """Read-only quest table (loaded on first access if lazy)"""
+        if self._quests is None:
+            self._quests = MappingProxyType(self._quest_loader() if self._quest_loader else {})
+        return self._quests
+
+    @property
+    def items(self):
+        """Read-only item table (loaded on first access if lazy)"""
+        if self._items is None:
+            self._items = MappingProxyType(self._item_loader() if self._item_loader else {})
+        return self._items
+
+    @property
+    def item_views(self):
+        """Precomputed ItemViews of the item table (loads items if lazy)"""
+        if self._item_views is None:
+            self._item_views = ItemViews(self.items)
+        return self._item_views
+
+    @property
+    def quests_loaded(self):
+        """True once the quest table has been loaded"""
+        return self._quests is not None
+
+    @property
+    def items_loaded(self):
+        """True once the item table has been loaded"""
+        return self._items is not None
+
+def load_catalog(quest_file="data/quests.txt", item_file="data/items.txt", lazy=False):
+    """
+    Load quests and items into one shared catalog
+
+    Args:
+        quest_file: Quest data file
+        item_file: Item data file
+        lazy: Defer reading each file until its table is first used
+
+    Returns: GameCatalog
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            (from the first access instead when lazy)
+    """
+    if lazy:
+        return GameCatalog(quest_loader=lambda: load_quests(quest_file),
+                           item_loader=lambda: load_items(item_file))
+    return GameCatalog(load_quests(quest_file), load_items(item_file))
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _load_records(filename, schema, record_name, errors=None, check=None):
+    """
+    Stream a data file of blank-line separated records through a schema
+
+    The file is read line by line, so only one block is held at a time.
+    The record id is the schema's first field.
+
+    Args:
+        filename: Data file
+        schema: RecordSchema for one record
+        record_name: 'quest', 'item' or 'enemy' (used in messages)
+        errors: None to raise on the first invalid record, or a list that
+                receives one error dictionary per invalid record instead:
+                {'file', 'line', 'block_id', 'message'} ('line' is 1-based,
+                'block_id' is None if the block has no readable id)
+        check: Optional function run on each parsed record for rules that
+               span fields; it raises the schema's error class
+
+    Returns: Dictionary {record_id: record_dict} of the valid records
+    Raises: MissingDataFileError, CorruptedDataError, and
+            InvalidDataFormatError when errors is None
+    """
+    try:
+        file = open(filename, "r")
+    except FileNotFoundError:
+        raise MissingDataFileError(f"{record_name.capitalize()} data file not found: {filename}")
+    except OSError as e:
+        # Problems opening the file (permissions, etc.)
+        raise CorruptedDataError(f"Error opening {record_name} data file: {e}")
+
+    records = {}
+    id_name = schema.fields[0].name
+    parse = schema.parse
+
+    def add_block(block, first_line):
+        if errors is None:
+            record = parse(block)
+            if check is not None:
+                check(record)
+        else:
+            try:
+                record = parse(block)
+                if check is not None:
+                    check(record)
+            except schema.error_class as e:
+                errors.append(_block_error(filename, schema, block, first_line, e))
+                return
+        records[record[id_name]] = record
+
+    block = []
+    first_line = 0
+    with file:
+        try:
+            for line_number, raw_line in enumerate(file, 1):
+                line = raw_line.strip()
+                if line:
+                    if not block:
+                        first_line = line_number
+                    block.append(line)
+                elif block:
+                    add_block(block, first_line)
+                    block = []
+
+            # Handle last block if file doesn't end with a blank line
+            if block:
+                add_block(block, first_line)
+
+        except InvalidDataFormatError:
+            # Let this bubble up as-is for invalid formatting
+            raise
+        except Exception as e:
+            # Any unexpected parsing problems count as corrupted data
+            raise CorruptedDataError(f"Error parsing {record_name} data: {e}")
+
+    return records
+
+def _block_error(filename, schema, block, first_line, error):
+    """
+    Describe an invalid block for collect_errors loading
+
+    The line is the offending line when one can be found, otherwise
+    (e.g. a missing field) the first line of the block.
+
+    Returns: Error dictionary {'file', 'line', 'block_id', 'message'}
+    """
+    index = schema.find_error_line(block)
+    # Lines in a block are consecutive, so the index is an offset
+    line = first_line + (index or 0)
+
+    id_key = schema.fields[0].key
+    block_id = None
+    for text in block:
+        key, found, value = text.partition(":")
+        if found and key.strip().upper() == id_key:
+            block_id = value.strip() or None
+            break
+
+    return {"file": filename, "line": line, "block_id": block_id, "message": str(error)}
+
 def parse_quest_block(lines):
     """
     Parse a block of lines into a quest dictionary
@@ -290,50 +545,7 @@ def parse_quest_block(lines):
     Returns: Dictionary with quest data
     Raises: InvalidDataFormatError if parsing fails
     """
-    # TODO: Implement parsing logic
-    # Split each line on ": " to get key-value pairs
-    # Convert numeric strings to integers
-    # Handle parsing errors gracefully
-    quest = {}
-
-    for line in lines:
-        if ": " not in line:
-            raise InvalidDataFormatError(f"Invalid quest line format: {line}")
-        key, value = line.split(": ", 1)
-        key = key.strip().upper()
-        value = value.strip()
-
-        if key == "QUEST_ID":
-            quest["quest_id"] = value
-        elif key == "TITLE":
-            quest["title"] = value
-        elif key == "DESCRIPTION":
-            quest["description"] = value
-        elif key == "REWARD_XP":
-            try:
-                quest["reward_xp"] = int(value)
-            except ValueError:
-                raise InvalidDataFormatError("REWARD_XP must be an integer")
-        elif key == "REWARD_GOLD":
-            try:
-                quest["reward_gold"] = int(value)
-            except ValueError:
-                raise InvalidDataFormatError("REWARD_GOLD must be an integer")
-        elif key == "REQUIRED_LEVEL":
-            try:
-                quest["required_level"] = int(value)
-            except ValueError:
-                raise InvalidDataFormatError("REQUIRED_LEVEL must be an integer")
-        elif key == "PREREQUISITE":
-            if value.upper() == "NONE":
-                quest["prerequisite"] = None
-            else:
-                quest["prerequisite"] = value
-        else:
-            # Unknown key – ignore or treat as invalid. We'll be strict:
-            raise InvalidDataFormatError(f"Unknown quest field: {key}")
-
-    return quest
+    return QUEST_SCHEMA.parse(lines, validate=False)
 
 
 def parse_item_block(lines):
@@ -346,50 +558,38 @@ def parse_item_block(lines):
     Returns: Dictionary with item data
     Raises: InvalidDataFormatError if parsing fails
     """
-    # TODO: Implement parsing logic
-    item = {}
-
-    for line in lines:
-        if ": " not in line:
-            raise InvalidDataFormatError(f"Invalid item line format: {line}")
-        key, value = line.split(": ", 1)
-        key = key.strip().upper()
-        value = value.strip()
-
-        if key == "ITEM_ID":
-            item["item_id"] = value
-        elif key == "NAME":
-            item["name"] = value
-        elif key == "TYPE":
-            item["type"] = value.lower()
-        elif key == "EFFECT":
-            # EFFECT: stat_name:value
-            effect_str = value
-            if ":" in effect_str:
-                stat_name, stat_value = effect_str.split(":", 1)
-                stat_name = stat_name.strip()
-                stat_value_str = stat_value.strip()
-                # Try to convert numeric portion to int
-                try:
-                    stat_value_int = int(stat_value_str)
-                    item["effect"] = {stat_name: stat_value_int}
-                except ValueError:
-                    # If not numeric, just store as string
-                    item["effect"] = {stat_name: stat_value_str}
-            else:
-                # If format is unexpected, treat whole thing as a raw effect string
-                item["effect"] = {"raw": effect_str}
-        elif key == "COST":
-            try:
-                item["cost"] = int(value)
-            except ValueError:
-                raise InvalidDataFormatError("COST must be an integer")
-        elif key == "DESCRIPTION":
-            item["description"] = value
-        else:
-            raise InvalidDataFormatError(f"Unknown item field: {key}")
+    return ITEM_SCHEMA.parse(lines, validate=False)
+
+def parse_enemy_block(lines):
+    """
+    Parse a block of lines into an enemy dictionary
+    
+    Args:
+        lines: List of strings representing one enemy
+    
+    Returns: Dictionary with enemy data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    return ENEMY_SCHEMA.parse(lines, validate=False)
+
+def _check_enemy_values(enemy):
+    """
+    Rules the enemy schema cannot express field by field
 
-    return item
+    Returns: True if valid
+    Raises: InvalidDataFormatError for MAX_LEVEL below MIN_LEVEL, health
+            that is not positive or a negative spawn weight
+    """
+    max_level = enemy["max_level"]
+    if max_level is not None and max_level < enemy["min_level"]:
+        raise InvalidDataFormatError(
+            f"Enemy '{enemy['enemy_id']}' has MAX_LEVEL below MIN_LEVEL"
+        )
+    if enemy["health"] <= 0:
+        raise InvalidDataFormatError("Enemy field 'health' must be positive")
+    if enemy["spawn_weight"] < 0:
+        raise InvalidDataFormatError("Enemy field 'spawn_weight' cannot be negative")
+    return True
 
 # ============================================================================
 # TESTING
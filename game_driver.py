@@ -0,0 +1,146 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Game Driver Module
+
+This module plays the full game headlessly from a script of menu answers.
+The script is fed to a GameSession exactly as a player would type it, with
+console output discarded (or captured) and saving configurable, and the
+run reports how many actions per second the whole game loop handled.
+
+Script files are JSON (a list of answers), CSV (every cell, row by row)
+or plain text (one answer per line).
+"""
+
+import csv
+import json
+import os
+import random
+import time
+
+import character_manager
+import game_data
+from main import GameSession, run_session_flow, DEFAULT_SAVE_DIRECTORY
+
+# How saves are handled during a run
+SAVE_MODES = ("disk", "off")
+
+# ============================================================================
+# SCRIPT LOADING
+# ============================================================================
+
+def load_script(filename):
+    """
+    Load a list of answers from a JSON, CSV or text file
+
+    Returns: List of answer strings
+    Raises:
+        FileNotFoundError if the file does not exist
+        ValueError if a JSON script is not a list
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    with open(filename, "r", encoding="utf-8", newline="") as f:
+        if extension == ".json":
+            data = json.load(f)
+            if not isinstance(data, list):
+                raise ValueError("JSON script must be a list of answers")
+            return [str(answer) for answer in data]
+        if extension == ".csv":
+            answers = []
+            for row in csv.reader(f):
+                for cell in row:
+                    if cell.strip():
+                        answers.append(cell.strip())
+            return answers
+        return [line.rstrip("\r\n") for line in f]
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def run_script(answers, catalog=None, save_directory=DEFAULT_SAVE_DIRECTORY,
+               save_mode="disk", autosave=True, seed=None, capture=False):
+    """
+    Play the game from the main menu using scripted answers
+
+    Args:
+        answers: List of answer strings, one per prompt
+        catalog: Shared GameCatalog (loaded from data/ if not given)
+        save_directory: Where characters are saved when save_mode is 'disk'
+        save_mode: 'disk' to really save, 'off' to skip every save
+        autosave: Save after every game menu action
+        seed: Seed for encounters and battles (None = shared random module)
+        capture: Keep the game's output in the report
+
+    When the answers run out the game sees end of input, which saves and
+    quits back out of every menu.
+
+    Returns: Dictionary with actions, prompts, saves, skipped_saves,
+             output_lines, seconds, actions_per_second and (if capture)
+             transcript
+    Raises: ValueError if save_mode is unknown
+    """
+    if save_mode not in SAVE_MODES:
+        raise ValueError(f"Unknown save mode: {save_mode}")
+    if catalog is None:
+        catalog = game_data.load_catalog()
+
+    counts = {"actions": 0, "prompts": 0, "saves": 0, "skipped_saves": 0, "output_lines": 0}
+    transcript = []
+    script = iter(answers)
+
+    def read(prompt):
+        counts["prompts"] += 1
+        try:
+            answer = next(script)
+        except StopIteration:
+            raise EOFError
+        counts["actions"] += 1
+        return answer
+
+    def write(text):
+        counts["output_lines"] += 1
+        if capture:
+            transcript.append(text)
+
+    def call(request):
+        if request.func is character_manager.save_character:
+            if save_mode == "off":
+                counts["skipped_saves"] += 1
+                return None
+            counts["saves"] += 1
+        return request.run()
+
+    rng = random.Random(seed) if seed is not None else None
+    session = GameSession(catalog, save_directory, write, autosave=autosave, rng=rng)
+
+    start = time.perf_counter()
+    run_session_flow(session.play(), read, call)
+    seconds = time.perf_counter() - start
+
+    report = dict(counts)
+    report["seconds"] = seconds
+    report["actions_per_second"] = counts["actions"] / seconds if seconds > 0 else 0.0
+    if capture:
+        report["transcript"] = transcript
+    return report
+
+def format_report(report):
+    """
+    Format a driver report as one summary line
+
+    Returns: String
+    """
+    return (f"{report['actions']} actions in {report['seconds']:.3f}s "
+            f"({report['actions_per_second']:.0f} actions/sec), "
+            f"{report['saves']} saves, {report['skipped_saves']} skipped saves")
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== GAME DRIVER TEST ===")
+
+    # answers = ["1", "Bench", "Warrior"] + ["1", "3", "2", "7", "5", "3"] * 1000 + ["6", "3"]
+    # print(format_report(run_script(answers, save_mode="off", seed=1)))
+    # print(format_report(run_script(load_script("my_script.json"))))
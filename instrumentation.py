@@ -0,0 +1,264 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Instrumentation Module
+
+This module is an opt-in profiler for the game modules. When enabled it
+replaces the public functions of character_manager, inventory_system,
+quest_handler, combat_system and game_data with timing wrappers that count
+calls and exceptions and keep recent latencies for p50/p99. When it is not
+enabled nothing is wrapped, so there is no overhead at all.
+
+Turn it on with the QUEST_PROFILE=1 environment variable or the --profile
+command line flag (see enable_from_environment); the report is printed at
+exit, on dump_report(), or on SIGUSR1 where the platform has it.
+"""
+
+import atexit
+import functools
+import importlib
+import os
+import sys
+import time
+from types import FunctionType
+
+# Environment variable and command line flag that switch profiling on
+ENV_VAR = "QUEST_PROFILE"
+CLI_FLAG = "--profile"
+
+INSTRUMENTED_MODULES = (
+    "character_manager",
+    "inventory_system",
+    "quest_handler",
+    "combat_system",
+    "game_data"
+)
+
+# Tiny per-turn callbacks compared by identity inside the combat engine
+EXCLUDED_FUNCTIONS = {"basic_attack_policy", "special_first_policy"}
+
+# Latency samples kept per function (the most recent calls)
+SAMPLE_SIZE = 4096
+
+_state = {"enabled": False, "originals": {}, "stats": {}, "exit_hook": False}
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+class FunctionStats:
+    """Call count, errors and latency for one instrumented function"""
+
+    __slots__ = ("name", "calls", "errors", "total", "samples", "exceptions")
+
+    def __init__(self, name):
+        """Start empty stats for a 'module.function' name"""
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.samples = []
+        self.exceptions = {}
+
+    def record(self, seconds):
+        """Record one call's duration (older samples are overwritten)"""
+        if len(self.samples) < SAMPLE_SIZE:
+            self.samples.append(seconds)
+        else:
+            self.samples[self.calls % SAMPLE_SIZE] = seconds
+        self.calls += 1
+        self.total += seconds
+
+    def record_error(self, error):
+        """Count an exception by class name"""
+        self.errors += 1
+        name = type(error).__name__
+        self.exceptions[name] = self.exceptions.get(name, 0) + 1
+
+    def summary(self):
+        """
+        Summarize the stats
+
+        Returns: Dictionary with name, calls, errors, exceptions, total_ms,
+                 mean_us, p50_us, p99_us
+        """
+        ordered = sorted(self.samples)
+        p50 = p99 = 0.0
+        if ordered:
+            p50 = ordered[len(ordered) // 2]
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "exceptions": dict(self.exceptions),
+            "total_ms": self.total * 1e3,
+            "mean_us": self.total / self.calls * 1e6 if self.calls else 0.0,
+            "p50_us": p50 * 1e6,
+            "p99_us": p99 * 1e6
+        }
+
+# ============================================================================
+# ENABLE / DISABLE
+# ============================================================================
+
+def enable_instrumentation(module_names=INSTRUMENTED_MODULES, report_on_exit=True):
+    """
+    Wrap the public functions of the given modules
+
+    Calls made through the module (module.function or from inside the
+    module) are measured. Names imported elsewhere with 'from module
+    import function' before enabling keep pointing at the original.
+
+    Returns: Number of functions wrapped
+    """
+    wrapped = 0
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for name, func in list(vars(module).items()):
+            key = f"{module_name}.{name}"
+            if key in _state["originals"] or not _should_wrap(module, name, func):
+                continue
+            stats = _state["stats"].setdefault(key, FunctionStats(key))
+            _state["originals"][key] = (module, name, func)
+            setattr(module, name, _wrap(func, stats))
+            wrapped += 1
+
+    _state["enabled"] = True
+    if report_on_exit and not _state["exit_hook"]:
+        atexit.register(_report_at_exit)
+        _state["exit_hook"] = True
+    return wrapped
+
+def disable_instrumentation():
+    """Put every original function back (collected stats are kept)"""
+    for module, name, func in _state["originals"].values():
+        setattr(module, name, func)
+    _state["originals"] = {}
+    _state["enabled"] = False
+
+def is_enabled():
+    """Check whether instrumentation is active"""
+    return _state["enabled"]
+
+def reset_stats():
+    """Zero all collected stats (wrappers keep recording into them)"""
+    for stats in _state["stats"].values():
+        stats.__init__(stats.name)
+
+def enable_from_environment(argv=None, environ=None):
+    """
+    Enable instrumentation if QUEST_PROFILE is set or --profile was passed
+
+    The --profile flag is removed from argv so the rest of the program
+    never sees it.
+
+    Returns: True if instrumentation was enabled
+    """
+    if argv is None:
+        argv = sys.argv
+    if environ is None:
+        environ = os.environ
+
+    requested = environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+    if CLI_FLAG in argv:
+        argv.remove(CLI_FLAG)
+        requested = True
+    if not requested:
+        return False
+
+    enable_instrumentation()
+    # Imported here so that importing this module stays cheap when
+    # profiling is off (main.py always imports it)
+    import signal
+    if hasattr(signal, "SIGUSR1"):
+        try:
+            signal.signal(signal.SIGUSR1, lambda signum, frame: dump_report())
+        except ValueError:
+            # Not the main thread; report on demand or at exit instead
+            pass
+    return True
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def get_report(include_unused=False):
+    """
+    Get per-function stats, most expensive first
+
+    Returns: List of summary dictionaries (see FunctionStats.summary)
+    """
+    rows = [stats.summary() for stats in _state["stats"].values()
+            if include_unused or stats.calls]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+def format_report(rows=None):
+    """
+    Format stats as a text table
+
+    Returns: String table
+    """
+    if rows is None:
+        rows = get_report()
+    lines = [f"{'Function':<48} {'Calls':>9} {'Errors':>7} {'Total ms':>10} "
+             f"{'Mean us':>9} {'p50 us':>9} {'p99 us':>9}"]
+    for row in rows:
+        lines.append(f"{row['name']:<48} {row['calls']:>9} {row['errors']:>7} "
+                     f"{row['total_ms']:>10.2f} {row['mean_us']:>9.1f} "
+                     f"{row['p50_us']:>9.1f} {row['p99_us']:>9.1f}")
+    return "\n".join(lines)
+
+def dump_report(stream=None):
+    """Write the report to a stream (default: standard error)"""
+    if stream is None:
+        stream = sys.stderr
+    stream.write("\n=== INSTRUMENTATION REPORT ===\n")
+    stream.write(format_report() + "\n")
+    stream.flush()
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _should_wrap(module, name, func):
+    """Public plain functions defined in the module itself"""
+    if name.startswith("_") or name in EXCLUDED_FUNCTIONS:
+        return False
+    if not isinstance(func, FunctionType) or func.__module__ != module.__name__:
+        return False
+    return True
+
+def _wrap(func, stats):
+    """Build a timing wrapper around func that records into stats"""
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:
+            stats.record_error(error)
+            raise
+        finally:
+            stats.record(perf_counter() - start)
+    return wrapper
+
+def _report_at_exit():
+    """atexit hook: print the report if anything was measured"""
+    if get_report():
+        dump_report()
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== INSTRUMENTATION TEST ===")
+
+    # enable_instrumentation()
+    # import character_manager
+    # for _ in range(1000):
+    #     character_manager.create_character("Timed", "Warrior")
+    # dump_report(sys.stdout)
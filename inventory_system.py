@@ -9,6 +9,10 @@ AI Usage: [Document any AI assistance used]
 This module handles inventory management, item usage, and equipment.
 """
 
+from collections import Counter
+
+import metrics
+import symbol_table
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
@@ -364,6 +368,7 @@ def purchase_item(character, item_id, item_data):
 
     character['gold'] = current_gold - cost
     add_item_to_inventory(character, item_id)
+    metrics.ITEMS_BOUGHT.inc()
     return True
 
 def sell_item(character, item_id, item_data):
@@ -392,6 +397,7 @@ def sell_item(character, item_id, item_data):
     remove_item_from_inventory(character, item_id)
     character['gold'] = character.get('gold', 0) + sell_price
 
+    metrics.ITEMS_SOLD.inc()
     return sell_price
 
 # ============================================================================
@@ -455,24 +461,41 @@ def apply_stat_effect(character, stat_name, value):
         # strength or magic
         character[stat_name] = character.get(stat_name, 0) + value
 
-def display_inventory(character, item_data_dict):
+def display_inventory(character, item_data_dict, views=None):
     """
     Display character's inventory in formatted way
     
     Args:
         character: Character dictionary
         item_data_dict: Dictionary of all item data
+        views: Optional precomputed ItemViews (see format_inventory)
     
     Shows item names, types, and quantities
     """
     # TODO: Implement inventory display
     # Count items (some may appear multiple times)
     # Display with item names from item_data_dict
-    inventory = character.get('inventory', [])
-    counts = {}
+    output = format_inventory(character, item_data_dict, views)
+    print(output)
+    return output
+
+def format_inventory(character, item_data_dict, views=None):
+    """
+    Format character's inventory as text
+
+    Args:
+        character: Character dictionary
+        item_data_dict: Dictionary of all item data
+        views: Precomputed catalog_views.ItemViews of item_data_dict
+               (labels are looked up instead of rebuilt)
 
-    for item_id in inventory:
-        counts[item_id] = counts.get(item_id, 0) + 1
+    Returns: String with one 'Name (type) xN' line per item
+    """
+    counts = Counter(symbol_table.as_names(character.get('inventory', [])))
+
+    if views is not None:
+        get_label = views.get_label
+        return "\n".join(f"{get_label(item_id)} x{qty}" for item_id, qty in counts.items())
 
     lines = []
     for item_id, qty in counts.items():
@@ -481,9 +504,7 @@ def display_inventory(character, item_data_dict):
         item_type = item_info.get('type', 'unknown')
         lines.append(f"{name} ({item_type}) x{qty}")
 
-    output = "\n".join(lines)
-    print(output)
-    return output
+    return "\n".join(lines)
 
 # ============================================================================
 # TESTING
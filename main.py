@@ -8,13 +8,22 @@ AI Usage: [I used ChatGPT (OpenAI, GPT-5 model, 2025) to help clarify certain mo
 
 This is the main game file that ties all modules together.
 Demonstrates module integration and complete game flow.
+
+All per-player state lives in a GameSession. Its menu methods are
+generators: they yield a prompt string whenever they need a line of input
+(and receive the line, or None at end of input), and yield a BlockingCall
+whenever they need save-file I/O. A driver feeds them - run_session_flow()
+for the console, session_server for network players - so the same menu
+logic works without blocking input() or a thread per player.
 """
 
 # Import all our custom modules
+# (inventory_system, quest_handler and combat_system are imported by the
+# menus that use them, so the first prompt appears without loading them)
+from types import MappingProxyType
+
+import catalog_views
 import character_manager
-import inventory_system
-import quest_handler
-import combat_system
 import game_data
 from custom_exceptions import *
 
@@ -22,579 +31,765 @@ from custom_exceptions import *
 # GAME STATE
 # ============================================================================
 
-# Global variables for game data
-current_character = None
-all_quests = {}
-all_items = {}
-game_running = False
+# Quest and item catalog, loaded once and shared read-only by every session
+catalog = game_data.GameCatalog({}, {})
+
+# Returned by a session when a data file cannot be loaded
+EMPTY_TABLE = MappingProxyType({})
+EMPTY_VIEWS = catalog_views.ItemViews(EMPTY_TABLE)
+
+# Session used by the console game
+cli_session = None
+
+DEFAULT_SAVE_DIRECTORY = "data/save_games"
+
+class BlockingCall:
+    """
+    A blocking function call requested by a session (save-file I/O)
+
+    The driver decides where it runs: inline for the console, on an
+    executor for the session server.
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func, *args):
+        """Store the function and its arguments"""
+        self.func = func
+        self.args = args
+
+    def run(self):
+        """Call the function and return its result"""
+        return self.func(*self.args)
 
 # ============================================================================
-# MAIN MENU
+# GAME SESSION
 # ============================================================================
 
-def main_menu():
+class GameSession:
     """
-    Display main menu and get player choice
-    
-    Options:
-    1. New Game
-    2. Load Game
-    3. Exit
-    
-    Returns: Integer choice (1-3)
+    One player's game: current character, catalog reference, output
+    adapter and running flag
+
+    The catalog is a shared game_data.GameCatalog; sessions only hold a
+    reference to it, so a session costs one small slotted object plus the
+    player's own character.
     """
-    # TODO: Implement main menu display
-    # Show options
-    # Get user input
-    # Validate input (1-3)
-    # Return choice
+
+    __slots__ = ("character", "catalog", "save_directory", "write", "running",
+                 "autosave", "rng", "data_errors")
+
+    def __init__(self, catalog, save_directory=DEFAULT_SAVE_DIRECTORY, write=print,
+                 autosave=True, rng=None):
+        """
+        Create a session
+
+        Args:
+            catalog: Shared GameCatalog
+            save_directory: Where this session's characters are saved
+            write: Output adapter called with one block of text at a time
+            autosave: Save after every game menu action (the explicit
+                      Save and Quit always saves)
+            rng: Random generator for encounters and battles (defaults to
+                 the random module)
+        """
+        self.character = None
+        self.catalog = catalog
+        self.save_directory = save_directory
+        self.write = write
+        self.running = False
+        self.autosave = autosave
+        self.rng = rng
+        # Data files that failed to load for this session ('quests'/'items')
+        self.data_errors = {}
+
+    @property
+    def quests(self):
+        """Shared quest catalog (read-only; empty if it failed to load)"""
+        return self._catalog_table("quests", "quests", EMPTY_TABLE)
+
+    @property
+    def items(self):
+        """Shared item catalog (read-only; empty if it failed to load)"""
+        return self._catalog_table("items", "items", EMPTY_TABLE)
+
+    @property
+    def item_views(self):
+        """Shared precomputed item views (empty if the items failed to load)"""
+        return self._catalog_table("item_views", "items", EMPTY_VIEWS)
+
+    def _catalog_table(self, attribute, data_file, empty):
+        """
+        Get a catalog table, reporting a load failure once per session
+
+        After a data file fails to load, this session gets the empty table
+        without retrying or repeating the error message.
+        """
+        if data_file in self.data_errors:
+            return empty
+        try:
+            return getattr(self.catalog, attribute)
+        except DataError as e:
+            self.data_errors[data_file] = e
+            self._write_data_error(e)
+            return empty
+
+    # ------------------------------------------------------------------
+    # Main menu
+    # ------------------------------------------------------------------
+
+    def play(self):
+        """
+        Main menu loop until the player exits
+
+        Yields prompts/BlockingCalls (see module docstring)
+        """
+        while True:
+            choice = yield from self.main_menu()
+
+            if choice == 1:
+                yield from self.new_game()
+            elif choice == 2:
+                yield from self.load_game()
+            elif choice == 3:
+                self.write("\nThanks for playing Quest Chronicles!")
+                break
+            else:
+                self.write("Invalid choice. Please select 1-3.")
+
+    def main_menu(self):
+        """
+        Display main menu and get player choice
+
+        Options:
+        1. New Game
+        2. Load Game
+        3. Exit
+
+        Returns: Integer choice (1-3)
+        """
+        while True:
+            self.write("\n=== MAIN MENU ===\n1. New Game\n2. Load Game\n3. Exit")
+            choice = yield "Enter choice (1-3): "
+            if choice is None:
+                # No more input (e.g., in tests or a closed connection), so Exit
+                return 3
+            if choice in ("1", "2", "3"):
+                return int(choice)
+            self.write("Invalid choice. Please enter 1, 2, or 3.")
+
+    def new_game(self):
+        """
+        Start a new game
+
+        Prompts for character name and class, creates and saves the
+        character, then starts the game loop
+        """
+        self.write("\n=== NEW GAME ===")
+        name = yield "Enter your character's name: "
+        if name is None:
+            self.write("No input detected. Returning to main menu.")
+            return
+        name = name.strip()
+        if not name:
+            self.write("Name cannot be empty.")
+            return
+
+        self.write("Choose a class: Warrior, Mage, Rogue, Cleric")
+        char_class = yield "Enter class: "
+        if char_class is None:
+            self.write("No input detected. Returning to main menu.")
+            return
+
+        try:
+            self.character = character_manager.create_character(name, char_class.strip())
+        except (InvalidCharacterClassError, InvalidCharacterNameError) as e:
+            self.write(f"Error: {e}")
+            return
+
+        # Save initial character
+        try:
+            yield BlockingCall(character_manager.save_character, self.character,
+                               self.save_directory)
+            self.write("Character created and saved!")
+        except Exception as e:
+            self.write(f"Warning: Could not save character: {e}")
+
+        yield from self.game_loop()
+
+    def load_game(self):
+        """
+        Load an existing saved game
+
+        Shows list of saved characters and prompts user to select one
+        """
+        self.write("\n=== LOAD GAME ===")
+        saved = yield BlockingCall(character_manager.list_saved_characters, self.save_directory)
+        if not saved:
+            self.write("No saved characters found.")
+            return
+
+        lines = ["Saved Characters:"]
+        for i, name in enumerate(saved, start=1):
+            lines.append(f"{i}. {name}")
+        self.write("\n".join(lines))
+
+        choice = yield "Enter number or name of character: "
+        if choice is None:
+            self.write("No input detected. Returning to main menu.")
+            return
+        choice = choice.strip()
+
+        # Allow selecting by index or by name
+        if choice.isdigit():
+            idx = int(choice) - 1
+            if 0 <= idx < len(saved):
+                name = saved[idx]
+            else:
+                self.write("Invalid selection.")
+                return
+        else:
+            name = choice
+
+        try:
+            self.character = yield BlockingCall(character_manager.load_character, name,
+                                                self.save_directory)
+            self.write(f"Loaded character: {self.character['name']}")
+        except (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError) as e:
+            self.write(f"Error: {e}")
+            return
+
+        yield from self.game_loop()
+
+    # ------------------------------------------------------------------
+    # Game loop
+    # ------------------------------------------------------------------
+
+    def game_loop(self):
+        """Main game loop - shows game menu and processes actions"""
+        self.running = True
+
+        if self.character is None:
+            self.write("No active character. Returning to main menu.")
+            return
+
+        self.write(f"\nWelcome, {self.character['name']} the {self.character['class']}!")
+
+        while self.running:
+            choice = yield from self.game_menu()
+
+            if choice == 1:
+                self.view_character_stats()
+            elif choice == 2:
+                yield from self.view_inventory()
+            elif choice == 3:
+                yield from self.quest_menu()
+            elif choice == 4:
+                yield from self.explore()
+            elif choice == 5:
+                yield from self.shop()
+            elif choice == 6:
+                yield from self.save_game()
+                self.write("Game saved. Exiting to main menu.")
+                break
+            else:
+                self.write("Invalid choice.")
+
+            # Auto-save after each action (except quit)
+            if self.autosave and choice in (1, 2, 3, 4, 5):
+                yield from self.save_game()
+
+        self.running = False
+
+    def game_menu(self):
+        """
+        Display game menu and get player choice
+
+        Returns: Integer choice (1-6)
+        """
+        while True:
+            self.write("\n=== GAME MENU ===\n"
+                       "1. View Character Stats\n"
+                       "2. View Inventory\n"
+                       "3. Quest Menu\n"
+                       "4. Explore (Find Battles)\n"
+                       "5. Shop\n"
+                       "6. Save and Quit")
+            choice = yield "Enter choice (1-6): "
+            if choice is None:
+                # Default to Save and Quit when input runs out
+                return 6
+            if choice in ("1", "2", "3", "4", "5", "6"):
+                return int(choice)
+            self.write("Invalid choice. Please enter 1-6.")
+
+    # ------------------------------------------------------------------
+    # Game actions
+    # ------------------------------------------------------------------
+
+    def view_character_stats(self):
+        """Display character information (needs no input)"""
+        if self.character is None:
+            self.write("No active character.")
+            return
+
+        c = self.character
+        self.write("\n".join([
+            "\n=== CHARACTER STATS ===",
+            f"Name: {c['name']}",
+            f"Class: {c['class']}",
+            f"Level: {c['level']}",
+            f"Health: {c['health']}/{c['max_health']}",
+            f"Strength: {c['strength']}",
+            f"Magic: {c['magic']}",
+            f"Experience: {c['experience']}",
+            f"Gold: {c['gold']}",
+            f"Active Quests: {len(c.get('active_quests', []))}",
+            f"Completed Quests: {len(c.get('completed_quests', []))}"
+        ]))
+
+        # Optional: show quest progress if data is loaded
+        if self.catalog.quests_loaded and self.quests:
+            import quest_handler
+            self.write(quest_handler.format_character_quest_progress(c, self.quests))
+
+    def view_inventory(self):
+        """Display and manage inventory"""
+        import inventory_system
+
+        if self.character is None:
+            self.write("No active character.")
+            return
+
+        self.write("\n=== INVENTORY ===")
+        if not self.character.get("inventory"):
+            self.write("Inventory is empty.")
+        else:
+            self.write(inventory_system.format_inventory(self.character, self.items,
+                                                         self.item_views))
+
+        self.write("\n1. Use Item\n2. Equip Weapon\n3. Equip Armor\n4. Back")
+        choice = yield "Enter choice: "
+
+        if choice == "1":
+            item_id = _clean((yield "Enter item ID to use: "))
+            if item_id in self.items:
+                try:
+                    inventory_system.use_item(self.character, item_id, self.items[item_id])
+                except (ItemNotFoundError, InvalidItemTypeError) as e:
+                    self.write(f"Error: {e}")
+            else:
+                self.write("Unknown item ID.")
+        elif choice in ("2", "3"):
+            slot = "weapon" if choice == "2" else "armor"
+            item_id = _clean((yield f"Enter {slot} item ID to equip: "))
+            if item_id in self.items:
+                equip = inventory_system.equip_weapon if slot == "weapon" else inventory_system.equip_armor
+                try:
+                    equip(self.character, item_id, self.items[item_id])
+                except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
+                    self.write(f"Error: {e}")
+            else:
+                self.write("Unknown item ID.")
+
+    def quest_menu(self):
+        """Quest management menu"""
+        import quest_handler
+
+        if self.character is None:
+            self.write("No active character.")
+            return
+
+        character = self.character
+        quests = self.quests
+        while True:
+            self.write("\n=== QUEST MENU ===\n"
+                       "1. View Active Quests\n"
+                       "2. View Available Quests\n"
+                       "3. View Completed Quests\n"
+                       "4. Accept Quest\n"
+                       "5. Abandon Quest\n"
+                       "6. Complete Quest (for testing)\n"
+                       "7. Back")
+            choice = yield "Enter choice: "
+            if choice is None:
+                return
+
+            if choice == "1":
+                self._write_quest_list(quest_handler.get_active_quests(character, quests),
+                                       "No active quests.")
+            elif choice == "2":
+                self._write_quest_list(quest_handler.get_available_quests(character, quests),
+                                       "No available quests.")
+            elif choice == "3":
+                self._write_quest_list(quest_handler.get_completed_quests(character, quests),
+                                       "No completed quests.")
+            elif choice == "4":
+                quest_id = _clean((yield "Enter quest ID to accept: "))
+                try:
+                    quest_handler.accept_quest(character, quest_id, quests)
+                    self.write(f"Quest '{quest_id}' accepted.")
+                except (QuestNotFoundError, InsufficientLevelError,
+                        QuestRequirementsNotMetError, QuestAlreadyCompletedError) as e:
+                    self.write(f"Error: {e}")
+            elif choice == "5":
+                quest_id = _clean((yield "Enter quest ID to abandon: "))
+                try:
+                    quest_handler.abandon_quest(character, quest_id)
+                    self.write(f"Quest '{quest_id}' abandoned.")
+                except QuestNotActiveError as e:
+                    self.write(f"Error: {e}")
+            elif choice == "6":
+                quest_id = _clean((yield "Enter quest ID to complete (testing): "))
+                try:
+                    rewards = quest_handler.complete_quest(character, quest_id, quests)
+                    self.write(f"Quest '{quest_id}' completed! Rewards: {rewards['xp']} XP, "
+                               f"{rewards['gold']} gold.")
+                except (QuestNotFoundError, QuestNotActiveError) as e:
+                    self.write(f"Error: {e}")
+            elif choice == "7":
+                return
+            else:
+                self.write("Invalid choice.")
+
+    def explore(self):
+        """Find and fight random enemies"""
+        import combat_system
+
+        if self.character is None:
+            self.write("No active character.")
+            return
+
+        self.write("\nYou venture forth in search of adventure...")
+        level = self.character.get("level", 1)
+        enemy = combat_system.get_random_enemy_for_level(level, self.rng)
+        self.write(f"A wild {enemy['name']} appears!")
+
+        battle = combat_system.BattleEngine(self.character, enemy, fast_path=False, rng=self.rng)
+        try:
+            battle.begin()
+        except CharacterDeadError as e:
+            self.write(f"Error: {e}")
+            yield from self.handle_character_death()
+            return
+
+        shown = self._write_battle_events(battle, 0)
+        while battle.combat_active:
+            action = yield from self.choose_battle_action()
+            battle.step(action)
+            shown = self._write_battle_events(battle, shown)
+        result = battle.get_result()
+
+        if result["winner"] == "player":
+            self.write(f"You won the battle! Gained {result['xp_gained']} XP and "
+                       f"{result['gold_gained']} gold.")
+            if result["xp_gained"] > 0:
+                try:
+                    character_manager.gain_experience(self.character, result["xp_gained"])
+                except CharacterDeadError:
+                    # Shouldn't happen right after winning, but just in case
+                    yield from self.handle_character_death()
+                    return
+            if result["gold_gained"] > 0:
+                try:
+                    character_manager.add_gold(self.character, result["gold_gained"])
+                except ValueError:
+                    pass
+        elif result["winner"] == "enemy":
+            self.write("You were defeated in battle...")
+            yield from self.handle_character_death()
+        else:
+            self.write("You got away safely.")
+
+    def choose_battle_action(self):
+        """
+        Ask the player for a battle action
+
+        Returns: One of the combat_system ACTION_* constants
+        """
+        import combat_system
+
+        self.write("\nYour turn:\n1. Basic Attack\n2. Special Ability\n3. Try to Run")
+        choice = yield "Choose an action (1-3): "
+        if choice == "2":
+            return combat_system.ACTION_SPECIAL
+        if choice == "3":
+            return combat_system.ACTION_ESCAPE
+        # Anything else, including end of input, is a basic attack
+        return combat_system.ACTION_ATTACK
+
+    def shop(self):
+        """Shop menu for buying/selling items"""
+        import inventory_system
+
+        if self.character is None:
+            self.write("No active character.")
+            return
+
+        while True:
+            lines = ["\n=== SHOP ===", f"Your gold: {self.character['gold']}", "Items for sale:"]
+            # The listing is formatted once per catalog, not on every visit
+            listing = self.item_views.listing
+            if listing:
+                lines.append(listing)
+            lines.append("\n1. Buy Item\n2. Sell Item\n3. Back")
+            self.write("\n".join(lines))
+
+            choice = yield "Enter choice: "
+            if choice is None:
+                return
+
+            if choice == "1":
+                item_id = _clean((yield "Enter item ID to buy: "))
+                if item_id in self.items:
+                    try:
+                        inventory_system.purchase_item(self.character, item_id, self.items[item_id])
+                        self.write(f"Purchased {item_id}.")
+                    except (InsufficientResourcesError, InventoryFullError) as e:
+                        self.write(f"Error: {e}")
+                else:
+                    self.write("Unknown item ID.")
+            elif choice == "2":
+                item_id = _clean((yield "Enter item ID to sell: "))
+                if item_id in self.items:
+                    try:
+                        gold_received = inventory_system.sell_item(self.character, item_id,
+                                                                   self.items[item_id])
+                        self.write(f"Sold {item_id} for {gold_received} gold.")
+                    except ItemNotFoundError as e:
+                        self.write(f"Error: {e}")
+                else:
+                    self.write("Unknown item ID.")
+            elif choice == "3":
+                return
+            else:
+                self.write("Invalid choice.")
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def save_game(self):
+        """Save current game state (the write itself is a BlockingCall)"""
+        if self.character is None:
+            self.write("No active character to save.")
+            return
+        try:
+            yield BlockingCall(character_manager.save_character, self.character,
+                               self.save_directory)
+            self.write("Game saved.")
+        except Exception as e:
+            self.write(f"Error saving game: {e}")
+
+    def handle_character_death(self):
+        """Offer a paid revive or send the player back to the main menu"""
+        if self.character is None:
+            self.running = False
+            return
+
+        self.write("\n=== YOU HAVE FALLEN ===\n1. Revive (costs 50 gold)\n2. Quit to main menu")
+        choice = yield "Enter choice: "
+
+        if choice == "1":
+            cost = 50
+            if self.character.get("gold", 0) < cost:
+                self.write("Not enough gold to revive. Returning to main menu.")
+                self.running = False
+                return
+            try:
+                self.character["gold"] -= cost
+                if character_manager.revive_character(self.character):
+                    self.write("You have been revived!")
+                else:
+                    self.write("Could not revive character.")
+                    self.running = False
+            except Exception as e:
+                self.write(f"Error during revival: {e}")
+                self.running = False
+        else:
+            self.write("Returning to main menu.")
+            self.running = False
+
+    def _write_quest_list(self, quest_list, empty_message):
+        """Write a quest list, or a message when it is empty"""
+        if not quest_list:
+            self.write(empty_message)
+        else:
+            import quest_handler
+            self.write(quest_handler.format_quest_list(quest_list))
+
+    def _write_battle_events(self, battle, start):
+        """
+        Write battle events recorded since index start, then both health lines
+
+        Returns: Number of events shown so far
+        """
+        for message in battle.events.render(start):
+            self.write(f">>> {message}")
+        if battle.combat_active:
+            import combat_system
+            self.write(combat_system.format_combat_stats(battle.character, battle.enemy))
+        return len(battle.events)
+
+    def _write_data_error(self, error):
+        """Tell the player a data file could not be loaded"""
+        self.write(f"Error loading game data: {error}")
+        self.write("Please check data files for errors.")
+
+# ============================================================================
+# SESSION DRIVER
+# ============================================================================
+
+def run_session_flow(flow, read=input, call=None):
+    """
+    Drive a session generator from a blocking line reader
+
+    Prompts are passed to read() (EOFError counts as end of input) and
+    BlockingCalls are passed to call() (default: run inline); their
+    exceptions are raised back inside the session where they were requested.
+
+    Returns: The flow's return value
+    """
+    if call is None:
+        call = BlockingCall.run
+    value = None
+    error = None
     while True:
-        print("\n=== MAIN MENU ===")
-        print("1. New Game")
-        print("2. Load Game")
-        print("3. Exit")
         try:
-            choice = input("Enter choice (1-3): ")
-        except EOFError:
-            # If no input (e.g., in tests), default to Exit
-            return 3
-        if choice in ("1", "2", "3"):
-            return int(choice)
+            if error is not None:
+                request = flow.throw(error)
+            else:
+                request = flow.send(value)
+        except StopIteration as stop:
+            return stop.value
+
+        value = None
+        error = None
+        if isinstance(request, BlockingCall):
+            try:
+                value = call(request)
+            except Exception as e:
+                error = e
         else:
-            print("Invalid choice. Please enter 1, 2, or 3.")
+            try:
+                value = read(request)
+            except EOFError:
+                value = None
 
-def new_game():
+def get_cli_session():
     """
-    Start a new game
-    
-    Prompts for:
-    - Character name
-    - Character class
-    
-    Creates character and starts game loop
+    Get the console player's session, creating it on first use
+
+    Returns: GameSession sharing the loaded catalog
     """
-    global current_character
-    
-    # TODO: Implement new game creation
-    # Get character name from user
-    # Get character class from user
-    # Try to create character with character_manager.create_character()
-    # Handle InvalidCharacterClassError
-    # Save character
-    # Start game loop
-    print("\n=== NEW GAME ===")
-    try:
-        name = input("Enter your character's name: ").strip()
-    except EOFError:
-        print("No input detected. Returning to main menu.")
-        return
-    if not name:
-        print("Name cannot be empty.")
-        return
-    
-    print("Choose a class: Warrior, Mage, Rogue, Cleric")
-    try:
-        char_class = input("Enter class: ").strip()
-    except EOFError:
-        print("No input detected. Returning to main menu.")
-        return
-    
-    try:
-        current_character = character_manager.create_character(name, char_class)
-    except InvalidCharacterClassError as e:
-        print(f"Error: {e}")
-        return
-    
-    # Save initial character
-    try:
-        character_manager.save_character(current_character)
-        print("Character created and saved!")
-    except Exception as e:
-        print(f"Warning: Could not save character: {e}")
-    
-    game_loop()
+    global cli_session
+    if cli_session is None:
+        cli_session = GameSession(catalog)
+    return cli_session
 
-def load_game():
+def run_cli(read=input, write=print):
     """
-    Load an existing saved game
-    
-    Shows list of saved characters
-    Prompts user to select one
+    Play the whole game as a single console session
+
+    Args:
+        read: Line reader given each prompt (EOFError ends input)
+        write: Output adapter
     """
-    global current_character
-    
-    # TODO: Implement game loading
-    # Get list of saved characters
-    # Display them to user
-    # Get user choice
-    # Try to load character with character_manager.load_character()
-    # Handle CharacterNotFoundError and SaveFileCorruptedError
-    # Start game loop
-    print("\n=== LOAD GAME ===")
-    saved = character_manager.list_saved_characters()
-    if not saved:
-        print("No saved characters found.")
-        return
-    
-    print("Saved Characters:")
-    for i, name in enumerate(saved, start=1):
-        print(f"{i}. {name}")
-    
-    try:
-        choice = input("Enter number or name of character: ").strip()
-    except EOFError:
-        print("No input detected. Returning to main menu.")
-        return
-    
-    # Allow selecting by index or by name
-    if choice.isdigit():
-        idx = int(choice) - 1
-        if 0 <= idx < len(saved):
-            name = saved[idx]
-        else:
-            print("Invalid selection.")
-            return
-    else:
-        name = choice
-    
-    try:
-        current_character = character_manager.load_character(name)
-        print(f"Loaded character: {current_character['name']}")
-    except CharacterNotFoundError as e:
-        print(f"Error: {e}")
-        return
-    except SaveFileCorruptedError as e:
-        print(f"Error: {e}")
-        return
-    except InvalidSaveDataError as e:
-        print(f"Error: {e}")
-        return
-    
-    game_loop()
+    session = get_cli_session()
+    session.write = write
+    run_session_flow(session.play(), read)
 
 # ============================================================================
-# GAME LOOP
+# CONSOLE MENU FUNCTIONS
 # ============================================================================
 
-def game_loop():
+def main_menu():
     """
-    Main game loop - shows game menu and processes actions
+    Display main menu and get player choice
+
+    Returns: Integer choice (1-3)
     """
-    global game_running, current_character
-    
-    game_running = True
-    
-    # TODO: Implement game loop
-    # While game_running:
-    #   Display game menu
-    #   Get player choice
-    #   Execute chosen action
-    #   Save game after each action
-    if current_character is None:
-        print("No active character. Returning to main menu.")
-        return
-    
-    print(f"\nWelcome, {current_character['name']} the {current_character['class']}!")
-    
-    while game_running:
-        choice = game_menu()
-        
-        if choice == 1:
-            view_character_stats()
-        elif choice == 2:
-            view_inventory()
-        elif choice == 3:
-            quest_menu()
-        elif choice == 4:
-            explore()
-        elif choice == 5:
-            shop()
-        elif choice == 6:
-            save_game()
-            print("Game saved. Exiting to main menu.")
-            break
-        else:
-            print("Invalid choice.")
-        
-        # Auto-save after each action (except quit)
-        if choice in (1, 2, 3, 4, 5):
-            save_game()
+    return run_session_flow(get_cli_session().main_menu())
+
+def new_game():
+    """Start a new game for the console player"""
+    run_session_flow(get_cli_session().new_game())
+
+def load_game():
+    """Load an existing saved game for the console player"""
+    run_session_flow(get_cli_session().load_game())
+
+def game_loop():
+    """Main game loop for the console player"""
+    run_session_flow(get_cli_session().game_loop())
 
 def game_menu():
     """
     Display game menu and get player choice
-    
-    Options:
-    1. View Character Stats
-    2. View Inventory
-    3. Quest Menu
-    4. Explore (Find Battles)
-    5. Shop
-    6. Save and Quit
-    
+
     Returns: Integer choice (1-6)
     """
-    # TODO: Implement game menu
-    while True:
-        print("\n=== GAME MENU ===")
-        print("1. View Character Stats")
-        print("2. View Inventory")
-        print("3. Quest Menu")
-        print("4. Explore (Find Battles)")
-        print("5. Shop")
-        print("6. Save and Quit")
-        try:
-            choice = input("Enter choice (1-6): ")
-        except EOFError:
-            # Default to Save and Quit in non-interactive environments
-            return 6
-        if choice in ("1", "2", "3", "4", "5", "6"):
-            return int(choice)
-        else:
-            print("Invalid choice. Please enter 1-6.")
-
-# ============================================================================
-# GAME ACTIONS
-# ============================================================================
+    return run_session_flow(get_cli_session().game_menu())
 
 def view_character_stats():
     """Display character information"""
-    global current_character
-    
-    # TODO: Implement stats display
-    # Show: name, class, level, health, stats, gold, etc.
-    # Use character_manager functions
-    # Show quest progress using quest_handler
-    if current_character is None:
-        print("No active character.")
-        return
-    
-    c = current_character
-    print("\n=== CHARACTER STATS ===")
-    print(f"Name: {c['name']}")
-    print(f"Class: {c['class']}")
-    print(f"Level: {c['level']}")
-    print(f"Health: {c['health']}/{c['max_health']}")
-    print(f"Strength: {c['strength']}")
-    print(f"Magic: {c['magic']}")
-    print(f"Experience: {c['experience']}")
-    print(f"Gold: {c['gold']}")
-    print(f"Active Quests: {len(c.get('active_quests', []))}")
-    print(f"Completed Quests: {len(c.get('completed_quests', []))}")
-    
-    # Optional: show quest progress if data is loaded
-    if all_quests:
-        quest_handler.display_character_quest_progress(current_character, all_quests)
+    get_cli_session().view_character_stats()
 
 def view_inventory():
     """Display and manage inventory"""
-    global current_character, all_items
-    
-    # TODO: Implement inventory menu
-    # Show current inventory
-    # Options: Use item, Equip weapon/armor, Drop item
-    # Handle exceptions from inventory_system
-    if current_character is None:
-        print("No active character.")
-        return
-    
-    print("\n=== INVENTORY ===")
-    if not current_character.get("inventory"):
-        print("Inventory is empty.")
-    else:
-        inventory_system.display_inventory(current_character, all_items)
-    
-    print("\n1. Use Item")
-    print("2. Equip Weapon")
-    print("3. Equip Armor")
-    print("4. Back")
-    try:
-        choice = input("Enter choice: ")
-    except EOFError:
-        return
-    
-    if choice == "1":
-        item_id = input("Enter item ID to use: ").strip()
-        if item_id in all_items:
-            try:
-                inventory_system.use_item(current_character, item_id, all_items[item_id])
-            except ItemNotFoundError as e:
-                print(f"Error: {e}")
-            except InvalidItemTypeError as e:
-                print(f"Error: {e}")
-        else:
-            print("Unknown item ID.")
-    elif choice == "2":
-        item_id = input("Enter weapon item ID to equip: ").strip()
-        if item_id in all_items:
-            try:
-                inventory_system.equip_weapon(current_character, item_id, all_items[item_id])
-            except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
-                print(f"Error: {e}")
-        else:
-            print("Unknown item ID.")
-    elif choice == "3":
-        item_id = input("Enter armor item ID to equip: ").strip()
-        if item_id in all_items:
-            try:
-                inventory_system.equip_armor(current_character, item_id, all_items[item_id])
-            except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
-                print(f"Error: {e}")
-        else:
-            print("Unknown item ID.")
-    else:
-        return
+    run_session_flow(get_cli_session().view_inventory())
 
 def quest_menu():
     """Quest management menu"""
-    global current_character, all_quests
-    
-    # TODO: Implement quest menu
-    # Show:
-    #   1. View Active Quests
-    #   2. View Available Quests
-    #   3. View Completed Quests
-    #   4. Accept Quest
-    #   5. Abandon Quest
-    #   6. Complete Quest (for testing)
-    #   7. Back
-    # Handle exceptions from quest_handler
-    if current_character is None:
-        print("No active character.")
-        return
-    
-    while True:
-        print("\n=== QUEST MENU ===")
-        print("1. View Active Quests")
-        print("2. View Available Quests")
-        print("3. View Completed Quests")
-        print("4. Accept Quest")
-        print("5. Abandon Quest")
-        print("6. Complete Quest (for testing)")
-        print("7. Back")
-        try:
-            choice = input("Enter choice: ")
-        except EOFError:
-            return
-        
-        if choice == "1":
-            active = quest_handler.get_active_quests(current_character, all_quests)
-            if not active:
-                print("No active quests.")
-            else:
-                quest_handler.display_quest_list(active)
-        elif choice == "2":
-            available = quest_handler.get_available_quests(current_character, all_quests)
-            if not available:
-                print("No available quests.")
-            else:
-                quest_handler.display_quest_list(available)
-        elif choice == "3":
-            completed = quest_handler.get_completed_quests(current_character, all_quests)
-            if not completed:
-                print("No completed quests.")
-            else:
-                quest_handler.display_quest_list(completed)
-        elif choice == "4":
-            quest_id = input("Enter quest ID to accept: ").strip()
-            try:
-                quest_handler.accept_quest(current_character, quest_id, all_quests)
-                print(f"Quest '{quest_id}' accepted.")
-            except (QuestNotFoundError, InsufficientLevelError,
-                    QuestRequirementsNotMetError, QuestAlreadyCompletedError) as e:
-                print(f"Error: {e}")
-        elif choice == "5":
-            quest_id = input("Enter quest ID to abandon: ").strip()
-            try:
-                quest_handler.abandon_quest(current_character, quest_id)
-                print(f"Quest '{quest_id}' abandoned.")
-            except QuestNotActiveError as e:
-                print(f"Error: {e}")
-        elif choice == "6":
-            quest_id = input("Enter quest ID to complete (testing): ").strip()
-            try:
-                rewards = quest_handler.complete_quest(current_character, quest_id, all_quests)
-                print(f"Quest '{quest_id}' completed! Rewards: {rewards['xp']} XP, {rewards['gold']} gold.")
-            except (QuestNotFoundError, QuestNotActiveError) as e:
-                print(f"Error: {e}")
-        elif choice == "7":
-            return
-        else:
-            print("Invalid choice.")
+    run_session_flow(get_cli_session().quest_menu())
 
 def explore():
     """Find and fight random enemies"""
-    global current_character
-    
-    # TODO: Implement exploration
-    # Generate random enemy based on character level
-    # Start combat with combat_system.SimpleBattle
-    # Handle combat results (XP, gold, death)
-    # Handle exceptions
-    if current_character is None:
-        print("No active character.")
-        return
-    
-    print("\nYou venture forth in search of adventure...")
-    level = current_character.get("level", 1)
-    enemy = combat_system.get_random_enemy_for_level(level)
-    print(f"A wild {enemy['name']} appears!")
-    
-    battle = combat_system.SimpleBattle(current_character, enemy)
-    try:
-        result = battle.start_battle()
-    except CharacterDeadError as e:
-        print(f"Error: {e}")
-        handle_character_death()
-        return
-    
-    if result["winner"] == "player":
-        print(f"You won the battle! Gained {result['xp_gained']} XP and {result['gold_gained']} gold.")
-        if result["xp_gained"] > 0:
-            try:
-                character_manager.gain_experience(current_character, result["xp_gained"])
-            except CharacterDeadError:
-                # Shouldn't happen right after winning, but just in case
-                handle_character_death()
-                return
-        if result["gold_gained"] > 0:
-            try:
-                character_manager.add_gold(current_character, result["gold_gained"])
-            except ValueError:
-                pass
-    else:
-        print("You were defeated in battle...")
-        handle_character_death()
+    run_session_flow(get_cli_session().explore())
 
 def shop():
     """Shop menu for buying/selling items"""
-    global current_character, all_items
-    
-    # TODO: Implement shop
-    # Show available items for purchase
-    # Show current gold
-    # Options: Buy item, Sell item, Back
-    # Handle exceptions from inventory_system
-    if current_character is None:
-        print("No active character.")
-        return
-    
-    while True:
-        print("\n=== SHOP ===")
-        print(f"Your gold: {current_character['gold']}")
-        print("Items for sale:")
-        for item_id, data in all_items.items():
-            cost = data.get("cost", 0)
-            name = data.get("name", item_id)
-            print(f"- {item_id}: {name} ({cost} gold)")
-        
-        print("\n1. Buy Item")
-        print("2. Sell Item")
-        print("3. Back")
-        try:
-            choice = input("Enter choice: ")
-        except EOFError:
-            return
-        
-        if choice == "1":
-            item_id = input("Enter item ID to buy: ").strip()
-            if item_id in all_items:
-                try:
-                    inventory_system.purchase_item(current_character, item_id, all_items[item_id])
-                    print(f"Purchased {item_id}.")
-                except (InsufficientResourcesError, InventoryFullError) as e:
-                    print(f"Error: {e}")
-            else:
-                print("Unknown item ID.")
-        elif choice == "2":
-            item_id = input("Enter item ID to sell: ").strip()
-            if item_id in all_items:
-                try:
-                    gold_received = inventory_system.sell_item(current_character, item_id, all_items[item_id])
-                    print(f"Sold {item_id} for {gold_received} gold.")
-                except ItemNotFoundError as e:
-                    print(f"Error: {e}")
-            else:
-                print("Unknown item ID.")
-        elif choice == "3":
-            return
-        else:
-            print("Invalid choice.")
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
+    run_session_flow(get_cli_session().shop())
 
 def save_game():
     """Save current game state"""
-    global current_character
-    
-    # TODO: Implement save
-    # Use character_manager.save_character()
-    # Handle any file I/O exceptions
-    if current_character is None:
-        print("No active character to save.")
-        return
-    try:
-        character_manager.save_character(current_character)
-        print("Game saved.")
-    except Exception as e:
-        print(f"Error saving game: {e}")
-
-def load_game_data():
-    """Load all quest and item data from files"""
-    global all_quests, all_items
-    
-    # TODO: Implement data loading
-    # Try to load quests with game_data.load_quests()
-    # Try to load items with game_data.load_items()
-    # Handle MissingDataFileError, InvalidDataFormatError
-    # If files missing, create defaults with game_data.create_default_data_files()
-    all_quests = game_data.load_quests("data/quests.txt")
-    all_items = game_data.load_items("data/items.txt")
+    run_session_flow(get_cli_session().save_game())
 
 def handle_character_death():
     """Handle character death"""
-    global current_character, game_running
-    
-    # TODO: Implement death handling
-    # Display death message
-    # Offer: Revive (costs gold) or Quit
-    # If revive: use character_manager.revive_character()
-    # If quit: set game_running = False
-    if current_character is None:
-        game_running = False
-        return
-    
-    print("\n=== YOU HAVE FALLEN ===")
-    print("1. Revive (costs 50 gold)")
-    print("2. Quit to main menu")
-    try:
-        choice = input("Enter choice: ")
-    except EOFError:
-        game_running = False
-        return
-    
-    if choice == "1":
-        cost = 50
-        if current_character.get("gold", 0) < cost:
-            print("Not enough gold to revive. Returning to main menu.")
-            game_running = False
-            return
-        try:
-            current_character["gold"] -= cost
-            revived = character_manager.revive_character(current_character)
-            if revived:
-                print("You have been revived!")
-            else:
-                print("Could not revive character.")
-                game_running = False
-        except Exception as e:
-            print(f"Error during revival: {e}")
-            game_running = False
+    run_session_flow(get_cli_session().handle_character_death())
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def load_game_data(lazy=False, write=None):
+    """
+    Load all quest and item data from files into the shared catalog
+
+    With lazy=True nothing is read yet: quests load on first quest access
+    and items on first inventory or shop access, and a missing data file
+    is replaced by the defaults at that point.
+
+    Args:
+        lazy: Defer reading each file until its table is first used
+        write: Output adapter for the 'Creating default game data...'
+               notice (defaults to the console session's write)
+    """
+    global catalog
+    if write is None:
+        write = _console_write
+    if lazy:
+        catalog = game_data.GameCatalog(
+            quest_loader=lambda: _load_data_file(game_data.load_quests, "data/quests.txt",
+                                                 write),
+            item_loader=lambda: _load_data_file(game_data.load_items, "data/items.txt",
+                                                write))
     else:
-        print("Returning to main menu.")
-        game_running = False
+        catalog = game_data.load_catalog("data/quests.txt", "data/items.txt")
+    if cli_session is not None:
+        cli_session.catalog = catalog
+        cli_session.data_errors.clear()
 
 def display_welcome():
     """Display welcome message"""
@@ -605,42 +800,46 @@ def display_welcome():
     print("Build your character, complete quests, and become a legend!")
     print()
 
+def _load_data_file(loader, filename, write=print):
+    """Load one data file, creating the default files if it is missing"""
+    try:
+        return loader(filename)
+    except MissingDataFileError:
+        write("Creating default game data...")
+        game_data.create_default_data_files()
+        return loader(filename)
+
+def _console_write(text):
+    """Write through the console session's output adapter"""
+    get_cli_session().write(text)
+
+def _clean(answer):
+    """Strip a free-text answer (end of input becomes an empty string)"""
+    if answer is None:
+        return ""
+    return answer.strip()
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
 def main():
     """Main game execution function"""
-    
+
     # Display welcome message
     display_welcome()
-    
-    # Load game data
-    try:
-        load_game_data()
-        print("Game data loaded successfully!")
-    except MissingDataFileError:
-        print("Creating default game data...")
-        game_data.create_default_data_files()
-        load_game_data()
-    except InvalidDataFormatError as e:
-        print(f"Error loading game data: {e}")
-        print("Please check data files for errors.")
-        return
-    
+
+    # Game data is loaded the first time a menu needs it
+    load_game_data(lazy=True)
+
     # Main menu loop
-    while True:
-        choice = main_menu()
-        
-        if choice == 1:
-            new_game()
-        elif choice == 2:
-            load_game()
-        elif choice == 3:
-            print("\nThanks for playing Quest Chronicles!")
-            break
-        else:
-            print("Invalid choice. Please select 1-3.")
+    run_cli()
 
 if __name__ == "__main__":
+    # QUEST_PROFILE=1 or --profile times every game module call
+    import instrumentation
+    instrumentation.enable_from_environment()
+    # QUEST_METRICS_PORT / QUEST_METRICS_FILE export metrics for a scraper
+    import metrics
+    metrics.export_from_environment()
     main()
@@ -0,0 +1,344 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Metrics Module
+
+This module is an in-process metrics registry. The game modules update
+counters, gauges and histograms as things happen (saves, loads, battles,
+quests, shop trades, load errors), and the registry can be exported in
+the Prometheus text format to a file or over a small local HTTP endpoint
+for a scraper.
+
+Each update is a dictionary add under a per-metric lock, so metrics stay
+correct when save-file I/O runs on the session server's thread pool and
+cost well under a microsecond on the hot paths.
+"""
+
+import atexit
+import bisect
+import functools
+import os
+import threading
+
+from custom_exceptions import GameError
+
+# Environment variables that switch exporting on
+METRICS_FILE_ENV_VAR = "QUEST_METRICS_FILE"
+METRICS_PORT_ENV_VAR = "QUEST_METRICS_PORT"
+
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# ============================================================================
+# METRIC TYPES
+# ============================================================================
+
+class Counter:
+    """
+    Monotonically increasing value, optionally split by labels
+
+    Label values are passed as a tuple in labelnames order.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name, help_text, labelnames=()):
+        """Create an empty counter"""
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, labels=()):
+        """Add amount (default 1) to the series for labels"""
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def get(self, labels=()):
+        """
+        Read one series
+
+        Returns: Current value (0 if never updated)
+        """
+        return self.values.get(labels, 0)
+
+    def samples(self):
+        """
+        List the exported samples
+
+        Returns: List of (suffix, labels dict, value)
+        """
+        with self._lock:
+            items = sorted(self.values.items())
+        return [("", dict(zip(self.labelnames, key)), value) for key, value in items]
+
+    def reset(self):
+        """Forget every series"""
+        with self._lock:
+            self.values.clear()
+
+class Gauge(Counter):
+    """Value that can go up and down (e.g. sessions currently open)"""
+
+    kind = "gauge"
+
+    def set(self, value, labels=()):
+        """Set the series for labels to value"""
+        with self._lock:
+            self.values[labels] = value
+
+    def dec(self, amount=1, labels=()):
+        """Subtract amount (default 1) from the series for labels"""
+        self.inc(-amount, labels)
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets):
+        """Create an empty histogram with the given upper bounds"""
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.labelnames = ()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value):
+        """Record one value"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def samples(self):
+        """
+        List the exported samples (_bucket per bound, _sum, _count)
+
+        Returns: List of (suffix, labels dict, value)
+        """
+        with self._lock:
+            counts = list(self.counts)
+            total = self.sum
+            count = self.count
+
+        samples = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            running += bucket_count
+            samples.append(("_bucket", {"le": _format_number(bound)}, running))
+        samples.append(("_bucket", {"le": "+Inf"}, count))
+        samples.append(("_sum", {}, total))
+        samples.append(("_count", {}, count))
+        return samples
+
+    def reset(self):
+        """Forget every observation"""
+        with self._lock:
+            self.counts = [0] * (len(self.buckets) + 1)
+            self.sum = 0
+            self.count = 0
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+class MetricsRegistry:
+    """Named collection of metrics, exported together"""
+
+    def __init__(self):
+        """Create an empty registry"""
+        self.metrics = {}
+
+    def counter(self, name, help_text, labelnames=()):
+        """Get or create a counter"""
+        return self._register(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()):
+        """Get or create a gauge"""
+        return self._register(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, buckets):
+        """Get or create a histogram"""
+        return self._register(Histogram, name, help_text, buckets)
+
+    def reset(self):
+        """Zero every metric (metric objects stay registered)"""
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def render(self):
+        """
+        Export every metric in the Prometheus text format
+
+        Returns: String ending in a newline
+        """
+        lines = []
+        for name in sorted(self.metrics):
+            metric = self.metrics[name]
+            lines.append(f"# HELP {name} {metric.help_text}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric_class, name, help_text, extra):
+        """Return the existing metric called name or register a new one"""
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = metric_class(name, help_text, extra)
+            self.metrics[name] = metric
+        elif type(metric) is not metric_class:
+            raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+        return metric
+
+# Default registry used by the game modules
+REGISTRY = MetricsRegistry()
+
+# ============================================================================
+# GAME METRICS
+# ============================================================================
+
+SAVES = REGISTRY.counter("quest_saves_total", "Characters saved")
+SAVE_SECONDS = REGISTRY.histogram("quest_save_seconds", "Time spent writing a save file",
+                                  (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0))
+LOADS = REGISTRY.counter("quest_loads_total", "Successful loads", ("kind",))
+LOAD_ERRORS = REGISTRY.counter("quest_load_errors_total", "Failed loads by exception class",
+                               ("kind", "exception"))
+BATTLES = REGISTRY.counter("quest_battles_total", "Finished battles by result", ("result",))
+BATTLE_TURNS = REGISTRY.histogram("quest_battle_turns", "Turns per finished battle",
+                                  (1, 2, 3, 5, 8, 13, 21, 34, 55))
+QUESTS_ACCEPTED = REGISTRY.counter("quest_quests_accepted_total", "Quests accepted")
+QUESTS_COMPLETED = REGISTRY.counter("quest_quests_completed_total", "Quests completed")
+ITEMS_BOUGHT = REGISTRY.counter("quest_items_bought_total", "Items bought in the shop")
+ITEMS_SOLD = REGISTRY.counter("quest_items_sold_total", "Items sold to the shop")
+ACTIVE_SESSIONS = REGISTRY.gauge("quest_active_sessions", "Game sessions currently connected")
+
+def track_loads(kind):
+    """
+    Decorator counting successful loads and GameError failures
+
+    Failures are counted under the exception's class name and re-raised.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                result = func(*args, **kwargs)
+            except GameError as error:
+                LOAD_ERRORS.inc(1, (kind, type(error).__name__))
+                raise
+            LOADS.inc(1, (kind,))
+            return result
+        return wrapper
+    return decorate
+
+def record_battle(winner, turns):
+    """Count a finished battle ('player', 'enemy' or None for an escape)"""
+    if winner == "player":
+        BATTLES.inc(1, ("won",))
+    elif winner == "enemy":
+        BATTLES.inc(1, ("lost",))
+    else:
+        BATTLES.inc(1, ("escaped",))
+    BATTLE_TURNS.observe(turns)
+
+# ============================================================================
+# EXPORTING
+# ============================================================================
+
+def write_prometheus_file(filename, registry=REGISTRY):
+    """
+    Write the registry to a file a scraper (e.g. node_exporter's textfile
+    collector) can read; the file is replaced atomically
+    """
+    directory = os.path.dirname(filename)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    temp_file = filename + ".tmp"
+    with open(temp_file, "w") as f:
+        f.write(registry.render())
+    os.replace(temp_file, filename)
+
+def start_http_server(port, host=DEFAULT_METRICS_HOST, registry=REGISTRY):
+    """
+    Serve the registry at http://host:port/metrics from a daemon thread
+
+    Returns: The HTTP server (call shutdown() to stop it)
+    """
+    # Imported here: http.server is slow to import and most runs never export
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Keep scrapes out of the game console
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+def export_from_environment(environ=None):
+    """
+    Start exporting if QUEST_METRICS_PORT or QUEST_METRICS_FILE is set
+
+    The port starts the HTTP endpoint; the file is written at exit.
+
+    Returns: The HTTP server, or None if no port was configured
+    """
+    if environ is None:
+        environ = os.environ
+    filename = environ.get(METRICS_FILE_ENV_VAR)
+    if filename:
+        atexit.register(write_prometheus_file, filename)
+    port = environ.get(METRICS_PORT_ENV_VAR)
+    if port:
+        return start_http_server(int(port))
+    return None
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _format_labels(labels):
+    """Render a labels dictionary as {name="value",...}"""
+    if not labels:
+        return ""
+    parts = []
+    for name, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+def _format_number(value):
+    """Render a sample value the way Prometheus expects"""
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== METRICS TEST ===")
+
+    # SAVES.inc()
+    # record_battle("player", 4)
+    # print(REGISTRY.render())
+    # server = start_http_server(9163)   # curl http://127.0.0.1:9163/metrics
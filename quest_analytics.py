@@ -0,0 +1,258 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Quest Analytics Module
+
+This module encodes completed and active quests as integer bitsets so that
+population-wide questions ("how many characters finished quest X but not
+quest Y?") become a few AND/OR/popcount operations instead of list scans.
+"""
+
+from custom_exceptions import (
+    QuestNotFoundError,
+    CharacterNotFoundError,
+    SaveFileCorruptedError,
+    InvalidSaveDataError
+)
+
+import character_manager
+import symbol_table
+
+# ============================================================================
+# QUEST BIT INDEX
+# ============================================================================
+
+def build_quest_bit_index(quest_data_dict):
+    """
+    Assign every quest in the catalog a bit position
+
+    Positions follow catalog order, so appending quests to the data file
+    keeps the positions of existing quests stable.
+
+    Returns: Dictionary {quest_id: bit_position}
+    """
+    bit_index = {}
+    for position, quest_id in enumerate(quest_data_dict):
+        bit_index[quest_id] = position
+    return bit_index
+
+def get_quest_bit(quest_id, bit_index):
+    """
+    Get the bit position assigned to a quest
+
+    Returns: Integer bit position
+    Raises: QuestNotFoundError if quest_id has no bit position
+    """
+    if quest_id not in bit_index:
+        raise QuestNotFoundError(f"Quest not found in bit index: {quest_id}")
+    return bit_index[quest_id]
+
+def encode_quest_list(quest_ids, bit_index):
+    """
+    Encode a list of quest IDs as a bitset
+
+    Quest IDs missing from the index (e.g. stale entries in old saves)
+    are skipped.
+
+    Returns: Integer with one bit set per quest
+    """
+    bits = 0
+    for quest_id in quest_ids:
+        position = bit_index.get(quest_id)
+        if position is not None:
+            bits |= 1 << position
+    return bits
+
+def decode_quest_bits(bits, bit_index):
+    """
+    Turn a bitset back into a list of quest IDs (catalog order)
+
+    Returns: List of quest IDs
+    """
+    quest_ids = []
+    for quest_id, position in bit_index.items():
+        if bits >> position & 1:
+            quest_ids.append(quest_id)
+    return quest_ids
+
+def encode_character_quests(character, bit_index):
+    """
+    Encode a character's quest progress
+
+    Returns: Dictionary with 'completed' and 'active' bitsets
+    """
+    completed = symbol_table.as_names(character.get('completed_quests', []))
+    active = symbol_table.as_names(character.get('active_quests', []))
+    return {
+        "completed": encode_quest_list(completed, bit_index),
+        "active": encode_quest_list(active, bit_index)
+    }
+
+# ============================================================================
+# POPULATION BITSETS
+# ============================================================================
+
+def build_population_bitsets(characters, bit_index):
+    """
+    Build column bitsets for a whole population of characters
+
+    Character number i owns bit i of every column, so each quest gets one
+    integer per status telling which characters completed (or are on) it.
+
+    Args:
+        characters: List of character dictionaries
+        bit_index: Quest bit index from build_quest_bit_index()
+
+    Returns: Dictionary with:
+            - names: character names in bit order
+            - size: number of characters
+            - completed: {quest_id: bitset of characters}
+            - active: {quest_id: bitset of characters}
+    """
+    size = len(characters)
+    names = []
+    completed_positions = {quest_id: [] for quest_id in bit_index}
+    active_positions = {quest_id: [] for quest_id in bit_index}
+
+    for position, character in enumerate(characters):
+        names.append(character.get('name', ''))
+        for quest_id in symbol_table.as_names(character.get('completed_quests', [])):
+            if quest_id in completed_positions:
+                completed_positions[quest_id].append(position)
+        for quest_id in symbol_table.as_names(character.get('active_quests', [])):
+            if quest_id in active_positions:
+                active_positions[quest_id].append(position)
+
+    return {
+        "names": names,
+        "size": size,
+        "completed": _positions_to_columns(completed_positions, size),
+        "active": _positions_to_columns(active_positions, size)
+    }
+
+def load_population_bitsets(bit_index, save_directory="data/save_games"):
+    """
+    Load every saved character and build population bitsets
+
+    Saves that cannot be loaded are skipped and reported instead of
+    aborting the whole scan.
+
+    Returns: Population dictionary (see build_population_bitsets) with an
+             extra 'skipped' list of character names that failed to load
+    """
+    characters = []
+    skipped = []
+    for name in character_manager.list_saved_characters(save_directory):
+        try:
+            characters.append(character_manager.load_character(name, save_directory))
+        except (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError):
+            skipped.append(name)
+
+    population = build_population_bitsets(characters, bit_index)
+    population["skipped"] = skipped
+    return population
+
+def population_mask(population, completed=(), not_completed=(), active=(), not_active=()):
+    """
+    Select characters matching every given quest condition
+
+    Example: population_mask(pop, completed=["goblin_hunter"],
+                             not_completed=["orc_menace"])
+
+    Returns: Bitset of matching characters
+    Raises: QuestNotFoundError if a quest is not in the population index
+    """
+    mask = (1 << population["size"]) - 1
+    for quest_id in completed:
+        mask &= _get_column(population, "completed", quest_id)
+    for quest_id in not_completed:
+        mask &= ~_get_column(population, "completed", quest_id)
+    for quest_id in active:
+        mask &= _get_column(population, "active", quest_id)
+    for quest_id in not_active:
+        mask &= ~_get_column(population, "active", quest_id)
+    return mask
+
+def count_population(population, completed=(), not_completed=(), active=(), not_active=()):
+    """
+    Count characters matching every given quest condition
+
+    Returns: Integer count
+    """
+    mask = population_mask(population, completed, not_completed, active, not_active)
+    return mask.bit_count()
+
+def count_any_completed(population, quest_ids):
+    """
+    Count characters that completed at least one of the given quests
+
+    Returns: Integer count
+    """
+    mask = 0
+    for quest_id in quest_ids:
+        mask |= _get_column(population, "completed", quest_id)
+    return mask.bit_count()
+
+def select_population(population, completed=(), not_completed=(), active=(), not_active=()):
+    """
+    Get the names of characters matching every given quest condition
+
+    Returns: List of character names
+    """
+    mask = population_mask(population, completed, not_completed, active, not_active)
+    names = population["names"]
+    selected = []
+    while mask:
+        lowest = mask & -mask
+        selected.append(names[lowest.bit_length() - 1])
+        mask ^= lowest
+    return selected
+
+def get_completion_counts(population):
+    """
+    Count how many characters completed each quest
+
+    Returns: Dictionary {quest_id: count}
+    """
+    counts = {}
+    for quest_id, column in population["completed"].items():
+        counts[quest_id] = column.bit_count()
+    return counts
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _positions_to_columns(positions_by_quest, size):
+    """Pack per-quest position lists into integer bitsets"""
+    columns = {}
+    byte_count = (size + 7) // 8
+    for quest_id, positions in positions_by_quest.items():
+        if not positions:
+            columns[quest_id] = 0
+            continue
+        packed = bytearray(byte_count)
+        for position in positions:
+            packed[position >> 3] |= 1 << (position & 7)
+        columns[quest_id] = int.from_bytes(packed, "little")
+    return columns
+
+def _get_column(population, status, quest_id):
+    """Look up one quest column, raising QuestNotFoundError if unknown"""
+    columns = population[status]
+    if quest_id not in columns:
+        raise QuestNotFoundError(f"Quest not found in population index: {quest_id}")
+    return columns[quest_id]
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== QUEST ANALYTICS TEST ===")
+
+    # import game_data
+    # quests = game_data.load_quests()
+    # bit_index = build_quest_bit_index(quests)
+    # population = load_population_bitsets(bit_index)
+    # print(count_population(population, completed=["first_steps"],
+    #                        not_completed=["goblin_hunter"]))
@@ -14,10 +14,13 @@ from custom_exceptions import (
     QuestRequirementsNotMetError,
     QuestAlreadyCompletedError,
     QuestNotActiveError,
-    InsufficientLevelError
+    InsufficientLevelError,
+    CharacterDeadError
 )
 
 import character_manager
+import metrics
+import symbol_table
 
 # ============================================================================
 # QUEST MANAGEMENT
@@ -83,6 +86,7 @@ def accept_quest(character, quest_id, quest_data_dict):
             )
     
     character['active_quests'].append(quest_id)
+    metrics.QUESTS_ACCEPTED.inc()
     return True
 
 def complete_quest(character, quest_id, quest_data_dict):
@@ -136,8 +140,53 @@ def complete_quest(character, quest_id, quest_data_dict):
     if gold_reward != 0:
         character_manager.add_gold(character, gold_reward)
     
+    metrics.QUESTS_COMPLETED.inc()
     return {"xp": xp_reward, "gold": gold_reward}
 
+def complete_quests(character, quest_ids, quest_data_dict):
+    """
+    Complete several active quests for one character at once
+
+    Every quest is validated before anything changes, then XP and gold
+    are granted as single totals (one gain_experience/add_gold call).
+
+    Returns: Reward report dictionary:
+            {'name', 'quests', 'xp', 'gold', 'levels_gained'}
+    Raises:
+        QuestNotFoundError if any quest_id not in quest_data_dict
+        QuestNotActiveError if any quest not in active_quests (or repeated)
+        CharacterDeadError if XP would be granted to a dead character
+        ValueError if the gold reward would make gold negative
+    """
+    quest_ids = list(quest_ids)
+    _validate_batch_completion(character, quest_ids, quest_data_dict)
+    return _apply_batch_completion(character, quest_ids, quest_data_dict)
+
+def complete_quest_for_party(characters, quest_id, quest_data_dict):
+    """
+    Complete the same quest for every member of a party or raid
+
+    All members are validated first, so one ineligible member leaves the
+    whole party untouched. A character listed twice would be paid twice;
+    like a quest listed twice in complete_quests, the second entry is
+    treated as completing a quest that is no longer active.
+
+    Returns: List of reward reports (see complete_quests), one per member
+    Raises: Same exceptions as complete_quests
+    """
+    seen = set()
+    for character in characters:
+        if id(character) in seen:
+            raise QuestNotActiveError(
+                f"Quest not active: {quest_id} ({character.get('name')} is listed twice)")
+        seen.add(id(character))
+        _validate_batch_completion(character, [quest_id], quest_data_dict)
+
+    reports = []
+    for character in characters:
+        reports.append(_apply_batch_completion(character, [quest_id], quest_data_dict))
+    return reports
+
 def abandon_quest(character, quest_id):
     """
     Remove a quest from active quests without completing it
@@ -287,6 +336,159 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
     
     return chain
 
+# ============================================================================
+# QUEST GRAPH QUERIES
+# ============================================================================
+
+# Derived indexes for the most recently used quest catalog
+_quest_graph_cache = {"catalog": None, "size": 0, "graph": None}
+
+def build_quest_graph(quest_data_dict):
+    """
+    Precompute the prerequisite graph of a quest catalog
+
+    Returns: Dictionary with:
+            - parent: {quest_id: prerequisite quest_id or None}
+            - unlocks: {quest_id: [quest_ids that require it]}
+            - depth: {quest_id: number of prerequisites before it}
+    Raises:
+        QuestNotFoundError if a prerequisite does not exist
+        QuestRequirementsNotMetError if prerequisites form a cycle
+    """
+    parent = {}
+    unlocks = {}
+    for quest_id, quest in quest_data_dict.items():
+        unlocks[quest_id] = []
+        prereq = quest.get('prerequisite')
+        if prereq is None or str(prereq).upper() == "NONE":
+            parent[quest_id] = None
+        else:
+            parent[quest_id] = prereq
+
+    for quest_id, prereq in parent.items():
+        if prereq is None:
+            continue
+        if prereq not in unlocks:
+            raise QuestNotFoundError(f"Prerequisite quest not found: {prereq}")
+        unlocks[prereq].append(quest_id)
+
+    # Breadth-first from the root quests; anything never reached is on a cycle
+    depth = {}
+    frontier = [quest_id for quest_id, prereq in parent.items() if prereq is None]
+    for quest_id in frontier:
+        depth[quest_id] = 0
+    while frontier:
+        next_frontier = []
+        for quest_id in frontier:
+            for child in unlocks[quest_id]:
+                depth[child] = depth[quest_id] + 1
+                next_frontier.append(child)
+        frontier = next_frontier
+
+    if len(depth) != len(parent):
+        stuck = [quest_id for quest_id in parent if quest_id not in depth]
+        raise QuestRequirementsNotMetError(
+            f"Circular quest prerequisites: {', '.join(stuck)}"
+        )
+
+    return {"parent": parent, "unlocks": unlocks, "depth": depth}
+
+def get_quest_graph(quest_data_dict):
+    """
+    Get the cached prerequisite graph, rebuilding it if the catalog changed
+
+    Returns: Graph dictionary (see build_quest_graph)
+    """
+    cache = _quest_graph_cache
+    if cache["catalog"] is not quest_data_dict or cache["size"] != len(quest_data_dict):
+        cache["graph"] = build_quest_graph(quest_data_dict)
+        cache["catalog"] = quest_data_dict
+        cache["size"] = len(quest_data_dict)
+    return cache["graph"]
+
+def clear_quest_graph_cache():
+    """Forget cached graph data (call after editing a catalog in place)"""
+    _quest_graph_cache["catalog"] = None
+    _quest_graph_cache["size"] = 0
+    _quest_graph_cache["graph"] = None
+
+def get_quest_unlocks(quest_id, quest_data_dict, recursive=False):
+    """
+    Get the quests that completing quest_id unlocks
+
+    Args:
+        recursive: If True, include everything further down the chain
+
+    Returns: List of quest IDs
+    Raises: QuestNotFoundError if quest doesn't exist
+    """
+    if quest_id not in quest_data_dict:
+        raise QuestNotFoundError(f"Quest not found: {quest_id}")
+
+    unlocks = get_quest_graph(quest_data_dict)["unlocks"]
+    if not recursive:
+        return list(unlocks[quest_id])
+
+    result = list(unlocks[quest_id])
+    position = 0
+    while position < len(result):
+        result.extend(unlocks[result[position]])
+        position += 1
+    return result
+
+def get_quest_path(character, target_quest_id, quest_data_dict):
+    """
+    Get the quests a character still has to finish to reach a target quest
+
+    Walks the prerequisite chain back from the target and stops at the
+    first completed quest, so only the remaining steps are visited.
+
+    Returns: Dictionary with:
+            - quests: remaining quest IDs in order, ending with the target
+            - required_level: highest required_level along the path
+            - levels_needed: levels still missing for that requirement
+            - next_quest: first quest of the path the character can
+              accept right now, or None
+    Raises:
+        QuestNotFoundError if the target quest doesn't exist
+        QuestAlreadyCompletedError if the target is already completed
+    """
+    if target_quest_id not in quest_data_dict:
+        raise QuestNotFoundError(f"Quest not found: {target_quest_id}")
+
+    completed = character.get('completed_quests', [])
+    if target_quest_id in completed:
+        raise QuestAlreadyCompletedError(f"Quest already completed: {target_quest_id}")
+
+    parent = get_quest_graph(quest_data_dict)["parent"]
+    completed = set(completed)
+    path = []
+    current_id = target_quest_id
+    while current_id is not None and current_id not in completed:
+        path.append(current_id)
+        current_id = parent[current_id]
+    path.reverse()
+
+    required_level = 1
+    for quest_id in path:
+        level = quest_data_dict[quest_id].get('required_level', 1)
+        if level > required_level:
+            required_level = level
+
+    level = character.get('level', 1)
+    first_id = path[0]
+    if can_accept_quest(character, first_id, quest_data_dict):
+        next_quest = first_id
+    else:
+        next_quest = None
+
+    return {
+        "quests": path,
+        "required_level": required_level,
+        "levels_needed": max(0, required_level - level),
+        "next_quest": next_quest
+    }
+
 # ============================================================================
 # QUEST STATISTICS
 # ============================================================================
@@ -370,12 +572,22 @@ def display_quest_list(quest_list):
     Shows: Title, Required Level, Rewards
     """
     # TODO: Implement quest list display
+    print(format_quest_list(quest_list))
+
+def format_quest_list(quest_list):
+    """
+    Format a list of quests in summary format
+
+    Returns: String with one line per quest
+    """
+    lines = []
     for quest in quest_list:
         title = quest.get('title', quest.get('quest_id', 'Unknown Quest'))
         level = quest.get('required_level', 1)
         xp = quest.get('reward_xp', 0)
         gold = quest.get('reward_gold', 0)
-        print(f"- {title} (Lvl {level}) → {xp} XP, {gold} gold")
+        lines.append(f"- {title} (Lvl {level}) → {xp} XP, {gold} gold")
+    return "\n".join(lines)
 
 def display_character_quest_progress(character, quest_data_dict):
     """
@@ -388,16 +600,28 @@ def display_character_quest_progress(character, quest_data_dict):
     - Total rewards earned
     """
     # TODO: Implement progress display
+    print(format_character_quest_progress(character, quest_data_dict))
+
+def format_character_quest_progress(character, quest_data_dict):
+    """
+    Format character's quest statistics and progress
+
+    Returns: String with the progress lines
+    """
+    if symbol_table.is_packed(character):
+        character = symbol_table.unpack_character(dict(character))
     active_count = len(character.get('active_quests', []))
     completed_count = len(character.get('completed_quests', []))
     completion_pct = get_quest_completion_percentage(character, quest_data_dict)
     totals = get_total_quest_rewards_earned(character, quest_data_dict)
     
-    print("=== Quest Progress ===")
-    print(f"Active quests: {active_count}")
-    print(f"Completed quests: {completed_count}")
-    print(f"Completion: {completion_pct:.1f}%")
-    print(f"Total rewards earned: {totals['total_xp']} XP, {totals['total_gold']} gold")
+    return "\n".join([
+        "=== Quest Progress ===",
+        f"Active quests: {active_count}",
+        f"Completed quests: {completed_count}",
+        f"Completion: {completion_pct:.1f}%",
+        f"Total rewards earned: {totals['total_xp']} XP, {totals['total_gold']} gold"
+    ])
 
 # ============================================================================
 # VALIDATION
@@ -424,6 +648,65 @@ def validate_quest_prerequisites(quest_data_dict):
                 )
     return True
 
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _validate_batch_completion(character, quest_ids, quest_data_dict):
+    """Check a batch completion without changing the character"""
+    active = character.get('active_quests', [])
+    seen = set()
+    total_xp = 0
+    total_gold = 0
+
+    for quest_id in quest_ids:
+        if quest_id not in quest_data_dict:
+            raise QuestNotFoundError(f"Quest not found: {quest_id}")
+        if quest_id in seen or quest_id not in active:
+            raise QuestNotActiveError(f"Quest not active: {quest_id}")
+        seen.add(quest_id)
+        total_xp += quest_data_dict[quest_id].get('reward_xp', 0)
+        total_gold += quest_data_dict[quest_id].get('reward_gold', 0)
+
+    if total_xp > 0 and character_manager.is_character_dead(character):
+        raise CharacterDeadError("Dead characters cannot gain experience")
+    if character.get('gold', 0) + total_gold < 0:
+        raise ValueError("Gold cannot be negative")
+
+def _apply_batch_completion(character, quest_ids, quest_data_dict):
+    """Move validated quests to completed and grant aggregated rewards"""
+    character.setdefault('active_quests', [])
+    character.setdefault('completed_quests', [])
+
+    done = set(quest_ids)
+    character['active_quests'][:] = [q for q in character['active_quests'] if q not in done]
+    completed = character['completed_quests']
+    already = set(completed)
+
+    total_xp = 0
+    total_gold = 0
+    for quest_id in quest_ids:
+        quest = quest_data_dict[quest_id]
+        total_xp += quest.get('reward_xp', 0)
+        total_gold += quest.get('reward_gold', 0)
+        if quest_id not in already:
+            completed.append(quest_id)
+
+    start_level = character.get('level', 1)
+    if total_xp > 0:
+        character_manager.gain_experience(character, total_xp)
+    if total_gold != 0:
+        character_manager.add_gold(character, total_gold)
+
+    metrics.QUESTS_COMPLETED.inc(len(quest_ids))
+    return {
+        "name": character.get('name'),
+        "quests": list(quest_ids),
+        "xp": total_xp,
+        "gold": total_gold,
+        "levels_gained": character.get('level', 1) - start_level
+    }
+
 
 # ============================================================================
 # TESTING
@@ -0,0 +1,197 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Record Schema Module
+
+This module describes the "KEY: value" records used by the data files and
+save files declaratively. A RecordSchema lists each field's key, its
+dictionary name, a converter and whether it is required; it is compiled
+into a dictionary from key to field, so parsing a line is one lookup and
+one conversion, and the required/choice checks happen in the same pass
+instead of a second walk over the finished record.
+"""
+
+from custom_exceptions import InvalidDataFormatError
+
+# How field types are named in error messages
+TYPE_NAMES = {int: "an integer", str: "a string", list: "a list"}
+
+# ============================================================================
+# SCHEMA
+# ============================================================================
+
+class Field:
+    """
+    One field of a record
+
+    Attributes:
+        key: Key as written in the file (e.g. 'REWARD_XP')
+        name: Key in the parsed dictionary (e.g. 'reward_xp')
+        convert: Function from the stripped text value to the stored value;
+                 ValueError means the value is invalid
+        kind: Type the stored value must have (checked by validate)
+        required: Whether a record without this field is invalid
+        choices: Allowed stored values, or None for any
+        type_message: Overrides the schema's 'type' message for this field
+    """
+
+    __slots__ = ("key", "name", "convert", "kind", "required", "choices", "type_message")
+
+    def __init__(self, key, name, convert=str, kind=str, required=True, choices=None,
+                 type_message=None):
+        """Describe a field"""
+        self.key = key
+        self.name = name
+        self.convert = convert
+        self.kind = kind
+        self.required = required
+        self.choices = None if choices is None else frozenset(choices)
+        self.type_message = type_message
+
+class RecordSchema:
+    """
+    Compiled parser and validator for one record type
+
+    Error messages are format strings; defaults are built from the record
+    name and can be overridden per schema with messages={...}:
+        line     - a line without the separator ({line})
+        unknown  - a key the schema does not know ({key}); None ignores them
+        convert  - a converter rejected a value ({key}, {kind}, {error})
+        missing  - a required field is absent ({field})
+        type     - validate() found a value of the wrong type ({field}, {kind})
+        choice   - a value outside the field's choices ({field}, {value})
+    """
+
+    def __init__(self, record_name, fields, error_class=InvalidDataFormatError,
+                 separator=": ", messages=None):
+        """Compile the field list into a key dispatch table"""
+        self.record_name = record_name
+        self.fields = tuple(fields)
+        self.error_class = error_class
+        self.separator = separator
+        self.messages = {
+            "line": f"Invalid {record_name} line format: {{line}}",
+            "unknown": f"Unknown {record_name} field: {{key}}",
+            "convert": "{key} must be {kind}",
+            "missing": f"Missing required {record_name} field: {{field}}",
+            "type": f"{record_name.capitalize()} field '{{field}}' must be {{kind}}",
+            "choice": f"Invalid {record_name} {{field}}: {{value}}"
+        }
+        if messages:
+            self.messages.update(messages)
+
+        self.compiled = {field.key: (field.name, field.convert, field) for field in self.fields}
+        self.required = tuple(field.name for field in self.fields if field.required)
+        self.checked = tuple(field for field in self.fields if field.choices is not None)
+
+    def parse(self, lines, validate=True):
+        """
+        Parse stripped, non-empty lines into a record dictionary
+
+        Args:
+            lines: Lines of one record
+            validate: Also check required fields and choices (same pass)
+
+        Returns: Dictionary of converted field values
+        Raises: error_class if a line, key or value is invalid, or (when
+                validating) a required field is missing
+        """
+        record = {}
+        compiled = self.compiled
+        separator = self.separator
+
+        for line in lines:
+            key, found, value = line.partition(separator)
+            entry = compiled.get(key)
+            if entry is None:
+                # Rare cases: no separator, odd spacing/case, unknown keys
+                entry = self._lookup_slow(line, key, found)
+                if entry is None:
+                    continue
+            name, convert, field = entry
+            try:
+                record[name] = convert(value.strip())
+            except ValueError as e:
+                raise self.error_class(self.messages["convert"].format(
+                    key=field.key, kind=TYPE_NAMES.get(field.kind, field.kind), error=e))
+
+        if validate:
+            if len(record) != len(self.fields):
+                self._check_required(record)
+            for field in self.checked:
+                value = record.get(field.name)
+                if value is not None and value not in field.choices:
+                    raise self.error_class(self.messages["choice"].format(
+                        field=field.name, value=value))
+        return record
+
+    def validate(self, record):
+        """
+        Check a record built elsewhere: required fields, types and choices
+
+        Returns: True if valid
+        Raises: error_class describing the first problem found
+        """
+        self._check_required(record)
+        for field in self.fields:
+            if field.name not in record or field.kind is None:
+                continue
+            value = record[field.name]
+            if not isinstance(value, field.kind):
+                message = field.type_message or self.messages["type"]
+                raise self.error_class(message.format(
+                    field=field.name, kind=TYPE_NAMES.get(field.kind, field.kind)))
+            if field.choices is not None and value not in field.choices:
+                raise self.error_class(self.messages["choice"].format(
+                    field=field.name, value=value))
+        return True
+
+    def find_error_line(self, lines):
+        """
+        Find the line of a record that parse() rejected
+
+        Each line is parsed on its own, so a missing required field is
+        not attributed to any line.
+
+        Returns: Index of the first invalid line, or None
+        """
+        for index, line in enumerate(lines):
+            try:
+                record = self.parse([line], validate=False)
+            except self.error_class:
+                return index
+            for field in self.checked:
+                value = record.get(field.name)
+                if value is not None and value not in field.choices:
+                    return index
+        return None
+
+    def _lookup_slow(self, line, key, found):
+        """
+        Resolve a key that is not an exact match
+
+        Returns: (name, convert, field), or None if the key is unknown and ignored
+        Raises: error_class for a line without the separator or an unknown key
+        """
+        if not found:
+            raise self.error_class(self.messages["line"].format(line=line))
+        key = key.strip().upper()
+        entry = self.compiled.get(key)
+        if entry is None and self.messages["unknown"] is not None:
+            raise self.error_class(self.messages["unknown"].format(key=key))
+        return entry
+
+    def _check_required(self, record):
+        """Raise for the first required field missing from record"""
+        for name in self.required:
+            if name not in record:
+                raise self.error_class(self.messages["missing"].format(field=name))
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== RECORD SCHEMA TEST ===")
+
+    # schema = RecordSchema("point", [Field("X", "x", int, int), Field("Y", "y", int, int)])
+    # print(schema.parse(["X: 1", "Y: 2"]))
@@ -0,0 +1,223 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Session Server Module
+
+This module hosts many players in one process. It is an asyncio server on
+local TCP or a Unix socket; every connection gets its own GameSession,
+all sessions share one quest/item catalog, and the session's menu logic is
+driven line by line from the socket. Save-file I/O runs on a thread pool
+so a slow disk never stalls the event loop.
+
+A connection first names its player; that player's characters are saved
+in their own directory under the server's save directory, so players
+cannot list, load or overwrite each other's saves. A player name can only
+be connected once at a time.
+"""
+
+import asyncio
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import game_data
+import metrics
+from main import BlockingCall, GameSession, DEFAULT_SAVE_DIRECTORY
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8163
+
+# Threads used for save-file I/O
+DEFAULT_IO_WORKERS = 4
+
+# Player names become directory names: letters, digits and underscores only
+PLAYER_NAME_PATTERN = re.compile(r"\w{1,64}")
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class SessionServer:
+    """
+    asyncio server running one GameSession per connection
+
+    Attributes:
+        active_sessions: Connections currently being served
+        total_sessions: Connections served since start
+        players: Player names currently connected
+    """
+
+    def __init__(self, catalog, save_directory=DEFAULT_SAVE_DIRECTORY,
+                 io_workers=DEFAULT_IO_WORKERS):
+        """
+        Create a server around a shared catalog
+
+        Args:
+            catalog: game_data.GameCatalog shared (read-only) by every session
+            save_directory: Where player characters are saved (one
+                            directory per player name)
+            io_workers: Size of the save-file I/O thread pool
+        """
+        self.catalog = catalog
+        self.save_directory = save_directory
+        self.executor = ThreadPoolExecutor(max_workers=io_workers)
+        self.server = None
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self.players = set()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Start listening on a TCP port (port 0 picks a free one)
+
+        Returns: The asyncio server
+        """
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    async def start_unix(self, path):
+        """
+        Start listening on a Unix socket
+
+        Returns: The asyncio server
+        """
+        self.server = await asyncio.start_unix_server(self.handle_connection, path)
+        return self.server
+
+    async def close(self):
+        """Stop accepting connections and shut down the I/O pool"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=True)
+
+    async def handle_connection(self, reader, writer):
+        """Serve one player until they exit or disconnect"""
+        self.active_sessions += 1
+        metrics.ACTIVE_SESSIONS.inc()
+        self.total_sessions += 1
+
+        def write(text):
+            writer.write((text + "\n").encode())
+
+        player = None
+        try:
+            player = await self.drive(self.sign_in(write), reader, writer)
+            if player is not None:
+                session = GameSession(self.catalog, os.path.join(self.save_directory, player),
+                                      write)
+                await self.drive(session.play(), reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # Player disconnected mid-write; nothing left to send
+            pass
+        finally:
+            self.players.discard(player)
+            self.active_sessions -= 1
+            metrics.ACTIVE_SESSIONS.dec()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def sign_in(self, write):
+        """
+        Ask which player this connection is (a session flow)
+
+        Returns: Player name, or None if the client closed first
+        """
+        while True:
+            name = yield "Enter player name: "
+            if name is None:
+                return None
+            name = name.strip()
+            if PLAYER_NAME_PATTERN.fullmatch(name) is None:
+                write("Player names may only use letters, digits and underscores.")
+            elif name in self.players:
+                write(f"Player {name} is already connected.")
+            else:
+                self.players.add(name)
+                return name
+
+    async def drive(self, flow, reader, writer):
+        """
+        Drive a session generator from a socket
+
+        Prompts are written to the client and answered with the next line
+        (None once the client closes its side, or after a line longer than
+        the stream limit, which closes the input); BlockingCalls run on the
+        executor and their exceptions are raised back inside the session.
+
+        Returns: The flow's return value
+        """
+        loop = asyncio.get_running_loop()
+        value = None
+        error = None
+        closed = reader.at_eof()
+        while True:
+            try:
+                if error is not None:
+                    request = flow.throw(error)
+                else:
+                    request = flow.send(value)
+            except StopIteration as stop:
+                await writer.drain()
+                return stop.value
+
+            value = None
+            error = None
+            if isinstance(request, BlockingCall):
+                try:
+                    value = await loop.run_in_executor(self.executor, request.run)
+                except Exception as e:
+                    error = e
+            else:
+                writer.write(request.encode())
+                await writer.drain()
+                if closed:
+                    continue
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    # Line over the stream limit: stop reading this client
+                    writer.write(b"\nInput line too long; closing connection.\n")
+                    closed = True
+                    continue
+                if line:
+                    value = line.decode(errors="replace").rstrip("\r\n")
+                else:
+                    closed = True
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, metrics_port=None):
+    """
+    Load the catalog and serve players until cancelled
+
+    If metrics_port is given, metrics are served at
+    http://127.0.0.1:<metrics_port>/metrics as well.
+    """
+    server = SessionServer(game_data.load_catalog())
+    if metrics_port is not None:
+        metrics.start_http_server(metrics_port)
+    if unix_path is not None:
+        await server.start_unix(unix_path)
+        print(f"Serving Quest Chronicles on {unix_path}")
+    else:
+        await server.start(host, port)
+        print(f"Serving Quest Chronicles on {host}:{port}")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== SESSION SERVER TEST ===")
+
+    # asyncio.run(serve())
+    # Then, from other terminals:  nc 127.0.0.1 8163
@@ -0,0 +1,146 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Shared Catalog Module
+
+This module lets worker processes share one quest/item catalog instead of
+each parsing the data files again. The parent loads the catalog (and the
+enemy templates) once, then calls gc.freeze() before forking: frozen
+objects are never visited by the garbage collector, so collections in the
+workers do not write to the catalog's memory pages and the operating
+system keeps them shared copy-on-write. A worker only gets private copies
+of the pages it actually touches, so its memory does not grow with the
+size of the catalog.
+
+Where fork is not available (Windows, or macOS by default) each worker
+gets its own copy of the catalog instead.
+"""
+
+import gc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import combat_system
+import game_data
+
+_shared = {"catalog": None, "frozen": False}
+
+# ============================================================================
+# SHARING
+# ============================================================================
+
+def share_catalog(catalog=None, quest_file="data/quests.txt", item_file="data/items.txt"):
+    """
+    Make a catalog the process-wide shared catalog and freeze it for forking
+
+    Args:
+        catalog: GameCatalog to share (loaded from the files if not given;
+                 lazy tables are loaded now)
+        quest_file: Quest data file used when catalog is None
+        item_file: Item data file used when catalog is None
+
+    Returns: The shared GameCatalog
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if catalog is None:
+        catalog = game_data.load_catalog(quest_file, item_file)
+    # Touch everything the workers will read so it is built before the fork
+    catalog.quests
+    catalog.items
+    combat_system.get_enemy_templates()
+
+    _shared["catalog"] = catalog
+    gc.collect()
+    gc.freeze()
+    _shared["frozen"] = True
+    return catalog
+
+def get_shared_catalog():
+    """
+    Get the shared catalog (in the parent or in a worker)
+
+    Returns: GameCatalog, or None if share_catalog was never called
+    """
+    return _shared["catalog"]
+
+def release_shared_catalog():
+    """Forget the shared catalog and let the garbage collector see it again"""
+    _shared["catalog"] = None
+    if _shared["frozen"]:
+        gc.unfreeze()
+        _shared["frozen"] = False
+
+def can_fork():
+    """Check whether workers can inherit the catalog by forking"""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+def create_worker_pool(max_workers=None):
+    """
+    Create a process pool whose workers see the shared catalog
+
+    With fork the workers inherit the parent's frozen catalog; otherwise
+    it is copied into each worker when it starts.
+
+    Returns: concurrent.futures.ProcessPoolExecutor
+    Raises: RuntimeError if share_catalog has not been called
+    """
+    catalog = _shared["catalog"]
+    if catalog is None:
+        raise RuntimeError("Call share_catalog() before creating workers")
+
+    if can_fork():
+        return ProcessPoolExecutor(max_workers=max_workers,
+                                   mp_context=multiprocessing.get_context("fork"))
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_install_catalog,
+                               initargs=(dict(catalog.quests), dict(catalog.items)))
+
+def map_with_catalog(func, jobs, max_workers=None):
+    """
+    Run func(job) for every job on worker processes
+
+    func must be a module-level function; it reads the catalog with
+    get_shared_catalog().
+
+    Returns: List of results in job order
+    """
+    with create_worker_pool(max_workers) as pool:
+        return list(pool.map(func, jobs))
+
+def get_private_memory_kb():
+    """
+    Memory this process has written to privately (Linux only)
+
+    Returns: Private dirty kilobytes, or None if it cannot be read
+    """
+    try:
+        with open("/proc/self/smaps_rollup", "r") as f:
+            for line in f:
+                if line.startswith("Private_Dirty:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _install_catalog(quests, items):
+    """Worker initializer used when the catalog cannot be inherited"""
+    _shared["catalog"] = game_data.GameCatalog(quests, items)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== SHARED CATALOG TEST ===")
+
+    # def count_quests(job):
+    #     return len(get_shared_catalog().quests)
+    #
+    # share_catalog()
+    # print(map_with_catalog(count_quests, range(4), max_workers=4))
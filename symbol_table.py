@@ -0,0 +1,180 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Symbol Table Module
+
+This module maps quest and item ids to small integers. Every id string is
+stored once (interned) in a catalog-wide table, and a character can be
+"packed" so its inventory and quest lists are compact arrays of integers
+instead of lists of strings; comparing two ids is then integer equality.
+
+Packing is opt-in and meant for characters held in bulk (populations,
+idle sessions). The game modules work on unpacked characters, so unpack
+a character before playing with it; saving and the display functions
+accept either form and translate back to the id strings.
+"""
+
+import sys
+from array import array
+
+# Character fields holding quest or item ids
+PACKED_FIELDS = ("inventory", "active_quests", "completed_quests")
+
+# Array type code for packed id lists (unsigned 32-bit)
+SYMBOL_TYPECODE = "I"
+
+# ============================================================================
+# SYMBOL TABLE
+# ============================================================================
+
+class SymbolTable:
+    """
+    Two-way mapping between id strings and small integers
+
+    Symbols are assigned in first-seen order starting at 0 and never change,
+    so packed characters stay valid as more ids are added.
+    """
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self, names=()):
+        """Create a table, optionally pre-loaded with names"""
+        self.ids = {}
+        self.names = []
+        for name in names:
+            self.intern(name)
+
+    def __len__(self):
+        """Number of symbols"""
+        return len(self.names)
+
+    def __contains__(self, name):
+        """Check whether a name has a symbol"""
+        return name in self.ids
+
+    def intern(self, name):
+        """
+        Get the symbol for a name, adding it if it is new
+
+        Returns: Integer symbol
+        """
+        symbol = self.ids.get(name)
+        if symbol is None:
+            name = sys.intern(name)
+            symbol = len(self.names)
+            self.ids[name] = symbol
+            self.names.append(name)
+        return symbol
+
+    def get_symbol(self, name, default=None):
+        """
+        Look up a name without adding it
+
+        Returns: Integer symbol, or default if the name is unknown
+        """
+        return self.ids.get(name, default)
+
+    def get_name(self, symbol):
+        """
+        Get the interned string for a symbol
+
+        Returns: String id
+        Raises: IndexError if the symbol was never assigned
+        """
+        return self.names[symbol]
+
+    def encode(self, names):
+        """
+        Pack a list of names (new names are added)
+
+        Returns: array of integer symbols
+        """
+        intern = self.intern
+        return array(SYMBOL_TYPECODE, [intern(name) for name in names])
+
+    def decode(self, symbols):
+        """
+        Unpack symbols back to their interned strings
+
+        Returns: List of strings
+        """
+        names = self.names
+        return [names[symbol] for symbol in symbols]
+
+# Catalog-wide table shared by the whole process
+SYMBOLS = SymbolTable()
+
+# ============================================================================
+# CATALOG AND CHARACTERS
+# ============================================================================
+
+def register_catalog(quest_data_dict, item_data_dict, table=SYMBOLS):
+    """
+    Give every quest and item id in a catalog a symbol
+
+    Returns: The table
+    """
+    for quest_id in quest_data_dict:
+        table.intern(quest_id)
+    for item_id in item_data_dict:
+        table.intern(item_id)
+    return table
+
+def pack_character(character, table=SYMBOLS):
+    """
+    Store a character's inventory and quest lists as integer arrays (in place)
+
+    Returns: The character
+    """
+    for field in PACKED_FIELDS:
+        values = character.get(field)
+        if values is not None and not isinstance(values, array):
+            character[field] = table.encode(values)
+    return character
+
+def unpack_character(character, table=SYMBOLS):
+    """
+    Turn a packed character's arrays back into lists of id strings (in place)
+
+    Returns: The character
+    """
+    for field in PACKED_FIELDS:
+        values = character.get(field)
+        if isinstance(values, array):
+            character[field] = table.decode(values)
+    return character
+
+def is_packed(character):
+    """Check whether any id list of a character is packed"""
+    return any(isinstance(character.get(field), array) for field in PACKED_FIELDS)
+
+def as_names(values, table=SYMBOLS):
+    """
+    Read an id list for saving or display, whether packed or not
+
+    Returns: List (or the original sequence) of id strings
+    """
+    if isinstance(values, array):
+        return table.decode(values)
+    return values
+
+def intern_ids(values):
+    """
+    Intern a list of id strings so equal ids share one string object
+
+    Returns: New list of interned strings
+    """
+    intern = sys.intern
+    return [intern(value) for value in values]
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== SYMBOL TABLE TEST ===")
+
+    # import character_manager
+    # hero = character_manager.create_character("Packed", "Rogue")
+    # hero["inventory"] = ["health_potion", "iron_sword"]
+    # pack_character(hero)
+    # print(hero["inventory"], as_names(hero["inventory"]))
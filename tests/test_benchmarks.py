@@ -0,0 +1,74 @@
+"""
+Test Benchmarks
+Tests the benchmark suite's timing and baseline comparison
+"""
+
+import pytest
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "benchmarks"))
+
+import run_benchmarks
+
+# ============================================================================
+# RESULTS TESTS
+# ============================================================================
+
+def test_regressions_against_baselines(tmp_path):
+    """Test baseline comparison and the results file"""
+    results = [
+        run_benchmarks._result("fast", "ops/sec", run_benchmarks.time_calls(lambda: None, 10)),
+        run_benchmarks._result("slow", "ops/sec", run_benchmarks.time_calls(lambda: None, 10)),
+        run_benchmarks._result(run_benchmarks.REFERENCE_BENCHMARK, "runs/sec",
+                               run_benchmarks.time_calls(lambda: None, 10))
+    ]
+    results[0]["ops_per_sec"] = 100.0
+    results[1]["ops_per_sec"] = 50.0
+    results[2]["p50_us"] = 1e5  # 10 runs/sec
+    # Baselines came from a machine twice as fast: only 'slow' really regressed
+    baselines = {"host": "other", "relative": {"fast": 9.0, "slow": 10.0}}
+
+    regressions = run_benchmarks.compare_to_baselines(results, baselines, tolerance=0.25)
+    assert regressions == ["slow"]
+    assert results[0]["ratio"] == pytest.approx(10.0 / 9.0)
+
+    output = tmp_path / "results.json"
+    run_benchmarks.write_results(results, regressions, str(output))
+    report = json.loads(output.read_text())
+    assert report["regressions"] == ["slow"]
+    assert [r["name"] for r in report["results"]] == ["fast", "slow",
+                                                       run_benchmarks.REFERENCE_BENCHMARK]
+    assert report["results"][0]["calls"] == 10
+
+def test_only_skips_unselected_benchmarks(monkeypatch):
+    """Test that --only filters benchmarks before running them"""
+    def fail(*args, **kwargs):
+        raise AssertionError("unselected benchmark was run")
+
+    for name in ("bench_data_loading", "bench_save_load", "bench_available_quests",
+                 "bench_battles", "bench_startup"):
+        monkeypatch.setattr(run_benchmarks, name, fail)
+
+    results = run_benchmarks.run_suite(quick=True, only="inventory_lookups")
+    assert [r["name"] for r in results] == [run_benchmarks.REFERENCE_BENCHMARK,
+                                            "inventory_lookups"]
+
+def test_saved_baselines_are_relative(tmp_path):
+    """Test that baselines store throughput relative to the reference benchmark"""
+    results = run_benchmarks.bench_reference(5)
+    results.append(run_benchmarks._result("work", "ops/sec", run_benchmarks.time_calls(lambda: None, 5)))
+    results[0]["p50_us"] = 1000.0
+    results[1]["ops_per_sec"] = 3000.0
+
+    baseline_file = tmp_path / "baselines.json"
+    run_benchmarks.save_baselines(results, str(baseline_file))
+    baselines = run_benchmarks.load_baselines(str(baseline_file))
+    assert baselines["relative"] == {"work": 3.0}
+    assert baselines["host"] == run_benchmarks.get_host_id()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
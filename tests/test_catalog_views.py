@@ -0,0 +1,79 @@
+"""
+Test Catalog Views
+Tests the precomputed item views used by the shop and inventory
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import inventory_system
+from catalog_views import ItemViews
+
+ITEMS = {
+    "dagger": {"name": "Dagger", "type": "weapon", "cost": 50},
+    "plate": {"name": "Plate", "type": "armor", "cost": 300},
+    "potion": {"name": "Potion", "type": "consumable", "cost": 25},
+    "sword": {"name": "Sword", "type": "weapon", "cost": 150},
+    "axe": {"name": "Axe", "type": "weapon", "cost": 150},
+    "halberd": {"name": "Halberd", "type": "weapon", "cost": 400}
+}
+
+# ============================================================================
+# VIEWS TESTS
+# ============================================================================
+
+def test_views_sort_group_and_format():
+    """Test sorting, grouping, labels and the shop listing"""
+    views = ItemViews(ITEMS)
+    assert views.by_cost == ("potion", "dagger", "axe", "sword", "plate", "halberd")
+    assert views.by_type["weapon"] == ("dagger", "axe", "sword", "halberd")
+    assert views.labels["plate"] == "Plate (armor)"
+    assert views.listing.splitlines()[0] == "- dagger: Dagger (50 gold)"
+
+def test_query_filters_and_pages():
+    """Test filtered and paginated queries"""
+    views = ItemViews(ITEMS)
+    assert views.query("weapon", max_cost=199) == ["dagger", "axe", "sword"]
+    assert views.query(min_cost=150, max_cost=300) == ["axe", "sword", "plate"]
+    assert views.query("weapon", page=2, page_size=3) == ["halberd"]
+    assert views.query("weapon", page=3, page_size=3) == []
+    assert views.query("shield") == [] and views.query(min_cost=500, max_cost=100) == []
+    assert views.count("weapon", max_cost=199) == 3
+    assert views.page_count(4) == 2
+    with pytest.raises(ValueError):
+        views.query(page=0)
+
+def test_page_size_must_be_positive():
+    """Test that query and page_count reject page sizes below 1"""
+    views = ItemViews(ITEMS)
+    for page_size in (0, -1):
+        with pytest.raises(ValueError):
+            views.query("weapon", page_size=page_size)
+        with pytest.raises(ValueError):
+            views.page_count(page_size)
+    assert views.page_count(1) == len(ITEMS)
+
+# ============================================================================
+# CATALOG TESTS
+# ============================================================================
+
+def test_catalog_builds_views_once():
+    """Test that a catalog builds its views once"""
+    catalog = game_data.GameCatalog({}, ITEMS)
+    assert catalog.item_views is catalog.item_views
+    assert game_data.GameCatalog({}, ITEMS).item_views is not catalog.item_views
+
+def test_inventory_uses_view_labels():
+    """Test that the inventory display uses the view labels"""
+    character = {"inventory": ["sword", "potion", "sword", "relic"]}
+    views = ItemViews(ITEMS)
+    text = inventory_system.format_inventory(character, ITEMS, views)
+    assert text == "Sword (weapon) x2\nPotion (consumable) x1\nrelic (unknown) x1"
+    assert text == inventory_system.format_inventory(character, ITEMS)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,332 @@
+"""
+Test Combat Engine
+Tests the headless battle engine and its console front-end
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import battle_simulator
+from custom_exceptions import *
+
+# ============================================================================
+# HEADLESS ENGINE TESTS
+# ============================================================================
+
+def test_engine_runs_without_io(capsys):
+    """Test that BattleEngine resolves a battle without printing"""
+    char = character_manager.create_character("EngineTest", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+
+    engine = combat_system.BattleEngine(char, enemy)
+    result = engine.run()
+
+    assert result['winner'] == 'player'
+    assert result['xp_gained'] == enemy['xp_reward']
+    assert result['turns'] == 4
+    assert capsys.readouterr().out == ""
+    assert engine.events[0] == (0, 'battle', 'start', 0, 120)
+    assert engine.events[-1][2] == 'victory'
+
+def test_engine_uses_policy():
+    """Test that the action policy drives the player's turns"""
+    char = character_manager.create_character("PolicyTest", "Mage")
+    enemy = combat_system.create_enemy("goblin")
+
+    engine = combat_system.BattleEngine(char, enemy, combat_system.special_first_policy)
+    engine.run()
+
+    assert engine.events[1] == (1, 'player', 'fireball', 40, 10)
+
+def test_engine_escape_ends_battle():
+    """Test that a successful escape ends the battle without a winner"""
+    char = character_manager.create_character("RunTest", "Rogue")
+    enemy = combat_system.create_enemy("dragon")
+
+    engine = combat_system.BattleEngine(char, enemy, lambda battle: combat_system.ACTION_ESCAPE)
+    engine.attempt_escape = lambda: setattr(engine, 'combat_active', False) or True
+    result = engine.run()
+
+    assert result['winner'] is None
+    assert result['xp_gained'] == 0
+
+def test_simple_battle_prints_events(capsys, monkeypatch):
+    """Test that SimpleBattle renders engine events to the console"""
+    char = character_manager.create_character("ConsoleTest", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    monkeypatch.setattr('builtins.input', lambda prompt: "1")
+
+    result = combat_system.SimpleBattle(char, enemy).start_battle()
+
+    output = capsys.readouterr().out
+    assert result['winner'] == 'player'
+    assert ">>> Battle begins!" in output
+    assert ">>> You attack the Goblin for 13 damage!" in output
+    assert ">>> You have defeated the Goblin!" in output
+
+# ============================================================================
+# BATTLE LOG TESTS
+# ============================================================================
+
+def test_battle_log_renders_on_demand():
+    """Test that the battle log renders stored event tuples"""
+    log = combat_system.BattleLog("Orc")
+    log.record(1, 'player', 'attack', 12, 68)
+    log.record(1, 'enemy', 'attack', 9, 111)
+
+    assert len(log) == 2
+    assert log.render() == ["You attack the Orc for 12 damage!", "Orc attacks you for 9 damage!"]
+
+def test_battle_log_jsonl_round_trip(tmp_path):
+    """Test writing battles to JSON lines and reading them back"""
+    path = str(tmp_path / "battles.jsonl")
+    for enemy_type in ["goblin", "orc"]:
+        char = character_manager.create_character("LogTest", "Mage")
+        engine = combat_system.BattleEngine(char, combat_system.create_enemy(enemy_type),
+                                            combat_system.special_first_policy)
+        engine.run()
+        engine.events.metadata['enemy_type'] = enemy_type
+        engine.events.write_jsonl(path)
+
+    logs = combat_system.read_battle_logs(path)
+
+    assert [log.metadata['enemy_type'] for log in logs] == ["goblin", "orc"]
+    assert logs[0].events == engine_events_for("goblin")
+
+def engine_events_for(enemy_type):
+    """Helper: events of a fresh special_first Mage battle"""
+    char = character_manager.create_character("LogTest", "Mage")
+    engine = combat_system.BattleEngine(char, combat_system.create_enemy(enemy_type),
+                                        combat_system.special_first_policy)
+    engine.run()
+    return engine.events.events
+
+# ============================================================================
+# REPLAY TESTS
+# ============================================================================
+
+def test_seeded_battles_are_reproducible():
+    """Test that the same battle_id gives the same random rolls"""
+    results = []
+    for _ in range(2):
+        char = character_manager.create_character("SeedTest", "Rogue")
+        engine = combat_system.BattleEngine(
+            char, combat_system.create_enemy("dragon"),
+            lambda battle: combat_system.ACTION_SPECIAL if battle.turn_count == 1
+            else combat_system.ACTION_ESCAPE,
+            battle_id=1234)
+        engine.run()
+        results.append(engine.events.events)
+
+    assert results[0] == results[1]
+
+def test_replay_is_identical():
+    """Test that replaying a recorded battle reproduces every event"""
+    char = character_manager.create_character("ReplayTest", "Rogue")
+    engine = combat_system.BattleEngine(
+        char, combat_system.create_enemy("orc"), combat_system.special_first_policy,
+        battle_id="raid-7")
+    result = engine.run()
+
+    record = engine.get_replay_record()
+    replayed = combat_system.replay_battle(record)
+
+    assert replayed.events.events == engine.events.events
+    assert replayed.get_result() == result
+    assert record['actions'][0] == combat_system.ACTION_SPECIAL
+
+def test_replay_checks_fast_path_against_reference():
+    """Test that a predicted battle matches its full-loop replay"""
+    char = character_manager.create_character("VerifyTest", "Warrior")
+    engine = combat_system.BattleEngine(char, combat_system.create_enemy("orc"), battle_id=99)
+    result = engine.run()
+
+    reference = combat_system.replay_battle(engine.get_replay_record(), fast_path=False)
+
+    assert engine.predicted and not reference.predicted
+    assert reference.get_result() == result
+    assert reference.character['health'] == char['health']
+
+# ============================================================================
+# ABILITY SCHEDULER TESTS
+# ============================================================================
+
+def test_special_cooldown_expires_and_resets_between_battles():
+    """Test that the special recharges after its cooldown and never sticks"""
+    char = character_manager.create_character("CooldownTest", "Warrior")
+    enemy = combat_system.create_enemy("dragon")
+    policy = combat_system.make_scripted_policy(["special"] * 4)
+
+    engine = combat_system.BattleEngine(char, enemy, policy)
+    engine.begin()
+    actions = []
+    for _ in range(4):
+        engine.turn_count += 1
+        engine.player_turn()
+        actions.append(engine.events[-1][2])
+    # Warrior cooldown is 3 turns: turns 2 and 3 fall back to basic attacks
+    assert actions == ['power_strike', 'attack', 'attack', 'power_strike']
+    assert [e[2] for e in engine.events].count('cooldown') == 2
+
+    assert '_special_on_cooldown' not in char
+    second = combat_system.BattleEngine(char, combat_system.create_enemy("goblin"),
+                                        combat_system.special_first_policy)
+    second.run()
+    assert second.events[1][2] == 'power_strike'
+
+def test_scheduler_effects_expire_on_time():
+    """Test buff expiry and damage-over-time ticks"""
+    from ability_scheduler import AbilityScheduler
+
+    target = {'health': 50, 'strength': 10}
+    scheduler = AbilityScheduler()
+    scheduler.add_stat_effect(target, "weaken", "strength", -4, 2, turn=1)
+    scheduler.add_damage_over_time(target, "poison", 5, 3, turn=1)
+    assert target['strength'] == 6
+
+    kinds = []
+    for turn in range(2, 6):
+        kinds.append([kind for kind, effect, amount in scheduler.advance(turn)])
+    assert kinds == [['tick'], ['expire', 'tick'], ['tick', 'expire'], []]
+    assert target == {'health': 35, 'strength': 10}
+    assert scheduler.get_active_effects(target) == []
+    assert scheduler.pending_count() == 0
+
+def test_engine_records_damage_over_time():
+    """Test that scheduled ticks are applied and logged during a battle"""
+    char = character_manager.create_character("DotTest", "Warrior")
+    enemy = combat_system.create_enemy("orc")
+    engine = combat_system.BattleEngine(char, enemy, combat_system.special_first_policy)
+    engine.scheduler.add_damage_over_time(enemy, "bleed", 10, 2, turn=0)
+
+    engine.run()
+
+    ticks = [e for e in engine.events if e[2] == 'effect_tick']
+    assert [(e[0], e[1], e[3]) for e in ticks] == [(1, 'enemy', 10), (2, 'enemy', 10)]
+    assert "The Orc takes 10 damage over time." in engine.events.render()
+
+def test_engine_applies_and_expires_stat_effects():
+    """Test that a scheduled stat effect lasts its duration during a battle"""
+    char = character_manager.create_character("StatTest", "Warrior")
+    enemy = combat_system.create_enemy("dragon")
+    strength = enemy['strength']
+    engine = combat_system.BattleEngine(char, enemy)
+    engine.scheduler.add_stat_effect(enemy, "weaken", "strength", -5, 2, turn=0)
+    assert enemy['strength'] == strength - 5
+
+    engine.begin()
+    engine.step()
+    assert enemy['strength'] == strength - 5
+    engine.step()
+    assert enemy['strength'] == strength
+    assert "An effect on the Dragon wears off." in engine.events.render()
+
+# ============================================================================
+# PREDICTION TESTS
+# ============================================================================
+
+def test_predict_battle_matches_turn_loop():
+    """Test that the closed-form prediction matches a full battle"""
+    for char_class in ["Warrior", "Mage", "Rogue", "Cleric"]:
+        for level in range(1, 9):
+            for enemy_type in ["goblin", "orc", "dragon"]:
+                char = battle_simulator.build_character_for_level(char_class, level)
+                enemy = combat_system.create_enemy(enemy_type)
+                prediction = combat_system.predict_battle(char, enemy)
+
+                result = combat_system.BattleEngine(char, enemy, fast_path=False).run()
+
+                assert prediction['winner'] == result['winner']
+                assert prediction['turns'] == result['turns']
+                assert prediction['health'] == char['health']
+                assert prediction['enemy_health'] == enemy['health']
+
+def test_engine_short_circuits_basic_attacks():
+    """Test that basic-attack battles use the prediction automatically"""
+    char = character_manager.create_character("FastTest", "Cleric")
+    enemy = combat_system.create_enemy("orc")
+
+    engine = combat_system.BattleEngine(char, enemy)
+    result = engine.run()
+
+    assert engine.predicted
+    assert result['winner'] == 'enemy'
+    assert result['turns'] == 10
+    assert [event[2] for event in engine.events] == ['start', 'defeat']
+
+# ============================================================================
+# SIMULATION TESTS
+# ============================================================================
+
+def test_simulation_is_deterministic_across_workers():
+    """Test that seeded simulations match with and without a process pool"""
+    matchups = battle_simulator.build_matchups(["Rogue"], [3], ["orc"])
+
+    inline = battle_simulator.simulate_matchups(
+        matchups, 300, seed=7, policy="special_first", workers=1, chunk_size=100)
+    pooled = battle_simulator.simulate_matchups(
+        matchups, 300, seed=7, policy="special_first", workers=2, chunk_size=100)
+
+    assert inline['rows'] == pooled['rows']
+    assert inline['battles'] == 300
+    assert inline['battles_per_second'] > 0
+
+def test_build_character_for_level():
+    """Test that simulated characters level up like real ones"""
+    char = battle_simulator.build_character_for_level("Warrior", 3)
+
+    assert char['level'] == 3
+    assert char['strength'] == 19
+    assert char['max_health'] == 140
+
+def test_summary_table_shows_escape_rate():
+    """Test that the summary table includes each matchup's escape rate"""
+    summary = {"battles": 4, "seconds": 1.0, "battles_per_second": 4.0, "rows": [
+        {"class": "Rogue", "level": 3, "enemy": "orc", "battles": 4, "win_rate": 0.5,
+         "escape_rate": 0.25, "avg_turns": 3.0, "avg_hp_remaining": 40.0,
+         "avg_enemy_hp_remaining": 10.0}
+    ]}
+    header, row = battle_simulator.format_summary_table(summary).splitlines()[:2]
+
+    assert "Esc%" in header
+    assert "25.0%" in row
+
+# ============================================================================
+# VECTORIZED RESOLVER TESTS
+# ============================================================================
+
+def test_vectorized_matches_scalar_engine():
+    """Test that array-based resolution matches BattleEngine exactly"""
+    np = pytest.importorskip("numpy")
+    import random
+    import vectorized_combat
+
+    characters = []
+    enemies = []
+    for i in range(200):
+        char_class = ["Warrior", "Mage", "Rogue", "Cleric"][i % 4]
+        characters.append(battle_simulator.build_character_for_level(char_class, 1 + i % 7))
+        enemies.append(combat_system.create_enemy(["goblin", "orc", "dragon"][i % 3]))
+
+    resolved = vectorized_combat.resolve_battles(
+        characters, enemies, policy="special_first", rng=random.Random(42))
+
+    random.seed(42)
+    for i in range(200):
+        char = dict(characters[i])
+        enemy = dict(enemies[i])
+        result = combat_system.BattleEngine(char, enemy, combat_system.special_first_policy).run()
+        expected_winner = vectorized_combat.WINNER_PLAYER if result['winner'] == 'player' \
+            else vectorized_combat.WINNER_ENEMY
+        assert resolved['winner'][i] == expected_winner
+        assert resolved['turns'][i] == result['turns']
+        assert resolved['health'][i] == char['health']
+        assert resolved['enemy_health'][i] == enemy['health']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
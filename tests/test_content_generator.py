@@ -0,0 +1,94 @@
+"""
+Test Content Generator
+Tests synthetic quest, item and character generation
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import content_generator
+import game_data
+import inventory_system
+
+# ============================================================================
+# QUEST TESTS
+# ============================================================================
+
+def test_quests_are_valid_and_deterministic():
+    """Test that generated quests pass validation and repeat by seed"""
+    quests = content_generator.generate_quests(500, seed=3, roots=5)
+    assert content_generator.validate_content(quests, {})
+    assert quests == content_generator.generate_quests(500, seed=3, roots=5)
+    assert quests != content_generator.generate_quests(500, seed=4, roots=5)
+
+def test_quest_shape_controls():
+    """Test depth, width and level controls"""
+    deep = content_generator.generate_quests(300, chain_bias=1.0)
+    assert max(content_generator.get_quest_depths(deep).values()) == 299
+
+    wide = content_generator.generate_quests(300, roots=20, max_depth=3, chain_bias=0.0)
+    depths = content_generator.get_quest_depths(wide)
+    assert max(depths.values()) == 2
+    assert sum(1 for depth in depths.values() if depth == 0) == 20
+
+    for distribution in content_generator.LEVEL_DISTRIBUTIONS:
+        quests = content_generator.generate_quests(300, seed=1, max_level=30,
+                                                   level_distribution=distribution)
+        for quest in quests.values():
+            assert 1 <= quest['required_level'] <= 30
+            if quest['prerequisite'] is not None:
+                parent = quests[quest['prerequisite']]
+                assert quest['required_level'] >= parent['required_level']
+
+    with pytest.raises(ValueError):
+        content_generator.generate_quests(10, level_distribution="bell")
+
+# ============================================================================
+# ITEM AND POPULATION TESTS
+# ============================================================================
+
+def test_item_mix():
+    """Test that items follow the requested type mix"""
+    items = content_generator.generate_items(1000, seed=2, mix={"weapon": 1, "consumable": 1})
+    types = [item['type'] for item in items.values()]
+    assert "armor" not in types
+    assert 400 < types.count("weapon") < 600
+    assert content_generator.validate_content({}, items)
+
+def test_population_is_consistent():
+    """Test that characters' quest histories and inventories make sense"""
+    quests = content_generator.generate_quests(200, seed=5, roots=4)
+    items = content_generator.generate_items(50, seed=5)
+    characters = content_generator.generate_population(40, quests, items, seed=5)
+
+    assert content_generator.validate_content(quests, items, characters)
+    for character in characters:
+        completed = set(character['completed_quests'])
+        assert len(character['inventory']) <= inventory_system.MAX_INVENTORY_SIZE
+        assert all(item_id in items for item_id in character['inventory'])
+        assert not completed & set(character['active_quests'])
+        for quest_id in completed | set(character['active_quests']):
+            quest = quests[quest_id]
+            assert quest['required_level'] <= character['level']
+            assert quest['prerequisite'] is None or quest['prerequisite'] in completed
+
+def test_generated_files_round_trip(tmp_path):
+    """Test that written files load back to the generated content"""
+    summary = content_generator.generate_content(str(tmp_path), quest_count=100,
+                                                 item_count=30, character_count=5, seed=7)
+
+    quests = game_data.load_quests(summary['quest_file'])
+    items = game_data.load_items(summary['item_file'])
+    assert quests == content_generator.generate_quests(100, 7)
+    assert items == content_generator.generate_items(30, 7)
+    saved = character_manager.list_saved_characters(summary['save_directory'])
+    assert len(saved) == 5
+    loaded = character_manager.load_character(saved[0], summary['save_directory'])
+    assert character_manager.validate_character_data(loaded)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
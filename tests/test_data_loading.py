@@ -0,0 +1,151 @@
+"""
+Test Data Loading
+Tests data file loaders beyond quests and items
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_system
+import game_data
+from custom_exceptions import *
+
+ENEMY_BLOCK = """ENEMY_ID: {enemy_id}
+NAME: {name}
+HEALTH: 30
+STRENGTH: 5
+MAGIC: 1
+XP_REWARD: 10
+GOLD_REWARD: 5
+MIN_LEVEL: {min_level}
+MAX_LEVEL: {max_level}
+SPAWN_WEIGHT: {weight}
+"""
+
+# ============================================================================
+# ENEMY DATA TESTS
+# ============================================================================
+
+def test_load_enemies():
+    """Test that the shipped enemy file loads the required enemies"""
+    enemies = game_data.load_enemies("data/enemies.txt")
+
+    for enemy_id in ["goblin", "orc", "dragon"]:
+        assert enemy_id in enemies
+    assert enemies['dragon']['max_level'] is None
+
+def test_invalid_enemy_level_range(tmp_path):
+    """Test that MAX_LEVEL below MIN_LEVEL is rejected"""
+    path = tmp_path / "enemies.txt"
+    path.write_text(ENEMY_BLOCK.format(enemy_id="bat", name="Bat",
+                                       min_level=5, max_level=2, weight=1))
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_enemies(str(path))
+
+def test_weighted_enemy_spawns(tmp_path):
+    """Test that enemies spawn by level range and weight"""
+    path = tmp_path / "enemies.txt"
+    path.write_text(
+        ENEMY_BLOCK.format(enemy_id="rat", name="Rat", min_level=1, max_level=3, weight=3)
+        + "\n"
+        + ENEMY_BLOCK.format(enemy_id="bat", name="Bat", min_level=2, max_level="NONE", weight=1)
+    )
+
+    try:
+        combat_system.load_enemy_catalog(str(path))
+
+        assert combat_system.get_random_enemy_for_level(1)['name'] == "Rat"
+        assert combat_system.get_random_enemy_for_level(50)['name'] == "Bat"
+        names = {combat_system.get_random_enemy_for_level(2)['name'] for _ in range(200)}
+        assert names == {"Rat", "Bat"}
+
+        enemy = combat_system.create_enemy("rat")
+        enemy['health'] = 0
+        assert combat_system.create_enemy("rat")['health'] == 30
+    finally:
+        combat_system.load_enemy_catalog()
+
+def test_spawn_table_size_does_not_depend_on_weights(tmp_path):
+    """Test that coprime weights keep one spawn entry per enemy"""
+    path = tmp_path / "enemies.txt"
+    path.write_text(
+        ENEMY_BLOCK.format(enemy_id="rat", name="Rat", min_level=1, max_level="NONE", weight=999)
+        + "\n"
+        + ENEMY_BLOCK.format(enemy_id="bat", name="Bat", min_level=1, max_level="NONE", weight=1000)
+    )
+
+    try:
+        combat_system.load_enemy_catalog(str(path))
+        enemy_ids, cum_weights = combat_system._enemy_catalog["spawn_tables"][1]
+        assert enemy_ids == ("rat", "bat") and cum_weights == [999, 1999]
+
+        rng = random.Random(3)
+        names = [combat_system.get_random_enemy_for_level(1, rng)['name'] for _ in range(2000)]
+        assert 900 < names.count("Rat") < 1100
+    finally:
+        combat_system.load_enemy_catalog()
+
+# ============================================================================
+# COLLECT ERRORS TESTS
+# ============================================================================
+
+QUEST_BLOCK = """QUEST_ID: {quest_id}
+TITLE: Title
+DESCRIPTION: Description
+REWARD_XP: {reward_xp}
+REWARD_GOLD: 10
+REQUIRED_LEVEL: 1
+PREREQUISITE: NONE
+"""
+
+def test_collect_errors_reports_every_bad_quest(tmp_path):
+    """Test that collect_errors skips bad quests and reports each one"""
+    quest_file = tmp_path / "quests.txt"
+    quest_file.write_text("\n".join([
+        QUEST_BLOCK.format(quest_id="good_one", reward_xp=10),
+        QUEST_BLOCK.format(quest_id="bad_xp", reward_xp="lots"),
+        "TITLE: No id\nREWARD_XP: 5\n",
+        QUEST_BLOCK.format(quest_id="good_two", reward_xp=20)
+    ]))
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests(str(quest_file))
+
+    quests, errors = game_data.load_quests(str(quest_file), collect_errors=True)
+    assert list(quests) == ["good_one", "good_two"]
+    assert [(error["line"], error["block_id"]) for error in errors] == [(12, "bad_xp"), (17, None)]
+    assert errors[0]["file"] == str(quest_file)
+    assert "REWARD_XP must be an integer" in errors[0]["message"]
+    assert game_data.format_load_error(errors[1]).startswith(f"{quest_file}:17 [?]: Missing")
+
+def test_collect_errors_points_at_bad_item_type(tmp_path):
+    """Test that a bad item type is reported with its file and line"""
+    item_file = tmp_path / "items.txt"
+    item_file.write_text("ITEM_ID: wand\nNAME: Wand\nTYPE: staff\n"
+                         "EFFECT: magic:3\nCOST: 5\nDESCRIPTION: Odd\n")
+    items, errors = game_data.load_items(str(item_file), collect_errors=True)
+    assert items == {}
+    assert errors[0]["line"] == 3 and errors[0]["block_id"] == "wand"
+
+def test_collect_errors_reports_bad_enemies(tmp_path):
+    """Test that collect_errors reports enemy parse and level-range errors"""
+    enemy_file = tmp_path / "enemies.txt"
+    enemy_file.write_text("\n".join([
+        ENEMY_BLOCK.format(enemy_id="Rat", name="Rat", min_level=1, max_level="NONE", weight=1),
+        ENEMY_BLOCK.format(enemy_id="bat", name="Bat", min_level=1, max_level="high", weight=1),
+        ENEMY_BLOCK.format(enemy_id="imp", name="Imp", min_level=4, max_level=2, weight=1)
+    ]))
+
+    enemies, errors = game_data.load_enemies(str(enemy_file), collect_errors=True)
+    assert list(enemies) == ["rat"] and enemies["rat"]["max_level"] is None
+    assert [(error["line"], error["block_id"]) for error in errors] == [(20, "bat"), (23, "imp")]
+    assert errors[0]["message"] == "MAX_LEVEL must be an integer or NONE"
+    assert errors[1]["message"] == "Enemy 'imp' has MAX_LEVEL below MIN_LEVEL"
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+"""
+Test Encounter System
+Tests party-versus-group encounters
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import encounter_system
+from custom_exceptions import *
+
+# ============================================================================
+# ENCOUNTER TESTS
+# ============================================================================
+
+def test_one_on_one_matches_battle_engine():
+    """Test that a 1v1 encounter plays out like BattleEngine"""
+    hero = character_manager.create_character("Solo", "Warrior")
+    goblin = combat_system.create_enemy("goblin")
+    encounter = encounter_system.Encounter([hero], [goblin])
+    result = encounter.run()
+
+    reference_hero = character_manager.create_character("Solo", "Warrior")
+    reference = combat_system.BattleEngine(reference_hero, combat_system.create_enemy("goblin"),
+                                           fast_path=False).run()
+
+    assert result['winner'] == 'allies'
+    assert result['rounds'] == reference['turns']
+    assert hero['health'] == reference_hero['health']
+    assert result['xp_gained'] == reference['xp_gained']
+
+def test_party_versus_horde():
+    """Test a 5v20 encounter with focus fire and alive counters"""
+    classes = ["Warrior", "Mage", "Rogue", "Cleric", "Warrior"]
+    party = [character_manager.create_character(f"Hero{i}", c) for i, c in enumerate(classes)]
+    horde = [combat_system.create_enemy("goblin") for _ in range(20)]
+
+    encounter = encounter_system.Encounter(party, horde,
+                                           encounter_system.special_when_ready_policy,
+                                           rng=random.Random(7))
+    result = encounter.run()
+
+    # Twenty goblins are too much for a level 1 party
+    assert result['winner'] == 'enemies'
+    assert result['allies_alive'] == 0
+    assert result['enemies_alive'] == sum(1 for goblin in horde if goblin['health'] > 0)
+    assert result['xp_gained'] == 0
+
+    # Focus fire: enemies fall strictly in list order
+    fallen = [e[1] for e in encounter.events if e[2] == 'defeated' and e[1].startswith('Goblin')]
+    assert fallen == [f"Goblin {i}" for i in range(1, len(fallen) + 1)]
+    assert len(fallen) == 20 - result['enemies_alive']
+    assert all('_special_on_cooldown' not in hero for hero in party)
+
+def test_party_collects_rewards_for_every_enemy():
+    """Test that a winning party earns rewards for the whole group"""
+    classes = ["Warrior", "Mage", "Rogue", "Cleric", "Warrior"]
+    party = [character_manager.create_character(f"Hero{i}", c) for i, c in enumerate(classes)]
+    pack = [combat_system.create_enemy("goblin") for _ in range(8)]
+
+    result = encounter_system.Encounter(party, pack, rng=random.Random(7)).run()
+
+    assert result['winner'] == 'allies'
+    assert result['enemies_alive'] == 0
+    assert result['xp_gained'] == 8 * pack[0]['xp_reward']
+    assert result['gold_gained'] == 8 * pack[0]['gold_reward']
+
+def test_initiative_order():
+    """Test that higher initiative acts first each round"""
+    hero = character_manager.create_character("Slow", "Mage")
+    dragon = combat_system.create_enemy("dragon")
+    encounter = encounter_system.Encounter([hero], [dragon])
+    encounter.run()
+
+    assert encounter.events[0][1] == 'Dragon'
+    assert encounter_system.format_encounter_event(encounter.events[0]) == \
+        f"Dragon attacks Slow for {encounter.events[0][4]} damage!"
+
+def test_encounter_requires_living_combatants():
+    """Test errors for a fallen party or an empty enemy group"""
+    hero = character_manager.create_character("Fallen", "Rogue")
+    hero['health'] = 0
+    with pytest.raises(CharacterDeadError):
+        encounter_system.Encounter([hero], [combat_system.create_enemy("orc")]).run()
+
+    hero['health'] = 50
+    with pytest.raises(InvalidTargetError):
+        encounter_system.Encounter([hero], []).run()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
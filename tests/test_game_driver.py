@@ -0,0 +1,72 @@
+"""
+Test Game Driver
+Tests the headless scripted game driver
+"""
+
+import pytest
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_driver
+
+# ============================================================================
+# SCRIPT LOADING TESTS
+# ============================================================================
+
+def test_load_script_formats(tmp_path):
+    """Test JSON, CSV and text scripts load to the same answers"""
+    answers = ["1", "Hero", "Mage", "6", "3"]
+    json_file = tmp_path / "script.json"
+    json_file.write_text(json.dumps([1, "Hero", "Mage", 6, 3]))
+    csv_file = tmp_path / "script.csv"
+    csv_file.write_text("1,Hero,Mage\n6\n\n3\n")
+    text_file = tmp_path / "script.txt"
+    text_file.write_text("\n".join(answers) + "\n")
+
+    assert game_driver.load_script(str(json_file)) == answers
+    assert game_driver.load_script(str(csv_file)) == answers
+    assert game_driver.load_script(str(text_file)) == answers
+
+# ============================================================================
+# DRIVER TESTS
+# ============================================================================
+
+def test_run_script_saves_to_disk(tmp_path):
+    """Test a scripted run with real saves"""
+    answers = ["1", "Driven", "Rogue", "1", "3", "1", "7", "6", "3"]
+    report = game_driver.run_script(answers, save_directory=str(tmp_path), capture=True)
+
+    assert report['actions'] == len(answers)
+    # Initial save, two autosaves and Save and Quit
+    assert report['saves'] == 4
+    assert report['actions_per_second'] > 0
+    assert any("Name: Driven" in text for text in report['transcript'])
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Driven"]
+
+def test_run_script_without_saving(tmp_path):
+    """Test that saving can be switched off entirely"""
+    answers = ["1", "Ghost", "Cleric"] + ["4", "1", "1", "1", "1", "1", "1", "1"] * 3 + ["6", "3"]
+    report = game_driver.run_script(answers, save_directory=str(tmp_path),
+                                    save_mode="off", autosave=False, seed=5)
+
+    assert report['saves'] == 0
+    assert report['skipped_saves'] == 2
+    assert not os.path.exists(tmp_path / "Ghost_save.txt")
+
+def test_seeded_runs_are_reproducible(tmp_path):
+    """Test that the same seed gives the same transcript"""
+    answers = ["1", "Seeded", "Warrior"] + ["4", "2", "1", "1", "1"] * 4 + ["6", "3"]
+    first = game_driver.run_script(answers, save_mode="off", seed=9, capture=True)
+    second = game_driver.run_script(answers, save_mode="off", seed=9, capture=True)
+
+    assert first['transcript'] == second['transcript']
+
+    with pytest.raises(ValueError):
+        game_driver.run_script(answers, save_mode="cloud")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Test Instrumentation
+Tests the opt-in profiler's wrapping and reporting
+"""
+
+import pytest
+import io
+import subprocess
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import instrumentation
+from custom_exceptions import InvalidCharacterClassError, ItemNotFoundError
+
+@pytest.fixture
+def instrumented():
+    """Enable instrumentation with fresh stats for one test"""
+    instrumentation.enable_instrumentation(report_on_exit=False)
+    instrumentation.reset_stats()
+    yield
+    instrumentation.disable_instrumentation()
+    instrumentation.reset_stats()
+
+def _row(name):
+    """Find the report row for a function"""
+    for row in instrumentation.get_report():
+        if row["name"] == name:
+            return row
+    return None
+
+# ============================================================================
+# WRAPPING TESTS
+# ============================================================================
+
+def test_disabled_by_default_leaves_functions_untouched():
+    """Test that nothing is wrapped unless instrumentation is enabled"""
+    assert not instrumentation.is_enabled()
+    assert not hasattr(character_manager.create_character, "__wrapped__")
+
+def test_counts_calls_latency_and_exceptions(instrumented):
+    """Test call counts, latency percentiles and exception counts"""
+    for _ in range(10):
+        character_manager.create_character("Timed", "Warrior")
+    with pytest.raises(InvalidCharacterClassError):
+        character_manager.create_character("Timed", "Bard")
+
+    row = _row("character_manager.create_character")
+    assert row["calls"] == 11
+    assert row["errors"] == 1
+    assert row["exceptions"] == {"InvalidCharacterClassError": 1}
+    assert row["p50_us"] <= row["p99_us"]
+    assert row["total_ms"] > 0
+
+def test_calls_inside_a_module_are_measured(instrumented):
+    """Test that calls made from inside a module are measured"""
+    character = character_manager.create_character("Packer", "Rogue")
+    inventory_system.add_item_to_inventory(character, "potion")
+    inventory_system.remove_item_from_inventory(character, "potion")
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.remove_item_from_inventory(character, "potion")
+
+    row = _row("inventory_system.remove_item_from_inventory")
+    assert row["calls"] == 2
+    assert row["exceptions"] == {"ItemNotFoundError": 1}
+
+def test_disable_restores_originals(instrumented):
+    """Test that disabling puts the original functions back"""
+    assert hasattr(character_manager.create_character, "__wrapped__")
+    instrumentation.disable_instrumentation()
+    assert not hasattr(character_manager.create_character, "__wrapped__")
+    assert not instrumentation.is_enabled()
+
+# ============================================================================
+# ENABLING AND REPORTING TESTS
+# ============================================================================
+
+def test_enable_from_environment_flag_and_env_var(monkeypatch):
+    """Test enabling from --profile and QUEST_PROFILE"""
+    monkeypatch.setattr(instrumentation, "enable_instrumentation", lambda: 0)
+    argv = ["main.py", "--profile"]
+    assert instrumentation.enable_from_environment(argv, {})
+    assert argv == ["main.py"]
+    assert instrumentation.enable_from_environment([], {"QUEST_PROFILE": "1"})
+    assert not instrumentation.enable_from_environment([], {"QUEST_PROFILE": "0"})
+    assert not instrumentation.enable_from_environment([], {})
+
+def test_dump_report_on_demand(instrumented):
+    """Test dumping the report to a stream"""
+    character_manager.create_character("Reporter", "Mage")
+    stream = io.StringIO()
+    instrumentation.dump_report(stream)
+    text = stream.getvalue()
+    assert "INSTRUMENTATION REPORT" in text
+    assert "character_manager.create_character" in text
+
+def test_import_is_cheap_when_disabled():
+    """Test that importing the module does not pull in inspect or signal"""
+    code = "import sys, instrumentation; print('inspect' in sys.modules, 'signal' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.split() == ["False", "False"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
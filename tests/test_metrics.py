@@ -0,0 +1,141 @@
+"""
+Test Metrics
+Tests the metrics registry and the game hooks that update it
+"""
+
+import pytest
+import threading
+import urllib.request
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import inventory_system
+import metrics
+import quest_handler
+from custom_exceptions import CharacterNotFoundError
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    """Start and end every test with zeroed game metrics"""
+    metrics.REGISTRY.reset()
+    yield
+    metrics.REGISTRY.reset()
+
+# ============================================================================
+# REGISTRY TESTS
+# ============================================================================
+
+def test_counter_gauge_histogram_render():
+    """Test counters, gauges and histograms in the Prometheus text format"""
+    registry = metrics.MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("code",))
+    requests.inc(labels=("200",))
+    requests.inc(2, ("500",))
+    sessions = registry.gauge("sessions", "Open sessions")
+    sessions.inc()
+    sessions.inc()
+    sessions.dec()
+    latency = registry.histogram("latency_seconds", "Latency", (0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    text = registry.render()
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{code="200"} 1' in text
+    assert 'requests_total{code="500"} 2' in text
+    assert "sessions 1" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "latency_seconds_count 3" in text
+
+def test_registering_same_name_returns_same_metric():
+    """Test that registering a name twice returns the same metric"""
+    registry = metrics.MetricsRegistry()
+    assert registry.counter("x_total", "X") is registry.counter("x_total", "X")
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "X")
+
+def test_histogram_reset_takes_the_lock():
+    """Test that resetting a histogram waits for an observation in progress"""
+    latency = metrics.MetricsRegistry().histogram("reset_seconds", "Reset", (1.0,))
+    latency.observe(0.5)
+
+    with latency._lock:
+        resetter = threading.Thread(target=latency.reset)
+        resetter.start()
+        resetter.join(0.05)
+        assert resetter.is_alive()
+        assert latency.count == 1
+    resetter.join()
+    assert latency.count == 0 and latency.sum == 0
+
+# ============================================================================
+# GAME HOOKS TESTS
+# ============================================================================
+
+def test_save_and_load_hooks(tmp_path):
+    """Test the save and load counters and timings"""
+    character = character_manager.create_character("Metric", "Warrior")
+    character_manager.save_character(character, str(tmp_path))
+    character_manager.load_character("Metric", str(tmp_path))
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("Nobody", str(tmp_path))
+
+    assert metrics.SAVES.get() == 1
+    assert metrics.SAVE_SECONDS.count == 1
+    assert metrics.LOADS.get(("save",)) == 1
+    assert metrics.LOAD_ERRORS.get(("save", "CharacterNotFoundError")) == 1
+
+def test_quest_shop_and_battle_hooks():
+    """Test the quest, shop and battle counters"""
+    character = character_manager.create_character("Metric", "Warrior")
+    quests = {"q1": {"quest_id": "q1", "required_level": 1, "prerequisite": None,
+                     "reward_xp": 10, "reward_gold": 5}}
+    quest_handler.accept_quest(character, "q1", quests)
+    quest_handler.complete_quest(character, "q1", quests)
+
+    potion = {"cost": 10}
+    inventory_system.purchase_item(character, "potion", potion)
+    inventory_system.sell_item(character, "potion", potion)
+
+    engine = combat_system.BattleEngine(character, combat_system.create_enemy("goblin"))
+    result = engine.run()
+
+    assert metrics.QUESTS_ACCEPTED.get() == 1
+    assert metrics.QUESTS_COMPLETED.get() == 1
+    assert metrics.ITEMS_BOUGHT.get() == 1
+    assert metrics.ITEMS_SOLD.get() == 1
+    expected = "won" if result["winner"] == "player" else "lost"
+    assert metrics.BATTLES.get((expected,)) == 1
+    assert metrics.BATTLE_TURNS.count == 1
+
+# ============================================================================
+# EXPORTING TESTS
+# ============================================================================
+
+def test_prometheus_file_and_http_endpoint(tmp_path):
+    """Test exporting to a file and over HTTP"""
+    metrics.SAVES.inc(3)
+    filename = str(tmp_path / "quest.prom")
+    metrics.write_prometheus_file(filename)
+    with open(filename) as f:
+        assert "quest_saves_total 3" in f.read()
+
+    server = metrics.start_http_server(0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+        assert "quest_saves_total 3" in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
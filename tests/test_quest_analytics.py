@@ -0,0 +1,119 @@
+"""
+Test Quest Analytics
+Tests quest bitsets and population-wide queries
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import quest_analytics
+import game_data
+import symbol_table
+from custom_exceptions import QuestNotFoundError
+
+# ============================================================================
+# BITSET ENCODING TESTS
+# ============================================================================
+
+def test_quest_bit_index_follows_catalog_order():
+    """Test that quests get bit positions in catalog order"""
+    quests = game_data.load_quests("data/quests.txt")
+    bit_index = quest_analytics.build_quest_bit_index(quests)
+
+    assert list(bit_index) == list(quests)
+    assert sorted(bit_index.values()) == list(range(len(quests)))
+
+def test_character_quest_round_trip():
+    """Test encoding and decoding a character's quests"""
+    quests = game_data.load_quests("data/quests.txt")
+    bit_index = quest_analytics.build_quest_bit_index(quests)
+
+    char = character_manager.create_character("BitsTest", "Rogue")
+    char['completed_quests'] = ['first_steps', 'goblin_hunter', 'retired_quest']
+    char['active_quests'] = ['orc_menace']
+
+    bits = quest_analytics.encode_character_quests(char, bit_index)
+
+    assert quest_analytics.decode_quest_bits(bits['completed'], bit_index) == ['first_steps', 'goblin_hunter']
+    assert quest_analytics.decode_quest_bits(bits['active'], bit_index) == ['orc_menace']
+
+# ============================================================================
+# POPULATION QUERY TESTS
+# ============================================================================
+
+def test_population_queries():
+    """Test AND/OR/popcount queries across a population"""
+    quests = game_data.load_quests("data/quests.txt")
+    bit_index = quest_analytics.build_quest_bit_index(quests)
+
+    characters = []
+    for i, completed in enumerate([
+        ['first_steps'],
+        ['first_steps', 'goblin_hunter'],
+        ['first_steps', 'equipment_upgrade'],
+        []
+    ]):
+        char = character_manager.create_character(f"Pop{i}", "Warrior")
+        char['completed_quests'] = completed
+        characters.append(char)
+    characters[3]['active_quests'] = ['first_steps']
+
+    population = quest_analytics.build_population_bitsets(characters, bit_index)
+
+    assert quest_analytics.count_population(population, completed=['first_steps']) == 3
+    assert quest_analytics.count_population(
+        population, completed=['first_steps'], not_completed=['goblin_hunter']
+    ) == 2
+    assert quest_analytics.select_population(
+        population, completed=['first_steps'], not_completed=['goblin_hunter']
+    ) == ['Pop0', 'Pop2']
+    assert quest_analytics.count_any_completed(population, ['goblin_hunter', 'equipment_upgrade']) == 2
+    assert quest_analytics.count_population(population, active=['first_steps']) == 1
+
+def test_population_mixes_packed_and_unpacked_characters():
+    """Test that packed characters are counted like unpacked ones"""
+    quests = game_data.load_quests("data/quests.txt")
+    bit_index = quest_analytics.build_quest_bit_index(quests)
+
+    plain = character_manager.create_character("Plain", "Warrior")
+    plain['completed_quests'] = ['first_steps']
+    packed = character_manager.create_character("Packed", "Mage")
+    packed['completed_quests'] = ['first_steps', 'goblin_hunter']
+    packed['active_quests'] = ['equipment_upgrade']
+    symbol_table.pack_character(packed)
+
+    population = quest_analytics.build_population_bitsets([plain, packed], bit_index)
+
+    assert quest_analytics.count_population(population, completed=['first_steps']) == 2
+    assert quest_analytics.select_population(population, completed=['goblin_hunter']) == ['Packed']
+    assert quest_analytics.count_population(population, active=['equipment_upgrade']) == 1
+
+def test_population_unknown_quest():
+    """Test that querying an unknown quest raises QuestNotFoundError"""
+    population = quest_analytics.build_population_bitsets([], {'a': 0})
+
+    with pytest.raises(QuestNotFoundError):
+        quest_analytics.count_population(population, completed=['missing'])
+
+def test_load_population_from_saves(tmp_path):
+    """Test building population bitsets from save files"""
+    quests = game_data.load_quests("data/quests.txt")
+    bit_index = quest_analytics.build_quest_bit_index(quests)
+
+    char = character_manager.create_character("SavedPop", "Mage")
+    char['completed_quests'] = ['first_steps']
+    character_manager.save_character(char, str(tmp_path))
+    (tmp_path / "Broken_save.txt").write_text("not a save file")
+
+    population = quest_analytics.load_population_bitsets(bit_index, str(tmp_path))
+
+    assert population['names'] == ['SavedPop']
+    assert population['skipped'] == ['Broken']
+    assert quest_analytics.get_completion_counts(population)['first_steps'] == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
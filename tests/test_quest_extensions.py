@@ -0,0 +1,133 @@
+"""
+Test Quest Extensions
+Tests batch quest completion and quest graph queries
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import quest_handler
+from custom_exceptions import *
+
+def make_quests():
+    """Small quest catalog shared by the tests below"""
+    return {
+        'q1': {'quest_id': 'q1', 'reward_xp': 60, 'reward_gold': 10,
+               'required_level': 1, 'prerequisite': None},
+        'q2': {'quest_id': 'q2', 'reward_xp': 60, 'reward_gold': 20,
+               'required_level': 1, 'prerequisite': 'q1'},
+        'q3': {'quest_id': 'q3', 'reward_xp': 10, 'reward_gold': 5,
+               'required_level': 3, 'prerequisite': 'q2'}
+    }
+
+# ============================================================================
+# BATCH COMPLETION TESTS
+# ============================================================================
+
+def test_complete_quests_aggregates_rewards():
+    """Test completing many quests for one character"""
+    char = character_manager.create_character("BatchTest", "Warrior")
+    char['active_quests'] = ['q1', 'q2']
+
+    report = quest_handler.complete_quests(char, ['q1', 'q2'], make_quests())
+
+    assert report['xp'] == 120
+    assert report['gold'] == 30
+    assert report['levels_gained'] == 1
+    assert char['active_quests'] == []
+    assert char['completed_quests'] == ['q1', 'q2']
+    assert char['gold'] == 130
+
+def test_complete_quests_validates_before_changes():
+    """Test that one inactive quest leaves the character untouched"""
+    char = character_manager.create_character("BatchFail", "Mage")
+    char['active_quests'] = ['q1']
+
+    with pytest.raises(QuestNotActiveError):
+        quest_handler.complete_quests(char, ['q1', 'q2'], make_quests())
+
+    assert char['active_quests'] == ['q1']
+    assert char['experience'] == 0
+
+def test_complete_quest_for_party():
+    """Test completing one quest for a whole party"""
+    party = []
+    for i in range(3):
+        char = character_manager.create_character(f"Raider{i}", "Cleric")
+        char['active_quests'] = ['q1']
+        party.append(char)
+
+    reports = quest_handler.complete_quest_for_party(party, 'q1', make_quests())
+
+    assert [r['name'] for r in reports] == ['Raider0', 'Raider1', 'Raider2']
+    assert all(c['completed_quests'] == ['q1'] for c in party)
+    assert all(c['experience'] == 60 for c in party)
+
+def test_party_completion_rejects_dead_member():
+    """Test that a dead member blocks the whole party"""
+    party = []
+    for i in range(2):
+        char = character_manager.create_character(f"Fallen{i}", "Rogue")
+        char['active_quests'] = ['q1']
+        party.append(char)
+    party[1]['health'] = 0
+
+    with pytest.raises(CharacterDeadError):
+        quest_handler.complete_quest_for_party(party, 'q1', make_quests())
+
+    assert party[0]['active_quests'] == ['q1']
+
+def test_party_completion_rejects_duplicate_member():
+    """Test that a character listed twice is not paid twice"""
+    char = character_manager.create_character("Twice", "Mage")
+    char['active_quests'] = ['q1']
+
+    with pytest.raises(QuestNotActiveError):
+        quest_handler.complete_quest_for_party([char, char], 'q1', make_quests())
+
+    assert char['active_quests'] == ['q1']
+    assert char['experience'] == 0
+
+# ============================================================================
+# QUEST GRAPH TESTS
+# ============================================================================
+
+def test_quest_unlocks_index():
+    """Test the reverse prerequisite index"""
+    quests = make_quests()
+
+    assert quest_handler.get_quest_unlocks('q1', quests) == ['q2']
+    assert quest_handler.get_quest_unlocks('q1', quests, recursive=True) == ['q2', 'q3']
+    assert quest_handler.get_quest_unlocks('q3', quests) == []
+
+    with pytest.raises(QuestNotFoundError):
+        quest_handler.get_quest_unlocks('missing', quests)
+
+def test_quest_path_skips_completed_steps():
+    """Test the remaining path to a target quest"""
+    char = character_manager.create_character("PathTest", "Warrior")
+    char['completed_quests'] = ['q1']
+
+    path = quest_handler.get_quest_path(char, 'q3', make_quests())
+
+    assert path['quests'] == ['q2', 'q3']
+    assert path['required_level'] == 3
+    assert path['levels_needed'] == 2
+    assert path['next_quest'] == 'q2'
+
+def test_quest_graph_detects_cycles():
+    """Test that circular prerequisites are rejected"""
+    quests = {
+        'a': {'quest_id': 'a', 'prerequisite': 'b'},
+        'b': {'quest_id': 'b', 'prerequisite': 'a'}
+    }
+
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.build_quest_graph(quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Test Record Schema
+Tests the compiled record schemas used by the data and save file parsers
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+from custom_exceptions import (
+    CharacterNotFoundError,
+    InvalidCharacterNameError,
+    InvalidDataFormatError,
+    InvalidSaveDataError
+)
+from record_schema import Field, RecordSchema
+
+POINT_SCHEMA = RecordSchema("point", [
+    Field("X", "x", int, int),
+    Field("Y", "y", int, int),
+    Field("COLOR", "color", str.lower, choices=("red", "blue")),
+    Field("LABEL", "label", required=False)
+])
+
+# ============================================================================
+# RECORD SCHEMA TESTS
+# ============================================================================
+
+def test_parse_accepts_any_order_and_loose_keys():
+    """Test that fields parse in any order with loose key spacing and case"""
+    record = POINT_SCHEMA.parse(["COLOR: Red", "y: 2", "X: 1"])
+    assert record == {"x": 1, "y": 2, "color": "red"}
+
+def test_parse_rejects_bad_lines_keys_and_values():
+    """Test errors for lines without a separator, unknown keys and bad values"""
+    with pytest.raises(InvalidDataFormatError, match="line format"):
+        POINT_SCHEMA.parse(["X 1"])
+    with pytest.raises(InvalidDataFormatError, match="Unknown point field: Z"):
+        POINT_SCHEMA.parse(["Z: 3"])
+    with pytest.raises(InvalidDataFormatError, match="X must be an integer"):
+        POINT_SCHEMA.parse(["X: one"])
+
+def test_parse_checks_required_and_choices_unless_disabled():
+    """Test required-field and choice checks in the parsing pass"""
+    with pytest.raises(InvalidDataFormatError, match="Missing required point field: y"):
+        POINT_SCHEMA.parse(["X: 1", "COLOR: red"])
+    with pytest.raises(InvalidDataFormatError, match="Invalid point color: green"):
+        POINT_SCHEMA.parse(["X: 1", "Y: 2", "COLOR: green"])
+    assert POINT_SCHEMA.parse(["X: 1"], validate=False) == {"x": 1}
+
+def test_validate_checks_types():
+    """Test that validate() checks field types"""
+    assert POINT_SCHEMA.validate({"x": 1, "y": 2, "color": "blue"})
+    with pytest.raises(InvalidDataFormatError, match="'y' must be an integer"):
+        POINT_SCHEMA.validate({"x": 1, "y": "2", "color": "blue"})
+
+# ============================================================================
+# GAME SCHEMAS TESTS
+# ============================================================================
+
+def test_item_schema_normalizes_type_and_effect():
+    """Test item TYPE lower-casing and EFFECT parsing"""
+    item = game_data.parse_item_block([
+        "ITEM_ID: sword", "NAME: Sword", "TYPE: Weapon",
+        "EFFECT: strength:5", "COST: 10", "DESCRIPTION: Sharp"
+    ])
+    assert item["type"] == "weapon" and item["effect"] == {"strength": 5}
+    assert game_data.validate_item_data(item)
+
+def test_character_save_round_trip_and_errors(tmp_path):
+    """Test a save round trip and the numeric error message"""
+    hero = character_manager.create_character("Schema", "Mage")
+    hero["inventory"] = ["health_potion", "health_potion"]
+    character_manager.save_character(hero, str(tmp_path))
+    assert character_manager.load_character("Schema", str(tmp_path)) == hero
+
+    save_file = tmp_path / "Schema_save.txt"
+    save_file.write_text(save_file.read_text().replace("LEVEL: 1", "LEVEL: one"))
+    with pytest.raises(InvalidSaveDataError, match="Invalid numeric value"):
+        character_manager.load_character("Schema", str(tmp_path))
+
+def test_character_names_with_spaces_save_and_load(tmp_path):
+    """Test that names with spaces and hyphens work and every listed save loads"""
+    for name in ("Sir Lancelot", "Jean-Luc"):
+        hero = character_manager.create_character(name, "Warrior")
+        character_manager.save_character(hero, str(tmp_path))
+    (tmp_path / "odd..name_save.txt").write_text("NAME: odd..name\n")
+
+    names = character_manager.list_saved_characters(str(tmp_path))
+    assert sorted(names) == ["Jean-Luc", "Sir Lancelot"]
+    for name in names:
+        assert character_manager.load_character(name, str(tmp_path))["name"] == name
+
+    for name in ("../escape", "a/b", "a\\b", "nul\0"):
+        with pytest.raises(InvalidCharacterNameError):
+            character_manager.create_character(name, "Warrior")
+        with pytest.raises(CharacterNotFoundError):
+            character_manager.load_character(name, str(tmp_path))
+
+def test_character_validation_messages_match_original_wording():
+    """Test that character type errors keep their original wording"""
+    hero = character_manager.create_character("Worded", "Rogue")
+    hero["name"] = 7
+    with pytest.raises(InvalidSaveDataError, match="^Character 'name' must be a string$"):
+        character_manager.validate_character_data(hero)
+
+    hero = character_manager.create_character("Worded", "Rogue")
+    hero["gold"] = "lots"
+    with pytest.raises(InvalidSaveDataError, match="^Character field 'gold' must be an integer$"):
+        character_manager.validate_character_data(hero)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,236 @@
+"""
+Test Session Server
+Tests game sessions and the asyncio server that hosts them
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import main
+import session_server
+
+def scripted(answers):
+    """Build a read() function that returns the answers, then end of input"""
+    answers = iter(answers)
+
+    def read(prompt):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise EOFError
+    return read
+
+# ============================================================================
+# GAME SESSION TESTS
+# ============================================================================
+
+def test_session_runs_from_scripted_input(tmp_path):
+    """Test that a session plays through the menus without console I/O"""
+    catalog = game_data.load_catalog()
+    output = []
+    session = main.GameSession(catalog, str(tmp_path), output.append)
+    main.run_session_flow(session.play(), scripted(["1", "Scripted", "Warrior", "1", "6", "3"]))
+
+    text = "\n".join(output)
+    assert "Character created and saved!" in text
+    assert "Name: Scripted" in text
+    assert "Thanks for playing Quest Chronicles!" in text
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Scripted"]
+    assert session.running is False
+
+def test_sessions_are_independent(tmp_path):
+    """Test that two sessions in one process keep separate characters"""
+    catalog = game_data.load_catalog()
+    first = main.GameSession(catalog, str(tmp_path), lambda text: None)
+    second = main.GameSession(catalog, str(tmp_path), lambda text: None)
+
+    main.run_session_flow(first.new_game(), scripted(["Alpha", "Mage", "6"]))
+    main.run_session_flow(second.new_game(), scripted(["Beta", "Rogue", "6"]))
+
+    assert first.character['name'] == "Alpha"
+    assert second.character['name'] == "Beta"
+    assert first.quests is second.quests
+
+def test_session_holds_no_catalog_copy():
+    """Test that a session is a small slotted object over the shared catalog"""
+    catalog = game_data.load_catalog()
+    session = main.GameSession(catalog)
+
+    assert not hasattr(session, "__dict__")
+    assert session.items is catalog.items
+    with pytest.raises(TypeError):
+        session.quests["new_quest"] = {}
+
+def test_lazy_catalog_loads_each_table_on_first_use(tmp_path):
+    """Test that quests load at the quest menu and items at the shop"""
+    catalog = game_data.load_catalog(lazy=True)
+    session = main.GameSession(catalog, str(tmp_path), lambda text: None)
+
+    main.run_session_flow(session.new_game(), scripted(["Lazy", "Warrior", "1", "6"]))
+    assert not catalog.quests_loaded and not catalog.items_loaded
+
+    main.run_session_flow(session.quest_menu(), scripted(["2", "7"]))
+    assert catalog.quests_loaded and not catalog.items_loaded
+
+    main.run_session_flow(session.shop(), scripted(["3"]))
+    assert catalog.items_loaded
+
+
+def test_lazy_catalog_reports_bad_data_file(tmp_path):
+    """Test that a broken data file is reported when first needed"""
+    bad_file = tmp_path / "quests.txt"
+    bad_file.write_text("QUEST_ID first_quest\n")
+    catalog = game_data.load_catalog(str(bad_file), "data/items.txt", lazy=True)
+    output = []
+    session = main.GameSession(catalog, str(tmp_path), output.append)
+    session.character = character_manager.create_character("Reader", "Mage")
+
+    main.run_session_flow(session.quest_menu(), scripted(["2", "7"]))
+    assert any("Error loading game data" in text for text in output)
+    assert not catalog.quests_loaded
+
+def test_data_error_reported_once_per_session(tmp_path):
+    """Test that a broken data file is reported once, not on every lookup"""
+    bad_file = tmp_path / "quests.txt"
+    bad_file.write_text("QUEST_ID first_quest\n")
+    catalog = game_data.load_catalog(str(bad_file), "data/items.txt", lazy=True)
+    output = []
+    session = main.GameSession(catalog, str(tmp_path), output.append)
+    session.character = character_manager.create_character("Reader", "Mage")
+
+    main.run_session_flow(session.quest_menu(), scripted(["1", "2", "3", "7"]))
+    errors = [text for text in output if "Error loading game data" in text]
+    assert len(errors) == 1
+    assert session.quests == {}
+
+    other = main.GameSession(catalog, str(tmp_path), output.append)
+    assert other.quests == {}
+    assert len([text for text in output if "Error loading game data" in text]) == 2
+
+def test_shop_uses_shared_item_views(tmp_path):
+    """Test that the shop shows the listing precomputed once per catalog"""
+    catalog = game_data.load_catalog()
+    output = []
+    session = main.GameSession(catalog, str(tmp_path), output.append)
+    session.character = character_manager.create_character("Shopper", "Rogue")
+
+    main.run_session_flow(session.shop(), scripted(["3"]))
+    assert catalog.item_views.listing in output[0]
+    assert "- health_potion: Health Potion (25 gold)" in output[0]
+    assert session.item_views is main.GameSession(catalog).item_views
+
+# ============================================================================
+# SERVER TESTS
+# ============================================================================
+
+def test_server_hosts_concurrent_players(tmp_path):
+    """Test many simultaneous connections, each with its own session"""
+    catalog = game_data.load_catalog()
+
+    async def play(port, name):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"{name}\n1\n{name}\nCleric\n1\n6\n3\n".encode())
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        return data.decode()
+
+    async def scenario():
+        server = session_server.SessionServer(catalog, str(tmp_path))
+        await server.start(port=0)
+        port = server.server.sockets[0].getsockname()[1]
+        transcripts = await asyncio.gather(*(play(port, f"Player{i}") for i in range(20)))
+        await server.close()
+        return server, transcripts
+
+    server, transcripts = asyncio.run(scenario())
+
+    assert server.total_sessions == 20
+    assert server.active_sessions == 0
+    for i, transcript in enumerate(transcripts):
+        assert f"Name: Player{i}" in transcript
+        assert "Thanks for playing Quest Chronicles!" in transcript
+    for i in range(20):
+        assert character_manager.list_saved_characters(str(tmp_path / f"Player{i}")) == [f"Player{i}"]
+
+def test_server_session_ends_when_client_disconnects(tmp_path):
+    """Test that closing the connection mid-game saves and ends the session"""
+    catalog = game_data.load_catalog()
+
+    async def scenario():
+        server = session_server.SessionServer(catalog, str(tmp_path))
+        await server.start(port=0)
+        port = server.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"Tester\n1\nQuitter\nMage\n")
+        writer.write_eof()
+        data = await reader.read()
+        writer.close()
+        await server.close()
+        return server, data.decode()
+
+    server, transcript = asyncio.run(scenario())
+
+    assert "Game saved. Exiting to main menu." in transcript
+    assert server.active_sessions == 0
+    assert character_manager.list_saved_characters(str(tmp_path / "Tester")) == ["Quitter"]
+
+def test_server_scopes_saves_per_player(tmp_path):
+    """Test that player names are checked and each player sees only their saves"""
+    catalog = game_data.load_catalog()
+
+    async def scenario():
+        server = session_server.SessionServer(catalog, str(tmp_path))
+        await server.start(port=0)
+        port = server.server.sockets[0].getsockname()[1]
+
+        first_reader, first_writer = await asyncio.open_connection("127.0.0.1", port)
+        first_writer.write(b"Alice\n")
+        await first_reader.readuntil(b"Enter choice (1-3): ")
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"../x\nAlice\nBob\n1\n../../escape\nMage\n2\n1\n3\n")
+        writer.write_eof()
+        data = await reader.read()
+        writer.close()
+        first_writer.close()
+        await server.close()
+        return data.decode()
+
+    transcript = asyncio.run(scenario())
+
+    assert "Player names may only use letters, digits and underscores." in transcript
+    assert "Player Alice is already connected." in transcript
+    assert "Invalid character name" in transcript
+    assert "No saved characters found." in transcript
+    assert sorted(os.listdir(tmp_path)) == []
+
+def test_server_closes_session_on_overlong_line(tmp_path):
+    """Test that a line over the stream limit ends the session cleanly"""
+    catalog = game_data.load_catalog()
+
+    async def scenario():
+        server = session_server.SessionServer(catalog, str(tmp_path))
+        await server.start(port=0)
+        port = server.server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"x" * 70000 + b"\n")
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        await server.close()
+        return server, data.decode()
+
+    server, transcript = asyncio.run(scenario())
+
+    assert "Input line too long; closing connection." in transcript
+    assert server.active_sessions == 0 and server.players == set()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
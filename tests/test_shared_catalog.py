@@ -0,0 +1,70 @@
+"""
+Test Shared Catalog
+Tests sharing one catalog with worker processes
+"""
+
+import pytest
+import gc
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import content_generator
+import game_data
+import shared_catalog
+
+@pytest.fixture(autouse=True)
+def released():
+    """Release the shared catalog after every test"""
+    yield
+    shared_catalog.release_shared_catalog()
+
+def catalog_identity(job):
+    """Worker job: where the worker's catalog tables live and how big they are"""
+    catalog = shared_catalog.get_shared_catalog()
+    return id(catalog.quests), id(catalog.items), len(catalog.quests), job
+
+# ============================================================================
+# SHARING TESTS
+# ============================================================================
+
+def test_share_catalog_freezes_and_release_unfreezes():
+    """Test that sharing freezes the garbage collector and releasing unfreezes it"""
+    catalog = game_data.load_catalog(lazy=True)
+    shared = shared_catalog.share_catalog(catalog)
+
+    assert shared is shared_catalog.get_shared_catalog()
+    assert catalog.quests_loaded and catalog.items_loaded
+    assert gc.get_freeze_count() > 0
+
+    shared_catalog.release_shared_catalog()
+    assert shared_catalog.get_shared_catalog() is None
+    assert gc.get_freeze_count() == 0
+
+def test_pool_requires_shared_catalog():
+    """Test that a worker pool needs a shared catalog"""
+    with pytest.raises(RuntimeError):
+        shared_catalog.create_worker_pool(1)
+
+# ============================================================================
+# WORKERS TESTS
+# ============================================================================
+
+def test_workers_see_the_same_catalog():
+    """Test that every worker reads the parent catalog"""
+    quests = content_generator.generate_quests(2000, roots=5)
+    items = content_generator.generate_items(200)
+    catalog = shared_catalog.share_catalog(game_data.GameCatalog(quests, items))
+
+    results = shared_catalog.map_with_catalog(catalog_identity, range(4), max_workers=2)
+
+    assert [job for _, _, _, job in results] == [0, 1, 2, 3]
+    assert all(count == 2000 for _, _, count, _ in results)
+    if shared_catalog.can_fork():
+        # Inherited, not rebuilt: the tables are at the parent's addresses
+        assert all(quest_id == id(catalog.quests) for quest_id, _, _, _ in results)
+        assert all(item_id == id(catalog.items) for _, item_id, _, _ in results)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""
+Test Symbol Table
+Tests the id symbol table and packed characters
+"""
+
+import pytest
+from array import array
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import quest_handler
+import symbol_table
+
+# ============================================================================
+# SYMBOL TABLE TESTS
+# ============================================================================
+
+def test_symbols_are_stable_and_round_trip():
+    """Test that symbols are stable and map back to their ids"""
+    table = symbol_table.SymbolTable(["first_quest", "iron_sword"])
+    assert table.intern("first_quest") == 0
+    assert table.intern("health_potion") == 2
+    assert table.get_symbol("unknown") is None
+    assert "iron_sword" in table and len(table) == 3
+
+    packed = table.encode(["iron_sword", "health_potion", "iron_sword"])
+    assert isinstance(packed, array) and list(packed) == [1, 2, 1]
+    assert table.decode(packed) == ["iron_sword", "health_potion", "iron_sword"]
+
+def test_register_catalog_interns_every_id():
+    """Test that registering a catalog interns every id"""
+    table = symbol_table.register_catalog({"q1": {}, "q2": {}}, {"sword": {}}, symbol_table.SymbolTable())
+    assert [table.get_name(symbol) for symbol in range(len(table))] == ["q1", "q2", "sword"]
+
+# ============================================================================
+# PACKED CHARACTERS TESTS
+# ============================================================================
+
+def make_character():
+    """Build a character with inventory and quest lists to pack"""
+    character = character_manager.create_character("Packed", "Rogue")
+    character["inventory"] = ["health_potion", "iron_sword", "health_potion"]
+    character["active_quests"] = ["second_quest"]
+    character["completed_quests"] = ["first_quest"]
+    return character
+
+def test_pack_and_unpack_character():
+    """Test packing and unpacking a character"""
+    table = symbol_table.SymbolTable()
+    character = make_character()
+    symbol_table.pack_character(character, table)
+
+    assert symbol_table.is_packed(character)
+    assert character["inventory"][0] == character["inventory"][2]
+    symbol_table.unpack_character(character, table)
+    assert character == make_character()
+
+def test_packed_character_saves_like_unpacked(tmp_path):
+    """Test that a packed character saves like an unpacked one"""
+    plain = make_character()
+    character_manager.save_character(plain, str(tmp_path / "plain"))
+    packed = symbol_table.pack_character(make_character())
+    character_manager.save_character(packed, str(tmp_path / "packed"))
+
+    with open(tmp_path / "plain" / "Packed_save.txt") as f:
+        expected = f.read()
+    with open(tmp_path / "packed" / "Packed_save.txt") as f:
+        assert f.read() == expected
+
+    loaded = character_manager.load_character("Packed", str(tmp_path / "packed"))
+    assert loaded["inventory"] == plain["inventory"]
+    # Loaded ids are interned, so repeated ids share one string object
+    assert loaded["inventory"][0] is loaded["inventory"][2]
+
+def test_display_functions_accept_packed_characters():
+    """Test that the display functions accept packed characters"""
+    items = {"health_potion": {"name": "Health Potion", "type": "consumable"},
+             "iron_sword": {"name": "Iron Sword", "type": "weapon"}}
+    quests = {"first_quest": {"reward_xp": 10, "reward_gold": 5},
+              "second_quest": {"reward_xp": 20, "reward_gold": 0}}
+    packed = symbol_table.pack_character(make_character())
+
+    assert inventory_system.format_inventory(packed, items) == \
+        inventory_system.format_inventory(make_character(), items)
+    assert quest_handler.format_character_quest_progress(packed, quests) == \
+        quest_handler.format_character_quest_progress(make_character(), quests)
+    assert symbol_table.is_packed(packed)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
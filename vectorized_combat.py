@@ -0,0 +1,255 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Vectorized Combat Module
+
+This module resolves thousands of battles at once with NumPy. Every battle
+is one slot in a set of stat arrays, each round is a handful of array
+operations over the battles still running, and finished battles are masked
+out. The rules are the same as combat_system.BattleEngine, so results match
+the scalar engine exactly for the same random draws.
+
+NumPy is optional for the rest of the game; it is only needed here.
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from custom_exceptions import CharacterDeadError
+
+# Winner codes in the resolved 'winner' array
+WINNER_NONE = 0
+WINNER_PLAYER = 1
+WINNER_ENEMY = 2
+
+# Class codes used for special abilities
+CLASS_CODES = {"Warrior": 1, "Mage": 2, "Rogue": 3, "Cleric": 4}
+
+# Policies the vectorized resolver supports
+VECTOR_POLICIES = ("attack", "special_first")
+
+# ============================================================================
+# BATTLE ARRAYS
+# ============================================================================
+
+def build_battle_arrays(characters, enemies):
+    """
+    Pack paired characters and enemies into stat arrays
+
+    Args:
+        characters: List of character dictionaries
+        enemies: List of enemy dictionaries (same length)
+
+    Returns: Dictionary of NumPy arrays, one slot per battle
+    Raises:
+        ImportError if NumPy is not installed
+        ValueError if the lists have different lengths
+    """
+    _require_numpy()
+    if len(characters) != len(enemies):
+        raise ValueError("Need exactly one enemy per character")
+
+    return {
+        "health": np.array([c.get("health", 0) for c in characters], dtype=np.int64),
+        "max_health": np.array([c.get("max_health", 0) for c in characters], dtype=np.int64),
+        "strength": np.array([c.get("strength", 0) for c in characters], dtype=np.int64),
+        "magic": np.array([c.get("magic", 0) for c in characters], dtype=np.int64),
+        "class_code": np.array([CLASS_CODES.get(c.get("class"), 0) for c in characters],
+                               dtype=np.int8),
+        "enemy_health": np.array([e.get("health", 0) for e in enemies], dtype=np.int64),
+        "enemy_strength": np.array([e.get("strength", 0) for e in enemies], dtype=np.int64)
+    }
+
+# ============================================================================
+# RESOLUTION
+# ============================================================================
+
+def resolve_battles(characters, enemies, policy="attack", crit_draws=None, rng=None):
+    """
+    Fight every character/enemy pair to the end at once
+
+    Args:
+        characters: List of character dictionaries (not modified)
+        enemies: List of enemy dictionaries (not modified)
+        policy: 'attack' or 'special_first'
+        crit_draws: Optional sequence with one uniform draw per battle,
+                    used by the Rogue critical strike
+        rng: Generator used when crit_draws is not given (defaults to the
+             random module). One draw is taken per battle that needs one,
+             in battle order, which is exactly what running the battles one
+             after another through BattleEngine would consume.
+
+    Returns: Dictionary of NumPy arrays:
+            - winner: WINNER_PLAYER or WINNER_ENEMY per battle
+            - turns: rounds fought
+            - health: character health at the end
+            - enemy_health: enemy health at the end
+    Raises:
+        ImportError if NumPy is not installed
+        ValueError if the policy is not supported
+        CharacterDeadError if any character starts dead
+    """
+    if policy not in VECTOR_POLICIES:
+        raise ValueError(f"Unsupported vectorized policy: {policy}")
+
+    arrays = build_battle_arrays(characters, enemies)
+    health = arrays["health"]
+    enemy_health = arrays["enemy_health"]
+    strength = arrays["strength"]
+    enemy_strength = arrays["enemy_strength"]
+
+    if (health <= 0).any():
+        raise CharacterDeadError("Character is already dead and cannot fight.")
+
+    count = len(health)
+    active = np.ones(count, dtype=bool)
+    turns = np.zeros(count, dtype=np.int64)
+    winner = np.zeros(count, dtype=np.int8)
+
+    # Damage per basic attack never changes during a battle
+    player_damage = np.maximum(strength - enemy_strength // 4, 1)
+    enemy_damage = np.maximum(enemy_strength - strength // 4, 1)
+
+    turn = 0
+    while active.any():
+        turn += 1
+        live = np.flatnonzero(active)
+        turns[live] = turn
+
+        if policy == "special_first" and turn == 1:
+            _apply_specials(arrays, live, crit_draws, rng)
+        else:
+            enemy_health[live] = np.maximum(enemy_health[live] - player_damage[live], 0)
+
+        won = live[enemy_health[live] <= 0]
+        winner[won] = WINNER_PLAYER
+        active[won] = False
+
+        live = live[enemy_health[live] > 0]
+        health[live] = np.maximum(health[live] - enemy_damage[live], 0)
+
+        lost = live[health[live] <= 0]
+        winner[lost] = WINNER_ENEMY
+        active[lost] = False
+
+    return {
+        "winner": winner,
+        "turns": turns,
+        "health": health,
+        "enemy_health": enemy_health
+    }
+
+def predict_battles_array(characters, enemies):
+    """
+    Closed-form outcome of many basic-attack-only battles
+
+    Array version of combat_system.predict_battle: no turn loop at all.
+
+    Returns: Dictionary of NumPy arrays in the same layout as resolve_battles
+    Raises: ImportError if NumPy is not installed
+    """
+    arrays = build_battle_arrays(characters, enemies)
+    health = arrays["health"]
+    enemy_health = arrays["enemy_health"]
+    strength = arrays["strength"]
+    enemy_strength = arrays["enemy_strength"]
+
+    player_damage = np.maximum(strength - enemy_strength // 4, 1)
+    enemy_damage = np.maximum(enemy_strength - strength // 4, 1)
+    player_hits = np.maximum(-(-enemy_health // player_damage), 1)
+    enemy_hits = -(-health // enemy_damage)
+
+    player_wins = player_hits <= enemy_hits
+    return {
+        "winner": np.where(player_wins, WINNER_PLAYER, WINNER_ENEMY).astype(np.int8),
+        "turns": np.where(player_wins, player_hits, enemy_hits),
+        "health": np.where(player_wins, health - (player_hits - 1) * enemy_damage, 0),
+        "enemy_health": np.where(player_wins, 0, enemy_health - enemy_hits * player_damage)
+    }
+
+def summarize_resolved(resolved):
+    """
+    Aggregate resolved battle arrays
+
+    Returns: Dictionary with battles, win_rate, avg_turns, avg_hp_remaining
+    """
+    battles = len(resolved["winner"])
+    if battles == 0:
+        return {"battles": 0, "win_rate": 0.0, "avg_turns": 0.0, "avg_hp_remaining": 0.0}
+    return {
+        "battles": battles,
+        "win_rate": float((resolved["winner"] == WINNER_PLAYER).mean()),
+        "avg_turns": float(resolved["turns"].mean()),
+        "avg_hp_remaining": float(resolved["health"].mean())
+    }
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _require_numpy():
+    """Raise a clear error when NumPy is missing"""
+    if np is None:
+        raise ImportError("vectorized_combat requires NumPy (pip install numpy)")
+
+def _apply_specials(arrays, live, crit_draws, rng):
+    """
+    Resolve the first-turn special ability for the given battles
+
+    Every battle starts with its special ready (cooldowns only last for
+    one battle), so no battle falls back to a basic attack on turn 1.
+    """
+    health = arrays["health"]
+    max_health = arrays["max_health"]
+    strength = arrays["strength"]
+    magic = arrays["magic"]
+    enemy_health = arrays["enemy_health"]
+    special = live
+    codes = arrays["class_code"][live]
+    damage = np.zeros(len(special), dtype=np.int64)
+
+    warrior = codes == CLASS_CODES["Warrior"]
+    damage[warrior] = strength[special[warrior]] * 2
+
+    mage = codes == CLASS_CODES["Mage"]
+    damage[mage] = magic[special[mage]] * 2
+
+    rogue = codes == CLASS_CODES["Rogue"]
+    rogue_battles = special[rogue]
+    draws = _crit_draws_for(rogue_battles, crit_draws, rng)
+    rogue_strength = strength[rogue_battles]
+    damage[rogue] = np.where(draws < 0.5, rogue_strength * 3, rogue_strength)
+
+    hits = warrior | mage | rogue
+    damage = np.where(hits & (damage <= 0), 1, damage)
+    hit_battles = special[hits]
+    enemy_health[hit_battles] = np.maximum(enemy_health[hit_battles] - damage[hits], 0)
+
+    cleric = special[codes == CLASS_CODES["Cleric"]]
+    missing = max_health[cleric] - health[cleric]
+    health[cleric] += np.where(30 <= missing, 30, missing)
+
+def _crit_draws_for(battles, crit_draws, rng):
+    """Get one uniform draw per Rogue battle, in battle order"""
+    if crit_draws is not None:
+        return np.asarray(crit_draws, dtype=np.float64)[battles]
+    if rng is None:
+        rng = random
+    return np.array([rng.random() for _ in range(len(battles))], dtype=np.float64)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== VECTORIZED COMBAT TEST ===")
+
+    # import battle_simulator, combat_system
+    # hero = battle_simulator.build_character_for_level("Rogue", 3)
+    # resolved = resolve_battles([hero] * 100000,
+    #                            [combat_system.create_enemy("orc")] * 100000,
+    #                            policy="special_first", rng=random.Random(1))
+    # print(summarize_resolved(resolved))